@@ -0,0 +1,56 @@
+"""Measures parsing many small ontology documents one parser at a time
+compared to parse_many() in a single process and in a pool of worker
+processes.
+
+Run with: python -m benchmarks.batch
+"""
+import os
+import shutil
+import tempfile
+import time
+
+from benchmarks.ontologies import abox_document, write_document
+from morelianoctua.parsing.fastfunctional import FastFunctionalSyntaxParser
+
+num_documents = 5000
+
+
+def _parse_separately(paths):
+    for path in paths:
+        FastFunctionalSyntaxParser().parse_file(path)
+
+
+def _parse_many(paths, workers=None):
+    for _ in FastFunctionalSyntaxParser().parse_many(paths, workers):
+        pass
+
+
+def main():
+    tmp_dir = tempfile.mkdtemp()
+
+    try:
+        paths = []
+        for i in range(num_documents):
+            path = os.path.join(tmp_dir, f'{i}.ofn')
+            write_document(abox_document(10, 10), path)
+            paths.append(path)
+
+        workers = max(2, os.cpu_count())
+
+        for label, fn in [
+                ('separate parsers', lambda: _parse_separately(paths)),
+                ('parse_many', lambda: _parse_many(paths)),
+                (f'parse_many, {workers} workers',
+                 lambda: _parse_many(paths, workers))]:
+            start = time.perf_counter()
+            fn()
+            duration = time.perf_counter() - start
+
+            print(f'{label:<24} {duration:>8.3f} s '
+                  f'{num_documents / duration:>8.0f} documents/s')
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    main()
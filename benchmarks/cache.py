@@ -0,0 +1,53 @@
+"""Compares parsing a document with loading the snapshot of the parsed
+ontology from a cache directory and with just reading the document.
+
+Run with: python -m benchmarks.cache
+"""
+import os
+import shutil
+import tempfile
+import time
+
+from benchmarks.ontologies import abox_document, write_document
+from morelianoctua.parsing.fastfunctional import FastFunctionalSyntaxParser
+
+
+def _duration(fn):
+    start = time.perf_counter()
+    fn()
+
+    return time.perf_counter() - start
+
+
+def _read(file_path):
+    with open(file_path, 'rb') as document_file:
+        document_file.read()
+
+
+def main():
+    fd, file_path = tempfile.mkstemp(suffix='.ofn')
+    os.close(fd)
+    cache_dir = tempfile.mkdtemp()
+    parser = FastFunctionalSyntaxParser()
+
+    try:
+        write_document(abox_document(100000, 10000), file_path)
+
+        benchmarks = [
+            ('read', lambda: _read(file_path)),
+            ('parse', lambda: parser.parse_file(file_path)),
+            ('parse + store', lambda: parser.parse_file(
+                file_path, cache_dir=cache_dir)),
+            ('load snapshot', lambda: parser.parse_file(
+                file_path, cache_dir=cache_dir)),
+        ]
+
+        for name, fn in benchmarks:
+            print(f'{name:<14} {_duration(fn):>8.3f} s')
+    finally:
+        os.remove(file_path)
+        shutil.rmtree(cache_dir)
+
+
+if __name__ == '__main__':
+    main()
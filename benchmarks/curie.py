@@ -0,0 +1,71 @@
+"""Micro-benchmarks of the expansion of abbreviated IRIs (CURIEs) like
+ex:Cls1.
+
+Compares the former implementation of the parse action, which split the
+CURIE at every colon, with ParseContext.expand_curie() without any cached
+IRIs (only the prefix table is used) and with all IRIs cached.
+
+Run with: python -m benchmarks.curie
+"""
+import timeit
+
+from rdflib import URIRef
+
+from morelianoctua.model import OWLOntology
+from morelianoctua.parsing.functional import ParseContext
+
+prefixes = {
+    OWLOntology.default_prefix_dummy: URIRef('http://example.com/ont#'),
+    'ex': URIRef('http://example.com/ont#'),
+    'xsd': URIRef('http://www.w3.org/2001/XMLSchema#'),
+}
+
+curies = [f'ex:indiv{i}' for i in range(1000)] + \
+    [f':Cls{i}' for i in range(100)] + \
+    ['xsd:int', 'xsd:string']
+
+
+def _split_full_iri(curie) -> URIRef:
+    # the implementation replaced by ParseContext.expand_curie()
+    parts = curie.split(':')
+    parts = [p for p in parts if not p == '']
+
+    if len(parts) == 1:
+        uri_part1 = prefixes[OWLOntology.default_prefix_dummy]
+        uri_part2 = parts[0]
+    else:
+        uri_part1 = prefixes[parts[0]]
+        uri_part2 = parts[1]
+
+    return URIRef(uri_part1 + uri_part2)
+
+
+def _expand_uncached(context):
+    for curie in curies:
+        context.iris.clear()
+        context.expand_curie(curie)
+
+
+def _expand_cached(context):
+    for curie in curies:
+        context.expand_curie(curie)
+
+
+def main():
+    context = ParseContext(dict(prefixes))
+    _expand_cached(context)
+
+    benchmarks = [
+        ('split at every colon', lambda: [_split_full_iri(c) for c in curies]),
+        ('prefix table', lambda: _expand_uncached(context)),
+        ('prefix table + memo', lambda: _expand_cached(context)),
+    ]
+
+    for name, fn in benchmarks:
+        duration = min(timeit.repeat(fn, number=20, repeat=5)) / 20
+
+        print(f'{name:<22} {duration / len(curies) * 1e9:>8.0f} ns/CURIE')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Counts the class expression objects of a parsed TBox and the memory it
+holds with and without hash-consing them in an OWLDataFactory.
+
+The TBox uses 1000 different super class expressions in 20000 axioms.
+Without hash-consing every occurrence of a class expression is an object of
+its own, with it the occurrences share one object.
+
+Run with: python -m benchmarks.datafactory
+"""
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.ontologies import tbox_document, write_document
+from morelianoctua.model.datafactory import OWLDataFactory
+from morelianoctua.model.objects import HasIRI, OWLObject
+from morelianoctua.parsing.fastfunctional import FastFunctionalSyntaxParser
+
+
+class _NoHashConsing(OWLDataFactory):
+    def intern(self, obj):
+        return obj
+
+
+def _count_class_expressions(ontology) -> int:
+    seen = set()
+    pending = [axiom.super_class for axiom in ontology.axioms]
+
+    while pending:
+        obj = pending.pop()
+
+        if id(obj) in seen or isinstance(obj, HasIRI):
+            continue
+
+        seen.add(id(obj))
+
+        for value in obj.__getstate__().values():
+            if isinstance(value, OWLObject):
+                pending.append(value)
+            elif isinstance(value, frozenset):
+                pending.extend(value)
+
+    return len(seen)
+
+
+def main():
+    fd, file_path = tempfile.mkstemp(suffix='.ofn')
+    os.close(fd)
+
+    try:
+        write_document(tbox_document(20000, num_super_classes=1000), file_path)
+
+        for label, data_factory in [
+                ('not hash-consed', _NoHashConsing()),
+                ('hash-consed', OWLDataFactory())]:
+            parser = FastFunctionalSyntaxParser(data_factory=data_factory)
+
+            start = time.perf_counter()
+            parser.parse_file(file_path)
+            duration = time.perf_counter() - start
+
+            gc.collect()
+            tracemalloc.start()
+            ontology = parser.parse_file(file_path)
+            gc.collect()
+            retained, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(f'{label:<16} '
+                  f'{_count_class_expressions(ontology):>8} objects '
+                  f'{retained / (1 << 20):>8.1f} MiB '
+                  f'{duration:>8.3f} s')
+
+            del ontology
+    finally:
+        os.remove(file_path)
+
+
+if __name__ == '__main__':
+    main()
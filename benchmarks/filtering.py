@@ -0,0 +1,72 @@
+"""Compares parsing all axioms of a mixed TBox/ABox document with parsing
+only the assertions or only the TBox.
+
+Run with: python -m benchmarks.filtering
+"""
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.ontologies import abox_document, tbox_document, \
+    write_document
+from morelianoctua.model.axioms.assertionaxiom import \
+    OWLClassAssertionAxiom, OWLObjectPropertyAssertionAxiom, \
+    OWLDataPropertyAssertionAxiom
+from morelianoctua.model.axioms.classaxiom import OWLClassAxiom
+from morelianoctua.parsing.fastfunctional import FastFunctionalSyntaxParser
+
+
+def _document(num_assertions, num_sub_class_axioms):
+    tbox_axioms = tbox_document(num_sub_class_axioms).partition(
+        'Ontology(<http://example.com/ont>\n')[2]
+
+    return abox_document(num_assertions, num_assertions).replace(
+        'Ontology(<http://example.com/ont>\n',
+        'Ontology(<http://example.com/ont>\n' + tbox_axioms[:-2])
+
+
+def _measure(parser, file_path, **kwargs):
+    gc.collect()
+    start = time.perf_counter()
+    parser.parse_file(file_path, **kwargs)
+    duration = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    ontology = parser.parse_file(file_path, **kwargs)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return duration, retained, len(ontology.axioms)
+
+
+def main():
+    fd, file_path = tempfile.mkstemp(suffix='.ofn')
+    os.close(fd)
+    parser = FastFunctionalSyntaxParser()
+
+    try:
+        write_document(_document(50000, 10000), file_path)
+
+        configurations = [
+            ('all axioms', {}),
+            ('assertions', {'include': [
+                OWLClassAssertionAxiom, OWLObjectPropertyAssertionAxiom,
+                OWLDataPropertyAssertionAxiom]}),
+            ('TBox', {'include': [OWLClassAxiom]}),
+        ]
+
+        for name, kwargs in configurations:
+            duration, retained, num_axioms = _measure(
+                parser, file_path, **kwargs)
+
+            print(f'{name:<11} {num_axioms:>7} axioms {duration:>7.3f} s '
+                  f'{retained / (1 << 20):>8.1f} MiB')
+    finally:
+        os.remove(file_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Measures loading a modular ontology, i.e. a root document importing
+modules of different sizes, with and without a pool of worker processes,
+compared to parsing only its largest module.
+
+Run with: python -m benchmarks.imports
+"""
+import os
+import shutil
+import tempfile
+import time
+
+from benchmarks.ontologies import abox_document, write_document
+from morelianoctua.parsing.fastfunctional import FastFunctionalSyntaxParser
+from morelianoctua.parsing.manager import OWLOntologyManager
+
+module_sizes = [100000, 50000, 50000, 20000, 20000, 10000, 10000, 10000]
+
+
+def _module_document(i, num_axioms):
+    document = abox_document(num_axioms)
+
+    return document.replace(
+        'Ontology(<http://example.com/ont>',
+        f'Ontology(<http://example.com/module{i}>', 1)
+
+
+def _root_document():
+    imports = ''.join(
+        f'Import(<http://example.com/module{i}>)\n'
+        for i in range(len(module_sizes)))
+
+    return f'Ontology(<http://example.com/root>\n{imports})\n'
+
+
+def main():
+    tmp_dir = tempfile.mkdtemp()
+
+    try:
+        catalog = {}
+        for i, num_axioms in enumerate(module_sizes):
+            file_path = os.path.join(tmp_dir, f'module{i}.ofn')
+            write_document(_module_document(i, num_axioms), file_path)
+            catalog[f'http://example.com/module{i}'] = file_path
+
+        root_path = os.path.join(tmp_dir, 'root.ofn')
+        write_document(_root_document(), root_path)
+
+        start = time.perf_counter()
+        FastFunctionalSyntaxParser().parse_file(catalog[
+            'http://example.com/module0'])
+        print(f'{"largest module":<22} {time.perf_counter() - start:>8.3f} s')
+
+        for workers in [None, os.cpu_count()]:
+            manager = OWLOntologyManager(
+                catalog, parser_cls=FastFunctionalSyntaxParser,
+                workers=workers)
+
+            start = time.perf_counter()
+            manager.load_ontology(root_path)
+            duration = time.perf_counter() - start
+
+            label = f'closure, {workers or 1} worker(s)'
+            print(f'{label:<22} {duration:>8.3f} s')
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Compares parsing an edited ABox document from scratch with re-parsing it
+incrementally from the previous parse.
+
+Run with: python -m benchmarks.incremental
+"""
+import os
+import tempfile
+import time
+
+from benchmarks.ontologies import abox_document, write_document
+from morelianoctua.parsing.fastfunctional import FastFunctionalSyntaxParser
+
+
+def main():
+    fd, file_path = tempfile.mkstemp(suffix='.ofn')
+    os.close(fd)
+
+    try:
+        document = abox_document(300000, 10000)
+        write_document(document, file_path)
+        parser = FastFunctionalSyntaxParser()
+
+        start = time.perf_counter()
+        parsed = parser.parse_document(file_path)
+        print(f'{"parse_document":<20} '
+              f'{time.perf_counter() - start:>8.3f} s')
+
+        # edit ten axioms spread over the document
+        lines = document.splitlines(True)
+        for i in range(1000, len(lines), len(lines) // 10):
+            lines[i] = lines[i].replace('ex:indiv', 'ex:edited', 1)
+
+        write_document(''.join(lines), file_path)
+
+        start = time.perf_counter()
+        parser.parse_file(file_path)
+        print(f'{"parse_file":<20} {time.perf_counter() - start:>8.3f} s')
+
+        start = time.perf_counter()
+        _, diff = parser.reparse_document(parsed, file_path)
+        print(f'{"reparse_document":<20} '
+              f'{time.perf_counter() - start:>8.3f} s '
+              f'(+{len(diff.added)} -{len(diff.removed)} axioms)')
+    finally:
+        os.remove(file_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Compares loading the axioms which mention one individual from a large
+ABox document by parsing the whole document and by seeking to the offsets
+stored in its sidecar index.
+
+Run with: python -m benchmarks.index
+"""
+import os
+import tempfile
+import time
+
+from rdflib import URIRef
+
+from benchmarks.ontologies import abox_document, write_document
+from morelianoctua.model.objects.individual import OWLNamedIndividual
+from morelianoctua.parsing.fastfunctional import FastFunctionalSyntaxParser
+from morelianoctua.parsing.index import default_index_path, load_index
+
+individual = URIRef('http://example.com/ont#indiv42')
+
+# the attributes of the assertion axioms holding individuals
+_individual_attributes = \
+    ['individual', 'subject_individual', 'object_individual']
+
+
+def _mentions(axiom, iri):
+    return any(
+        isinstance(value, OWLNamedIndividual) and value.iri == iri
+        for value in (
+            getattr(axiom, name, None)
+            for name in _individual_attributes))
+
+
+def main():
+    fd, file_path = tempfile.mkstemp(suffix='.ofn')
+    os.close(fd)
+    index_path = default_index_path(file_path)
+
+    try:
+        write_document(abox_document(300000, 10000), file_path)
+        parser = FastFunctionalSyntaxParser()
+
+        start = time.perf_counter()
+        parser.index_file(file_path)
+        print(f'{"building the index":<28} '
+              f'{time.perf_counter() - start:>8.3f} s')
+
+        start = time.perf_counter()
+        axioms = [axiom for axiom in parser.parse_file(file_path).axioms
+                  if _mentions(axiom, individual)]
+        print(f'{"full parse + filter":<28} '
+              f'{time.perf_counter() - start:>8.3f} s '
+              f'({len(axioms)} axioms)')
+
+        start = time.perf_counter()
+        index = load_index(index_path, file_path)
+        axioms = set(parser.load_axioms_at(
+            file_path, index.offsets_of(individual)))
+        print(f'{"index + load_axioms_at":<28} '
+              f'{time.perf_counter() - start:>8.3f} s '
+              f'({len(axioms)} axioms)')
+    finally:
+        os.remove(file_path)
+
+        if os.path.exists(index_path):
+            os.remove(index_path)
+
+
+if __name__ == '__main__':
+    main()
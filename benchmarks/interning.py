@@ -0,0 +1,60 @@
+"""Measures the memory held by a parsed ABox with and without interning of
+the entities.
+
+Without interning every occurrence of an individual, class or property in
+the document gets its own object (and IRI).
+
+Run with: python -m benchmarks.interning
+"""
+import gc
+import os
+import tempfile
+import tracemalloc
+
+from benchmarks.ontologies import abox_document, write_document
+from morelianoctua.parsing.fastfunctional import FastFunctionalSyntaxParser
+from morelianoctua.parsing.functional import FunctionalSyntaxParser
+
+
+def _no_interning(entity_cls, iri):
+    return entity_cls(iri)
+
+
+def _retained_memory(parser, file_path):
+    gc.collect()
+    tracemalloc.start()
+    ontology = parser.parse_file(file_path)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return retained, len(ontology.axioms)
+
+
+def main():
+    configurations = [
+        (FunctionalSyntaxParser, abox_document(10000)),
+        (FastFunctionalSyntaxParser, abox_document(100000, 10000)),
+    ]
+
+    for parser_cls, document in configurations:
+        fd, file_path = tempfile.mkstemp(suffix='.ofn')
+        os.close(fd)
+
+        try:
+            write_document(document, file_path)
+            print(f'{parser_cls.__name__}:')
+
+            for label, entity_factory in [
+                    ('not interned', _no_interning), ('interned', None)]:
+                retained, num_axioms = _retained_memory(
+                    parser_cls(entity_factory=entity_factory), file_path)
+
+                print(f'  {label:<13} {retained / (1 << 20):>8.1f} MiB '
+                      f'{retained / num_axioms:>8.0f} bytes/axiom')
+        finally:
+            os.remove(file_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""Micro-benchmarks of the lexing of full IRIs and quoted strings in the
+pyparsing grammar, and the parse times of IRI heavy and literal heavy
+documents.
+
+Compares the former elements, which matched IRIs and quoted strings as
+sequences of small tokens joined again by a parse action, with the single
+regular expression tokens of FunctionalSyntaxGrammar.
+
+Run with: python -m benchmarks.lexing
+"""
+import os
+import tempfile
+import time
+import timeit
+
+from pyparsing import Literal, OneOrMore, Word, ZeroOrMore, alphanums
+from rdflib import URIRef
+
+from benchmarks.ontologies import prefixes, write_document
+from morelianoctua.parsing.functional import FunctionalSyntaxGrammar, \
+    FunctionalSyntaxParser, ParseContext
+
+iris = [f'<http://example.com/ont/{i % 10}/entity_{i}#part-{i}>'
+        for i in range(1000)]
+quoted_strings = [f'"a label of entity {i}, with some more words in it"'
+                  for i in range(1000)]
+
+
+def _former_full_iri():
+    # the element replaced by the full_iri token
+    return (
+        Literal('<').suppress() +
+        OneOrMore(
+            Word(alphanums) | Literal(':') | Literal('-') | Literal('/') |
+            Literal('.') | Literal('#') | Literal('?') | Literal('_') |
+            Literal('%')) +
+        Literal('>').suppress())\
+        .addParseAction(lambda parsed: URIRef(''.join(parsed)))
+
+
+def _former_quoted_string():
+    # the element replaced by the quoted_string token
+    return (
+        Literal('"').suppress() +
+        ZeroOrMore(Word(alphanums + "'-_.:,;*+?`´=)(&%$§!<>|")) +
+        Literal('"').suppress()
+    ).addParseAction(lambda parsed: ' '.join(parsed))
+
+
+def iri_document(num_axioms):
+    """Object property assertions with full IRIs only"""
+    lines = [prefixes, 'Ontology(<http://example.com/ont>\n']
+
+    for i in range(num_axioms):
+        lines.append(
+            f'ObjectPropertyAssertion(<http://example.com/ont#objProp{i % 20}>'
+            f' <http://example.com/data/{i % 100}/indiv{i}>'
+            f' <http://example.com/data/{i % 100}/indiv{i + 1}>)\n')
+
+    lines.append(')\n')
+
+    return ''.join(lines)
+
+
+def string_document(num_axioms):
+    """Data property assertions with long string literals"""
+    lines = [prefixes, 'Ontology(<http://example.com/ont>\n']
+
+    for i in range(num_axioms):
+        lines.append(
+            f'DataPropertyAssertion(ex:label ex:indiv{i % 1000} '
+            f'"The entity number {i} of the example ontology, which is '
+            f'described by this rather long label"@en)\n')
+
+    lines.append(')\n')
+
+    return ''.join(lines)
+
+
+def _time_tokens(grammar, element, tokens):
+    def parse_all():
+        # a new context per run, so that no IRI is served from its cache
+        with grammar.parsing(ParseContext({})):
+            for token in tokens:
+                element.parseString(token)
+
+    duration = min(timeit.repeat(parse_all, number=5, repeat=5)) / 5
+
+    return duration / len(tokens)
+
+
+def main():
+    grammar = FunctionalSyntaxGrammar()
+
+    benchmarks = [
+        ('full IRI', iris, _former_full_iri(), grammar.full_iri),
+        ('quoted string', quoted_strings, _former_quoted_string(),
+         grammar.quoted_string),
+    ]
+
+    for name, tokens, former, current in benchmarks:
+        former_time = _time_tokens(grammar, former, tokens)
+        current_time = _time_tokens(grammar, current, tokens)
+
+        print(f'{name:<14} former {former_time * 1e6:>6.1f} us/token  '
+              f'regex {current_time * 1e6:>6.1f} us/token  '
+              f'({former_time / current_time:.1f}x)')
+
+    for name, document in [('IRI heavy', iri_document(20000)),
+                           ('literal heavy', string_document(20000))]:
+        fd, file_path = tempfile.mkstemp(suffix='.ofn')
+        os.close(fd)
+
+        try:
+            write_document(document, file_path)
+
+            start = time.perf_counter()
+            FunctionalSyntaxParser().parse_file(file_path)
+            duration = time.perf_counter() - start
+
+            print(f'{name:<14} {duration:>8.3f} s')
+        finally:
+            os.remove(file_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Compares parsing a data heavy ABox with eagerly converted and with lazy
+literals.
+
+Run with: python -m benchmarks.literals
+"""
+import os
+import tempfile
+import time
+
+from benchmarks.ontologies import prefixes, write_document
+from morelianoctua.parsing.fastfunctional import FastFunctionalSyntaxParser
+
+_values = [
+    '"{i}"^^xsd:int',
+    '"{i}.5"^^xsd:double',
+    '"2020-01-{day:02}"^^xsd:date',
+    '"label {i}"@en',
+]
+
+
+def data_document(num_axioms):
+    lines = [prefixes, 'Ontology(<http://example.com/ont>\n']
+
+    for i in range(num_axioms):
+        value = _values[i % len(_values)].format(i=i, day=i % 28 + 1)
+        lines.append(
+            f'DataPropertyAssertion(ex:dataProp{i % 20} ex:indiv{i} '
+            f'{value})\n')
+
+    lines.append(')\n')
+
+    return ''.join(lines)
+
+
+def main():
+    fd, file_path = tempfile.mkstemp(suffix='.ofn')
+    os.close(fd)
+
+    try:
+        write_document(data_document(100000), file_path)
+
+        for lazy_literals in [False, True]:
+            parser = FastFunctionalSyntaxParser(lazy_literals=lazy_literals)
+
+            start = time.perf_counter()
+            parser.parse_file(file_path)
+            duration = time.perf_counter() - start
+
+            label = 'lazy' if lazy_literals else 'eager'
+            print(f'{label:<6} {duration:>8.3f} s')
+    finally:
+        os.remove(file_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+"""Reports the memory used by the objects of the model, i.e. the bytes per
+entity and the bytes per axiom of each axiom type.
+
+Entities are shared by the axioms like in a parsed ontology, so the bytes
+per axiom count the axiom object and its anonymous class expressions and
+collections, but not its entities or literals.
+
+Run with: python -m benchmarks.memory
+"""
+import gc
+import tracemalloc
+
+from rdflib import Literal, URIRef, XSD
+
+from morelianoctua.model.axioms.assertionaxiom import \
+    OWLClassAssertionAxiom, OWLObjectPropertyAssertionAxiom, \
+    OWLDataPropertyAssertionAxiom
+from morelianoctua.model.axioms.classaxiom import OWLSubClassOfAxiom, \
+    OWLEquivalentClassesAxiom, OWLDisjointClassesAxiom, \
+    OWLDisjointUnionAxiom
+from morelianoctua.model.axioms.declarationaxiom import \
+    OWLClassDeclarationAxiom, OWLDatatypeDeclarationAxiom, \
+    OWLObjectPropertyDeclarationAxiom, OWLDataPropertyDeclarationAxiom, \
+    OWLAnnotationPropertyDeclarationAxiom, OWLNamedIndividualDeclarationAxiom
+from morelianoctua.model.axioms.owldatapropertyaxiom import \
+    OWLDataPropertyDomainAxiom, OWLDataPropertyRangeAxiom
+from morelianoctua.model.axioms.owlobjectpropertyaxiom import \
+    OWLSubObjectPropertyOfAxiom, OWLEquivalentObjectPropertiesAxiom, \
+    OWLDisjointObjectPropertiesAxiom, OWLInverseObjectPropertiesAxiom, \
+    OWLObjectPropertyDomainAxiom, OWLObjectPropertyRangeAxiom
+from morelianoctua.model.objects.classexpression import OWLClass, \
+    OWLObjectSomeValuesFrom
+from morelianoctua.model.objects.datarange import OWLDatatype
+from morelianoctua.model.objects.individual import OWLNamedIndividual
+from morelianoctua.model.objects.property import OWLObjectProperty, \
+    OWLDataProperty, OWLAnnotationProperty
+
+num_objects = 100000
+num_entities = 1000
+
+_iris = [URIRef(f'http://example.com/ont#e{i}') for i in range(num_objects)]
+
+classes = [OWLClass(_iris[i]) for i in range(num_entities)]
+individuals = [OWLNamedIndividual(_iris[i]) for i in range(num_entities)]
+object_properties = [
+    OWLObjectProperty(_iris[i]) for i in range(num_entities)]
+data_properties = [OWLDataProperty(_iris[i]) for i in range(num_entities)]
+annotation_properties = [
+    OWLAnnotationProperty(_iris[i]) for i in range(num_entities)]
+datatypes = [OWLDatatype(_iris[i]) for i in range(num_entities)]
+literals = [Literal(i, datatype=XSD.int) for i in range(num_objects)]
+
+
+def _entity(entities, i):
+    return entities[i % num_entities]
+
+
+def _some_values_from(i):
+    return OWLObjectSomeValuesFrom(
+        _entity(object_properties, i), _entity(classes, i + 1))
+
+
+entity_factories = {
+    OWLClass: lambda i: OWLClass(_iris[i]),
+    OWLNamedIndividual: lambda i: OWLNamedIndividual(_iris[i]),
+    OWLObjectProperty: lambda i: OWLObjectProperty(_iris[i]),
+    OWLDataProperty: lambda i: OWLDataProperty(_iris[i]),
+    OWLAnnotationProperty: lambda i: OWLAnnotationProperty(_iris[i]),
+    OWLDatatype: lambda i: OWLDatatype(_iris[i]),
+}
+
+axiom_factories = {
+    OWLClassDeclarationAxiom: lambda i: OWLClassDeclarationAxiom(
+        _entity(classes, i)),
+    OWLDatatypeDeclarationAxiom: lambda i: OWLDatatypeDeclarationAxiom(
+        _entity(datatypes, i)),
+    OWLObjectPropertyDeclarationAxiom:
+        lambda i: OWLObjectPropertyDeclarationAxiom(
+            _entity(object_properties, i)),
+    OWLDataPropertyDeclarationAxiom:
+        lambda i: OWLDataPropertyDeclarationAxiom(
+            _entity(data_properties, i)),
+    OWLAnnotationPropertyDeclarationAxiom:
+        lambda i: OWLAnnotationPropertyDeclarationAxiom(
+            _entity(annotation_properties, i)),
+    OWLNamedIndividualDeclarationAxiom:
+        lambda i: OWLNamedIndividualDeclarationAxiom(
+            _entity(individuals, i)),
+    OWLSubClassOfAxiom: lambda i: OWLSubClassOfAxiom(
+        _entity(classes, i), _some_values_from(i)),
+    OWLEquivalentClassesAxiom: lambda i: OWLEquivalentClassesAxiom(
+        {_entity(classes, i), _some_values_from(i)}),
+    OWLDisjointClassesAxiom: lambda i: OWLDisjointClassesAxiom(
+        {_entity(classes, i), _entity(classes, i + 1)}),
+    OWLDisjointUnionAxiom: lambda i: OWLDisjointUnionAxiom(
+        _entity(classes, i),
+        {_entity(classes, i + 1), _entity(classes, i + 2)}),
+    OWLSubObjectPropertyOfAxiom: lambda i: OWLSubObjectPropertyOfAxiom(
+        _entity(object_properties, i), _entity(object_properties, i + 1)),
+    OWLEquivalentObjectPropertiesAxiom:
+        lambda i: OWLEquivalentObjectPropertiesAxiom(
+            [_entity(object_properties, i),
+             _entity(object_properties, i + 1)]),
+    OWLDisjointObjectPropertiesAxiom:
+        lambda i: OWLDisjointObjectPropertiesAxiom(
+            [_entity(object_properties, i),
+             _entity(object_properties, i + 1)]),
+    OWLInverseObjectPropertiesAxiom:
+        lambda i: OWLInverseObjectPropertiesAxiom(
+            _entity(object_properties, i), _entity(object_properties, i + 1)),
+    OWLObjectPropertyDomainAxiom: lambda i: OWLObjectPropertyDomainAxiom(
+        _entity(object_properties, i), _entity(classes, i)),
+    OWLObjectPropertyRangeAxiom: lambda i: OWLObjectPropertyRangeAxiom(
+        _entity(object_properties, i), _entity(classes, i)),
+    OWLDataPropertyDomainAxiom: lambda i: OWLDataPropertyDomainAxiom(
+        _entity(data_properties, i), _entity(classes, i)),
+    OWLDataPropertyRangeAxiom: lambda i: OWLDataPropertyRangeAxiom(
+        _entity(data_properties, i), _entity(datatypes, i)),
+    OWLClassAssertionAxiom: lambda i: OWLClassAssertionAxiom(
+        _entity(individuals, i), _entity(classes, i)),
+    OWLObjectPropertyAssertionAxiom:
+        lambda i: OWLObjectPropertyAssertionAxiom(
+            _entity(individuals, i), _entity(object_properties, i),
+            _entity(individuals, i + 1)),
+    OWLDataPropertyAssertionAxiom: lambda i: OWLDataPropertyAssertionAxiom(
+        _entity(individuals, i), _entity(data_properties, i), literals[i]),
+}
+
+
+def bytes_per_object(factory) -> float:
+    """Returns the average number of bytes allocated for the objects created
+    by factory(i)
+    """
+    objects = [None] * num_objects
+    gc.collect()
+
+    before = tracemalloc.get_traced_memory()[0]
+
+    for i in range(num_objects):
+        objects[i] = factory(i)
+
+    return (tracemalloc.get_traced_memory()[0] - before) / num_objects
+
+
+def main():
+    tracemalloc.start()
+
+    for title, factories in [('entity', entity_factories),
+                             ('axiom', axiom_factories)]:
+        print(f'{title:<40} {"bytes":>8}')
+
+        for cls, factory in factories.items():
+            print(f'{cls.__name__:<40} {bytes_per_object(factory):>8.1f}')
+
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Generators for synthetic functional syntax documents used by the
+benchmarks
+"""
+
+prefixes = """Prefix(:=<http://example.com/ont#>)
+Prefix(ex:=<http://example.com/ont#>)
+Prefix(xsd:=<http://www.w3.org/2001/XMLSchema#>)
+
+"""
+
+
+def abox_document(num_axioms, num_individuals=1000):
+    """A flat ABox with class, object property and data property
+    assertions
+    """
+    lines = [prefixes, 'Ontology(<http://example.com/ont>\n']
+
+    for i in range(num_axioms):
+        subj = i % num_individuals
+        obj = (i * 7) % num_individuals
+
+        if i % 3 == 0:
+            lines.append(f'ClassAssertion(ex:Cls{i % 50} ex:indiv{subj})\n')
+        elif i % 3 == 1:
+            lines.append(
+                f'ObjectPropertyAssertion(ex:objProp{i % 20} '
+                f'ex:indiv{subj} ex:indiv{obj})\n')
+        else:
+            lines.append(
+                f'DataPropertyAssertion(ex:dataProp{i % 20} '
+                f'ex:indiv{subj} "{i}"^^xsd:int)\n')
+
+    lines.append(')\n')
+
+    return ''.join(lines)
+
+
+def _nested_class_expression(depth, i):
+    if depth == 0:
+        return f'ex:Cls{i}'
+
+    filler = _nested_class_expression(depth - 1, i + 1)
+
+    if depth % 2 == 0:
+        return f'ObjectSomeValuesFrom(ex:objProp{depth} {filler})'
+    else:
+        return f'ObjectIntersectionOf(ex:Cls{i} {filler})'
+
+
+def tbox_document(num_axioms, depth=6, num_super_classes=None):
+    """A TBox of sub-class axioms with nested class expressions. If
+    num_super_classes is given, the axioms only use that many different
+    super class expressions, which repeat like in real ontologies.
+    """
+    lines = [prefixes, 'Ontology(<http://example.com/ont>\n']
+
+    for i in range(num_axioms):
+        if num_super_classes is None:
+            super_class = _nested_class_expression(depth, i)
+        else:
+            super_class = _nested_class_expression(
+                depth, i % num_super_classes)
+
+        lines.append(f'SubClassOf(ex:Cls{i} {super_class})\n')
+
+    lines.append(')\n')
+
+    return ''.join(lines)
+
+
+def write_document(document, file_path):
+    with open(file_path, 'w', encoding='utf-8') as ontology_file:
+        ontology_file.write(document)
@@ -0,0 +1,69 @@
+"""Compares answering queries about a parsed ABox by scanning its axioms with
+looking them up in the index of the ontology.
+
+The index is built on the first query, its build time is reported
+separately.
+
+Run with: python -m benchmarks.ontologyindex
+"""
+import os
+import tempfile
+import time
+
+from benchmarks.ontologies import abox_document, write_document
+from morelianoctua.model.axioms.assertionaxiom import OWLClassAssertionAxiom
+from morelianoctua.model.objects.individual import OWLNamedIndividual
+from morelianoctua.parsing.fastfunctional import FastFunctionalSyntaxParser
+
+num_queries = 1000
+
+
+def _scan_class_assertions(ontology, individual):
+    return {
+        axiom for axiom in ontology.axioms
+        if isinstance(axiom, OWLClassAssertionAxiom)
+        and axiom.individual == individual}
+
+
+def _scan_referencing_axioms(ontology, entity):
+    return {
+        axiom for axiom in ontology.axioms if entity in axiom.signature()}
+
+
+def main():
+    fd, file_path = tempfile.mkstemp(suffix='.ofn')
+    os.close(fd)
+
+    try:
+        write_document(abox_document(100000, 10000), file_path)
+        ontology = FastFunctionalSyntaxParser().parse_file(file_path)
+        individuals = [
+            OWLNamedIndividual(f'http://example.com/ont#indiv{i}')
+            for i in range(num_queries)]
+
+        start = time.perf_counter()
+        ontology.get_axioms(OWLClassAssertionAxiom)
+        print(f'{"build index":<32} {time.perf_counter() - start:>10.4f} s')
+
+        for label, query in [
+                ('class assertions (scan)', _scan_class_assertions),
+                ('class assertions (index)',
+                 lambda o, i: o.get_class_assertion_axioms(i)),
+                ('referencing axioms (scan)', _scan_referencing_axioms),
+                ('referencing axioms (index)',
+                 lambda o, i: o.get_referencing_axioms(i))]:
+            # the scans are too slow to run all queries
+            queries = individuals[:10] if 'scan' in label else individuals
+
+            start = time.perf_counter()
+            for individual in queries:
+                query(ontology, individual)
+            duration = (time.perf_counter() - start) / len(queries)
+
+            print(f'{label:<32} {duration * 1e6:>10.1f} us/query')
+    finally:
+        os.remove(file_path)
+
+
+if __name__ == '__main__':
+    main()
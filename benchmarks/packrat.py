@@ -0,0 +1,82 @@
+"""Measures throughput and peak memory of the pyparsing based
+FunctionalSyntaxParser with and without packrat parsing for different cache
+sizes.
+
+Every configuration is run in a fresh process, so that the grammars built
+and the objects interned by earlier runs don't count towards its peak
+memory. Peak memory is measured with tracemalloc in a separate run to not
+distort the throughput.
+
+Run with: python -m benchmarks.packrat
+"""
+import multiprocessing
+import os
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.ontologies import abox_document, tbox_document, \
+    write_document
+from morelianoctua.parsing.functional import FunctionalSyntaxParser
+
+cache_sizes = [None, 128, 1024, 16384]
+
+
+def _throughput(file_path, cache_size):
+    parser = FunctionalSyntaxParser(packrat_cache_size=cache_size)
+
+    start = time.perf_counter()
+    ontology = parser.parse_file(file_path)
+
+    return len(ontology.axioms) / (time.perf_counter() - start)
+
+
+def _peak_memory(file_path, cache_size):
+    parser = FunctionalSyntaxParser(packrat_cache_size=cache_size)
+
+    tracemalloc.start()
+    parser.parse_file(file_path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak
+
+
+def _run_in_fresh_process(fn, *args):
+    context = multiprocessing.get_context('spawn')
+
+    with ProcessPoolExecutor(1, mp_context=context) as executor:
+        return executor.submit(fn, *args).result()
+
+
+def main():
+    documents = [
+        ('ABox', abox_document(3000)),
+        ('nested TBox', tbox_document(300)),
+    ]
+
+    for name, document in documents:
+        fd, file_path = tempfile.mkstemp(suffix='.ofn')
+        os.close(fd)
+
+        try:
+            write_document(document, file_path)
+            print(f'{name}:')
+
+            for cache_size in cache_sizes:
+                throughput = _run_in_fresh_process(
+                    _throughput, file_path, cache_size)
+                peak = _run_in_fresh_process(
+                    _peak_memory, file_path, cache_size)
+
+                label = 'off' if cache_size is None else str(cache_size)
+                print(f'  packrat cache {label:>6} '
+                      f'{throughput:>10.0f} axioms/s '
+                      f'{peak / (1 << 20):>8.1f} MiB peak')
+        finally:
+            os.remove(file_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Compares the throughput of the pyparsing based FunctionalSyntaxParser and
+the FastFunctionalSyntaxParser, sequentially and with a pool of worker
+processes.
+
+Run with: python -m benchmarks.parsing [workers]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.ontologies import abox_document, tbox_document, \
+    write_document
+from morelianoctua.parsing.fastfunctional import FastFunctionalSyntaxParser
+from morelianoctua.parsing.functional import FunctionalSyntaxParser
+
+
+def _time_parse(parser, file_path, workers=None):
+    start = time.perf_counter()
+    ontology = parser.parse_file(file_path, workers=workers)
+
+    return time.perf_counter() - start, len(ontology.axioms)
+
+
+def main(workers):
+    documents = [
+        ('ABox', abox_document(20000)),
+        ('nested TBox', tbox_document(2000)),
+    ]
+
+    for name, document in documents:
+        fd, file_path = tempfile.mkstemp(suffix='.ofn')
+        os.close(fd)
+
+        try:
+            write_document(document, file_path)
+            print(f'{name}:')
+
+            for parser in [FunctionalSyntaxParser(),
+                           FastFunctionalSyntaxParser()]:
+                for num_workers in sorted({1, workers}):
+                    duration, num_axioms = _time_parse(
+                        parser, file_path, num_workers)
+                    print(f'  {type(parser).__name__:<30} '
+                          f'{num_workers:>2} worker(s) '
+                          f'{num_axioms / duration:>10.0f} axioms/s')
+        finally:
+            os.remove(file_path)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count())
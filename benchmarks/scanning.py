@@ -0,0 +1,53 @@
+"""Compares parsing a whole document with only reading its header or its
+declarations.
+
+Run with: python -m benchmarks.scanning
+"""
+import os
+import tempfile
+import time
+
+from benchmarks.ontologies import abox_document, write_document
+from morelianoctua.parsing.fastfunctional import FastFunctionalSyntaxParser
+from morelianoctua.parsing.functional import FunctionalSyntaxParser
+
+
+def _document(num_axioms, num_individuals):
+    declarations = ''.join(
+        f'Declaration(NamedIndividual(ex:indiv{i}))\n'
+        for i in range(num_individuals))
+
+    return abox_document(num_axioms, num_individuals).replace(
+        'Ontology(<http://example.com/ont>\n',
+        'Ontology(<http://example.com/ont>\n' + declarations)
+
+
+def _duration(fn):
+    start = time.perf_counter()
+    fn()
+
+    return time.perf_counter() - start
+
+
+def main():
+    fd, file_path = tempfile.mkstemp(suffix='.ofn')
+    os.close(fd)
+
+    try:
+        write_document(_document(20000, 2000), file_path)
+
+        for parser in [FunctionalSyntaxParser(), FastFunctionalSyntaxParser()]:
+            print(f'{type(parser).__name__}:')
+
+            for name, fn in [
+                    ('parse_file', parser.parse_file),
+                    ('scan_declarations', parser.scan_declarations),
+                    ('scan_header', parser.scan_header)]:
+                duration = _duration(lambda: fn(file_path))
+                print(f'  {name:<18} {duration:>8.3f} s')
+    finally:
+        os.remove(file_path)
+
+
+if __name__ == '__main__':
+    main()
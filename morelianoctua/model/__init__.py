@@ -1,19 +1,46 @@
 from rdflib import Graph
 
+from morelianoctua.model.axioms.assertionaxiom import \
+    OWLClassAssertionAxiom, OWLObjectPropertyAssertionAxiom, \
+    OWLDataPropertyAssertionAxiom
+from morelianoctua.model.axioms.classaxiom import OWLSubClassOfAxiom
+from morelianoctua.model.index import OntologyIndex, SetView
+from morelianoctua.model.objects.classexpression import OWLClass
+from morelianoctua.model.objects.datarange import OWLDatatype
+from morelianoctua.model.objects.individual import OWLNamedIndividual
+from morelianoctua.model.objects.property import OWLObjectProperty, \
+    OWLDataProperty, OWLAnnotationProperty
+
 
 class OWLOntology(object):
+    """
+    An ontology with its prefixes, header and axioms.
+
+    axioms is a read-only view of the axioms, which are changed with
+    add_axiom() and remove_axiom(). The collection of axioms passed is taken
+    over by the ontology and shouldn't be changed by the caller afterwards.
+
+    The get_..._axioms() and ..._in_signature() methods look the axioms and
+    entities up in an OntologyIndex (see morelianoctua.model.index), which
+    is built in one pass over the axioms on their first call and kept up to
+    date by add_axiom() and remove_axiom().
+    """
     default_prefix_dummy = 'DEFAULT'
 
+    # unpickled ontologies have no index until it's needed
+    _index = None
+
     def __init__(
             self,
             prefix_declarations: dict,
             axioms,
             ontology_iri=None,
             version_iri=None,
-            annotations=None):
+            annotations=None,
+            imports=None):
 
         self.prefixes = prefix_declarations
-        self.axioms = axioms
+        self._axioms = axioms
         self.iri = ontology_iri
         self.version_iri = version_iri
 
@@ -22,6 +49,119 @@ class OWLOntology(object):
         else:
             self.annotations = []
 
+        if imports is not None:
+            self.imports = imports
+        else:
+            self.imports = []
+
+    def __getstate__(self):
+        # the index is built again on demand
+        state = dict(self.__dict__)
+        state.pop('_index', None)
+
+        return state
+
     def as_rdf_graph(self) -> Graph:
         from morelianoctua.util.converters.rdfconverter import to_rdf
         return to_rdf(self)
+
+    @property
+    def axioms(self) -> SetView:
+        return SetView(self._axioms)
+
+    def add_axiom(self, axiom):
+        if axiom in self._axioms:
+            return
+
+        if isinstance(self._axioms, list):
+            self._axioms.append(axiom)
+        else:
+            self._axioms.add(axiom)
+
+        if self._index is not None:
+            self._index.add(axiom)
+
+    def remove_axiom(self, axiom):
+        if axiom not in self._axioms:
+            return
+
+        self._axioms.remove(axiom)
+
+        if self._index is not None:
+            self._index.remove(axiom)
+
+    def get_axioms(self, axiom_type) -> SetView:
+        """Returns the axioms of axiom_type, which may be a base type like
+        OWLClassAxiom
+        """
+        return self._get_index().axioms_of_type(axiom_type)
+
+    def get_referencing_axioms(self, entity) -> SetView:
+        """Returns the axioms mentioning entity, including the ones mentioning
+        it in their annotations
+        """
+        return self._get_index().referencing_axioms(entity)
+
+    def get_sub_class_axioms_for_sub_class(self, cls) -> SetView:
+        """Returns the SubClassOf axioms with the sub class cls"""
+        return self._get_index().axioms_by_field(
+            OWLSubClassOfAxiom, 'sub_class', cls)
+
+    def get_sub_class_axioms_for_super_class(self, cls) -> SetView:
+        """Returns the SubClassOf axioms with the super class cls"""
+        return self._get_index().axioms_by_field(
+            OWLSubClassOfAxiom, 'super_class', cls)
+
+    def get_class_assertion_axioms(self, individual) -> SetView:
+        """Returns the ClassAssertion axioms of individual"""
+        return self._get_index().axioms_by_field(
+            OWLClassAssertionAxiom, 'individual', individual)
+
+    def get_class_assertion_axioms_for_class(
+            self, class_expression) -> SetView:
+        """Returns the ClassAssertion axioms asserting class_expression"""
+        return self._get_index().axioms_by_field(
+            OWLClassAssertionAxiom, 'class_expression', class_expression)
+
+    def get_object_property_assertion_axioms(self, individual) -> SetView:
+        """Returns the ObjectPropertyAssertion axioms with the subject
+        individual
+        """
+        return self._get_index().axioms_by_field(
+            OWLObjectPropertyAssertionAxiom, 'subject_individual', individual)
+
+    def get_data_property_assertion_axioms(self, individual) -> SetView:
+        """Returns the DataPropertyAssertion axioms with the subject
+        individual
+        """
+        return self._get_index().axioms_by_field(
+            OWLDataPropertyAssertionAxiom, 'subject_individual', individual)
+
+    def signature(self) -> SetView:
+        """Returns the entities mentioned by the axioms"""
+        return self._get_index().signature()
+
+    def classes_in_signature(self) -> SetView:
+        return self._get_index().entities_of_type(OWLClass)
+
+    def object_properties_in_signature(self) -> SetView:
+        return self._get_index().entities_of_type(OWLObjectProperty)
+
+    def data_properties_in_signature(self) -> SetView:
+        return self._get_index().entities_of_type(OWLDataProperty)
+
+    def annotation_properties_in_signature(self) -> SetView:
+        return self._get_index().entities_of_type(OWLAnnotationProperty)
+
+    def individuals_in_signature(self) -> SetView:
+        """Returns the named individuals mentioned by the axioms"""
+        return self._get_index().entities_of_type(OWLNamedIndividual)
+
+    def datatypes_in_signature(self) -> SetView:
+        return self._get_index().entities_of_type(OWLDatatype)
+
+    def _get_index(self) -> OntologyIndex:
+        if self._index is None:
+            self._index = OntologyIndex(self._axioms)
+
+        return self._index
@@ -1,5 +1,15 @@
-from abc import ABC
+from morelianoctua.model.objects import Immutable
 
 
-class OWLAxiom(ABC):
-    pass
+class OWLAxiom(Immutable):
+    __slots__ = ()
+
+    @staticmethod
+    def _init_annotations(annotations):
+        """Returns the annotations of an axiom as frozenset or None if there
+        are none
+        """
+        if annotations:
+            return frozenset(annotations)
+        else:
+            return None
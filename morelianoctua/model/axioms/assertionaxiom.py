@@ -1,9 +1,9 @@
-from functools import reduce
 from typing import Set
 
 from rdflib import Literal
 
 from morelianoctua.model.axioms import OWLAxiom
+from morelianoctua.model.objects import cached_hash, init_hash, set_field
 from morelianoctua.model.objects.annotation import OWLAnnotation
 from morelianoctua.model.objects.classexpression import OWLClassExpression
 from morelianoctua.model.objects.individual import OWLIndividual
@@ -12,6 +12,8 @@ from morelianoctua.model.objects.property import OWLDataProperty, \
 
 
 class OWLClassAssertionAxiom(OWLAxiom):
+    __slots__ = ('individual', 'class_expression', 'annotations')
+
     _hash_idx = 229
 
     def __init__(
@@ -19,9 +21,11 @@ class OWLClassAssertionAxiom(OWLAxiom):
             class_expression: OWLClassExpression,
             annotations: Set[OWLAnnotation] = None):
 
-        self.individual = individual
-        self.class_expression = class_expression
-        self.annotations = annotations
+        set_field(self, 'individual', individual)
+        set_field(self, 'class_expression', class_expression)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLClassAssertionAxiom):
@@ -37,19 +41,22 @@ class OWLClassAssertionAxiom(OWLAxiom):
 
             return is_equal
 
+    @cached_hash
     def __hash__(self):
         tmp = \
             self._hash_idx * hash(self.individual) + hash(self.class_expression)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx * l + r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
 
 class OWLObjectPropertyAssertionAxiom(OWLAxiom):
+    __slots__ = (
+        'subject_individual', 'owl_property', 'object_individual',
+        'annotations')
+
     _hash_idx = 233
 
     def __init__(
@@ -58,10 +65,12 @@ class OWLObjectPropertyAssertionAxiom(OWLAxiom):
             owl_property: OWLObjectPropertyExpression,
             object_individual: OWLIndividual,
             annotations=None):
-        self.subject_individual = subject_individual
-        self.owl_property = owl_property
-        self.object_individual = object_individual
-        self.annotations = annotations
+        set_field(self, 'subject_individual', subject_individual)
+        set_field(self, 'owl_property', owl_property)
+        set_field(self, 'object_individual', object_individual)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLObjectPropertyAssertionAxiom):
@@ -77,6 +86,7 @@ class OWLObjectPropertyAssertionAxiom(OWLAxiom):
 
             return is_equal
 
+    @cached_hash
     def __hash__(self):
         tmp = \
             self._hash_idx * hash(self.subject_individual) + \
@@ -85,14 +95,14 @@ class OWLObjectPropertyAssertionAxiom(OWLAxiom):
         tmp += self._hash_idx * hash(self.object_individual)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx * l + r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
 
 class OWLDataPropertyAssertionAxiom(OWLAxiom):
+    __slots__ = ('subject_individual', 'owl_property', 'value', 'annotations')
+
     _hash_idx = 239
 
     def __init__(
@@ -102,10 +112,12 @@ class OWLDataPropertyAssertionAxiom(OWLAxiom):
             value: Literal,
             annotations=None):
 
-        self.subject_individual = subject_individual
-        self.owl_property = owl_property
-        self.value = value
-        self.annotations = annotations
+        set_field(self, 'subject_individual', subject_individual)
+        set_field(self, 'owl_property', owl_property)
+        set_field(self, 'value', value)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLDataPropertyAssertionAxiom):
@@ -121,6 +133,7 @@ class OWLDataPropertyAssertionAxiom(OWLAxiom):
 
             return is_equal
 
+    @cached_hash
     def __hash__(self):
         tmp = \
             self._hash_idx * hash(self.subject_individual) + \
@@ -129,8 +142,6 @@ class OWLDataPropertyAssertionAxiom(OWLAxiom):
         tmp += self._hash_idx * hash(self.value)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx * l + r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
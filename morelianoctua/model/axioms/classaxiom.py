@@ -1,18 +1,20 @@
-from functools import reduce
 from typing import Set
 
 from morelianoctua.model.axioms import OWLAxiom
-from morelianoctua.model.objects import HasOperands
+from morelianoctua.model.objects import HasOperands, cached_hash, init_hash, \
+    set_field
 from morelianoctua.model.objects.annotation import OWLAnnotation
 from morelianoctua.model.objects.classexpression import OWLClassExpression, \
     OWLClass
 
 
 class OWLClassAxiom(OWLAxiom):
-    pass
+    __slots__ = ()
 
 
 class OWLSubClassOfAxiom(OWLClassAxiom):
+    __slots__ = ('sub_class', 'super_class', 'annotations')
+
     _hash_idx = 139
 
     def __init__(
@@ -21,9 +23,11 @@ class OWLSubClassOfAxiom(OWLClassAxiom):
             super_class: OWLClassExpression,
             annotations: Set[OWLAnnotation] = None):
 
-        self.sub_class = sub_class
-        self.super_class = super_class
-        self.annotations = annotations
+        set_field(self, 'sub_class', sub_class)
+        set_field(self, 'super_class', super_class)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLSubClassOfAxiom):
@@ -33,14 +37,13 @@ class OWLSubClassOfAxiom(OWLClassAxiom):
                    and self.super_class == other.super_class \
                    and self.annotations == other.annotations
 
+    @cached_hash
     def __hash__(self):
         tmp = self._hash_idx * hash(self.sub_class) + \
               (self._hash_idx * hash(self.super_class))
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx*l+r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -52,6 +55,8 @@ class OWLSubClassOfAxiom(OWLClassAxiom):
 
 
 class OWLEquivalentClassesAxiom(OWLClassAxiom):
+    __slots__ = ('class_expressions', 'annotations')
+
     _hash_idx = 149
 
     def __init__(
@@ -59,8 +64,10 @@ class OWLEquivalentClassesAxiom(OWLClassAxiom):
             class_expressions: Set[OWLClassExpression],
             annotations: Set[OWLAnnotation] = None):
 
-        self.class_expressions = class_expressions
-        self.annotations = annotations
+        set_field(self, 'class_expressions', frozenset(class_expressions))
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLEquivalentClassesAxiom):
@@ -69,15 +76,12 @@ class OWLEquivalentClassesAxiom(OWLClassAxiom):
             return self.class_expressions == other.class_expressions \
                    and self.annotations == other.annotations
 
+    @cached_hash
     def __hash__(self):
-        tmp = reduce(
-            lambda l, r: self._hash_idx*l+r,
-            map(lambda ce: hash(ce), self.class_expressions))
+        tmp = self._hash_idx * hash(self.class_expressions)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx*l+r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -91,6 +95,8 @@ class OWLEquivalentClassesAxiom(OWLClassAxiom):
 
 
 class OWLDisjointClassesAxiom(OWLClassAxiom):
+    __slots__ = ('class_expressions', 'annotations')
+
     _hash_idx = 151
 
     def __init__(
@@ -98,8 +104,10 @@ class OWLDisjointClassesAxiom(OWLClassAxiom):
             class_expressions: Set[OWLClassExpression],
             annotations: Set[OWLAnnotation] = None):
 
-        self.class_expressions = class_expressions
-        self.annotations = annotations
+        set_field(self, 'class_expressions', frozenset(class_expressions))
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLDisjointClassesAxiom):
@@ -108,15 +116,12 @@ class OWLDisjointClassesAxiom(OWLClassAxiom):
             return self.class_expressions == other.class_expressions \
                    and self.annotations == other.annotations
 
+    @cached_hash
     def __hash__(self):
-        tmp = reduce(
-            lambda l, r: self._hash_idx*l+r,
-            map(lambda ce: hash(ce), self.class_expressions))
+        tmp = self._hash_idx * hash(self.class_expressions)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx*l+r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -130,6 +135,8 @@ class OWLDisjointClassesAxiom(OWLClassAxiom):
 
 
 class OWLDisjointUnionAxiom(OWLClassAxiom, HasOperands):
+    __slots__ = ('owl_class', 'annotations')
+
     _hash_idx = 157
 
     def __init__(
@@ -138,9 +145,11 @@ class OWLDisjointUnionAxiom(OWLClassAxiom, HasOperands):
             class_expressions: Set[OWLClassExpression],
             annotations: Set[OWLAnnotation] = None):
 
-        self.owl_class = owl_class
-        self.operands = class_expressions
-        self.annotations = annotations
+        set_field(self, 'owl_class', owl_class)
+        set_field(self, 'operands', frozenset(class_expressions))
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLDisjointUnionAxiom):
@@ -150,14 +159,11 @@ class OWLDisjointUnionAxiom(OWLClassAxiom, HasOperands):
                    and self.operands == other.operands \
                    and self.annotations == other.annotations
 
+    @cached_hash
     def __hash__(self):
-        tmp = self._hash_idx * hash(self.owl_class) + reduce(
-            lambda l, r: self._hash_idx*l+r,
-            map(lambda o: hash(o), self.operands))
-
-        if self.annotations is not None:
-            tmp += reduce(
-                lambda l, r: self._hash_idx*l+r,
-                map(lambda a: hash(a), self.annotations))
+        tmp = self._hash_idx * hash(self.owl_class) + hash(self.operands)
+
+        if self.annotations:
+            tmp += hash(self.annotations)
 
         return tmp
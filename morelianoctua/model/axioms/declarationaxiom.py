@@ -1,7 +1,7 @@
-from functools import reduce
 from typing import Set
 
 from morelianoctua.model.axioms import OWLAxiom
+from morelianoctua.model.objects import cached_hash, init_hash, set_field
 from morelianoctua.model.objects.annotation import OWLAnnotation
 from morelianoctua.model.objects.classexpression import OWLClass
 from morelianoctua.model.objects.datarange import OWLDatatype
@@ -11,23 +11,33 @@ from morelianoctua.model.objects.property import OWLObjectProperty, \
 
 
 class OWLDeclarationAxiom(OWLAxiom):
-    annotations = []
+    __slots__ = ('annotations',)
 
 
 class OWLClassDeclarationAxiom(OWLDeclarationAxiom):
+    __slots__ = ('cls',)
+
     _hash_idx = 163
 
     def __init__(self, cls: OWLClass, annotations: Set[OWLAnnotation] = None):
-        self.cls = cls
-        self.annotations = annotations
+        set_field(self, 'cls', cls)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, OWLClassDeclarationAxiom):
+            return False
+        else:
+            return self.cls == other.cls \
+                   and self.annotations == other.annotations
 
+    @cached_hash
     def __hash__(self):
         tmp = self._hash_idx * hash(self.cls)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx*l+r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -39,19 +49,29 @@ class OWLClassDeclarationAxiom(OWLDeclarationAxiom):
 
 
 class OWLDatatypeDeclarationAxiom(OWLDeclarationAxiom):
+    __slots__ = ('dtype',)
+
     _hash_idx = 167
 
     def __init__(self, dtype: OWLDatatype, annotations=None):
-        self.dtype = dtype
-        self.annotations: Set[OWLAnnotation] = annotations
+        set_field(self, 'dtype', dtype)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
+    def __eq__(self, other):
+        if not isinstance(other, OWLDatatypeDeclarationAxiom):
+            return False
+        else:
+            return self.dtype == other.dtype \
+                   and self.annotations == other.annotations
+
+    @cached_hash
     def __hash__(self):
         tmp = self._hash_idx * hash(self.dtype)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx*l+r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -63,22 +83,32 @@ class OWLDatatypeDeclarationAxiom(OWLDeclarationAxiom):
 
 
 class OWLObjectPropertyDeclarationAxiom(OWLDeclarationAxiom):
+    __slots__ = ('object_property',)
+
     _hash_idx = 173
 
     def __init__(
             self,
             object_property: OWLObjectProperty,
             annotations: Set[OWLAnnotation] = None):
-        self.object_property = object_property
-        self.annotations = annotations
+        set_field(self, 'object_property', object_property)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, OWLObjectPropertyDeclarationAxiom):
+            return False
+        else:
+            return self.object_property == other.object_property \
+                   and self.annotations == other.annotations
 
+    @cached_hash
     def __hash__(self):
         tmp = self._hash_idx * hash(self.object_property)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx*l+r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -90,19 +120,29 @@ class OWLObjectPropertyDeclarationAxiom(OWLDeclarationAxiom):
 
 
 class OWLDataPropertyDeclarationAxiom(OWLDeclarationAxiom):
+    __slots__ = ('data_property',)
+
     _hash_idx = 179
 
     def __init__(self, data_property: OWLDataProperty, annotations=None):
-        self.data_property = data_property
-        self.annotations = annotations
+        set_field(self, 'data_property', data_property)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, OWLDataPropertyDeclarationAxiom):
+            return False
+        else:
+            return self.data_property == other.data_property \
+                   and self.annotations == other.annotations
 
+    @cached_hash
     def __hash__(self):
         tmp = self._hash_idx * hash(self.data_property)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx*l+r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -114,21 +154,31 @@ class OWLDataPropertyDeclarationAxiom(OWLDeclarationAxiom):
 
 
 class OWLAnnotationPropertyDeclarationAxiom(OWLDeclarationAxiom):
+    __slots__ = ('annotation_property',)
+
     _hash_idx = 181
 
     def __init__(
             self, annotation_property: OWLAnnotationProperty, annotations=None):
 
-        self.annotation_property = annotation_property
-        self.annotations = annotations
+        set_field(self, 'annotation_property', annotation_property)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
+    def __eq__(self, other):
+        if not isinstance(other, OWLAnnotationPropertyDeclarationAxiom):
+            return False
+        else:
+            return self.annotation_property == other.annotation_property \
+                   and self.annotations == other.annotations
+
+    @cached_hash
     def __hash__(self):
         tmp = self._hash_idx * hash(self.annotation_property)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx*l+r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -140,6 +190,8 @@ class OWLAnnotationPropertyDeclarationAxiom(OWLDeclarationAxiom):
 
 
 class OWLNamedIndividualDeclarationAxiom(OWLDeclarationAxiom):
+    __slots__ = ('individual',)
+
     _hash_idx = 191
 
     def __init__(
@@ -147,16 +199,24 @@ class OWLNamedIndividualDeclarationAxiom(OWLDeclarationAxiom):
             individual: OWLNamedIndividual,
             annotations: Set[OWLAnnotation] = None):
 
-        self.individual = individual
-        self.annotations = annotations
+        set_field(self, 'individual', individual)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, OWLNamedIndividualDeclarationAxiom):
+            return False
+        else:
+            return self.individual == other.individual \
+                   and self.annotations == other.annotations
 
+    @cached_hash
     def __hash__(self):
         tmp = self._hash_idx * hash(self.individual)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx*l+r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -1,7 +1,7 @@
-from functools import reduce
 from typing import Set
 
 from morelianoctua.model.axioms import OWLAxiom
+from morelianoctua.model.objects import cached_hash, init_hash, set_field
 from morelianoctua.model.objects.annotation import OWLAnnotation
 from morelianoctua.model.objects.classexpression import OWLClassExpression
 from morelianoctua.model.objects.datarange import OWLDataRange
@@ -9,10 +9,12 @@ from morelianoctua.model.objects.property import OWLDataProperty
 
 
 class OWLDataPropertyAxiom(OWLAxiom):
-    pass
+    __slots__ = ()
 
 
 class OWLDataPropertyDomainAxiom(OWLDataPropertyAxiom):
+    __slots__ = ('data_property', 'domain', 'annotations')
+
     _hash_idx = 241
 
     def __init__(
@@ -21,9 +23,11 @@ class OWLDataPropertyDomainAxiom(OWLDataPropertyAxiom):
             domain: OWLClassExpression,
             annotations: Set[OWLAnnotation] = None):
 
-        self.data_property = data_property
-        self.domain = domain
-        self.annotations = annotations
+        set_field(self, 'data_property', data_property)
+        set_field(self, 'domain', domain)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLDataPropertyDomainAxiom):
@@ -38,13 +42,12 @@ class OWLDataPropertyDomainAxiom(OWLDataPropertyAxiom):
 
             return is_equal
 
+    @cached_hash
     def __hash__(self):
         tmp = self._hash_idx * hash(self.data_property) + hash(self.domain)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx * l + r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -56,6 +59,8 @@ class OWLDataPropertyDomainAxiom(OWLDataPropertyAxiom):
 
 
 class OWLDataPropertyRangeAxiom(OWLDataPropertyAxiom):
+    __slots__ = ('data_property', 'data_range', 'annotations')
+
     _hash_idx = 251
 
     def __init__(
@@ -64,9 +69,11 @@ class OWLDataPropertyRangeAxiom(OWLDataPropertyAxiom):
             data_range: OWLDataRange,
             annotations: Set[OWLAnnotation] = None):
 
-        self.data_property = data_property
-        self.data_range = data_range
-        self.annotations = annotations
+        set_field(self, 'data_property', data_property)
+        set_field(self, 'data_range', data_range)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLDataPropertyRangeAxiom):
@@ -81,13 +88,12 @@ class OWLDataPropertyRangeAxiom(OWLDataPropertyAxiom):
 
             return is_equal
 
+    @cached_hash
     def __hash__(self):
         tmp = self._hash_idx * hash(self.data_property) + hash(self.data_range)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx * l + r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -1,9 +1,9 @@
-from functools import reduce
 from typing import Set
 
 from rdflib import URIRef
 
 from morelianoctua.model.axioms import OWLAxiom
+from morelianoctua.model.objects import cached_hash, init_hash, set_field
 from morelianoctua.model.objects.annotation import OWLAnnotation
 from morelianoctua.model.objects.classexpression import OWLClassExpression
 from morelianoctua.model.objects.property import OWLObjectPropertyExpression, \
@@ -11,10 +11,12 @@ from morelianoctua.model.objects.property import OWLObjectPropertyExpression, \
 
 
 class OWLObjectPropertyAxiom(OWLAxiom):
-    pass
+    __slots__ = ()
 
 
 class OWLSubObjectPropertyOfAxiom(OWLObjectPropertyAxiom):
+    __slots__ = ('sub_property', 'super_property', 'annotations')
+
     _hash_idx = 193
 
     def __init__(
@@ -22,9 +24,11 @@ class OWLSubObjectPropertyOfAxiom(OWLObjectPropertyAxiom):
             sub_property: OWLObjectPropertyExpression,
             super_property: OWLObjectPropertyExpression,
             annotations: Set[OWLAnnotation] = None):
-        self.sub_property = sub_property
-        self.super_property = super_property
-        self.annotations = annotations
+        set_field(self, 'sub_property', sub_property)
+        set_field(self, 'super_property', super_property)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLSubObjectPropertyOfAxiom):
@@ -38,14 +42,13 @@ class OWLSubObjectPropertyOfAxiom(OWLObjectPropertyAxiom):
 
             return is_equal
 
+    @cached_hash
     def __hash__(self):
         tmp = self._hash_idx * hash(self.sub_property) + \
               (self._hash_idx * hash(self.super_property))
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx*l+r,
-                map(lambda o: hash(o), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -57,30 +60,36 @@ class OWLSubObjectPropertyOfAxiom(OWLObjectPropertyAxiom):
 
 
 class HasObjectProperties(OWLAxiom):
+    __slots__ = ('properties',)
+
     @staticmethod
     def _init_properties(properties):
-        obj_props = set()
+        obj_props = []
 
         for prop in properties:
             if isinstance(prop, OWLObjectPropertyExpression):
-                obj_props.add(prop)
+                obj_props.append(prop)
             elif isinstance(prop, URIRef) or isinstance(prop, str):
-                obj_props.add(OWLObjectProperty(prop))
+                obj_props.append(OWLObjectProperty(prop))
             else:
                 raise RuntimeError(
                     f'{prop} does not look like an object property expression')
 
-        return obj_props
+        return frozenset(obj_props)
 
 
 class OWLEquivalentObjectPropertiesAxiom(
         OWLObjectPropertyAxiom, HasObjectProperties):
 
+    __slots__ = ('annotations',)
+
     _hash_idx = 197
 
     def __init__(self, properties, annotations: Set[OWLAnnotation] = None):
-        self.properties = self._init_properties(properties)
-        self.annotations = annotations
+        set_field(self, 'properties', self._init_properties(properties))
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLEquivalentObjectPropertiesAxiom):
@@ -93,15 +102,12 @@ class OWLEquivalentObjectPropertiesAxiom(
 
             return is_equal
 
+    @cached_hash
     def __hash__(self):
-        tmp = reduce(
-            lambda l, r: self._hash_idx*l+r,
-            map(lambda p: hash(p), self.properties))
+        tmp = self._hash_idx * hash(self.properties)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx*l+r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -115,11 +121,15 @@ class OWLEquivalentObjectPropertiesAxiom(
 class OWLDisjointObjectPropertiesAxiom(
         OWLObjectPropertyAxiom, HasObjectProperties):
 
+    __slots__ = ('annotations',)
+
     _hash_idx = 199
 
     def __init__(self, properties, annotations: Set[OWLAnnotation] = None):
-        self.properties = self._init_properties(properties)
-        self.annotations = annotations
+        set_field(self, 'properties', self._init_properties(properties))
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLDisjointObjectPropertiesAxiom):
@@ -132,15 +142,12 @@ class OWLDisjointObjectPropertiesAxiom(
 
             return is_equal
 
+    @cached_hash
     def __hash__(self):
-        tmp = reduce(
-            lambda l, r: self._hash_idx * l + r,
-            map(lambda p: hash(p), self.properties))
+        tmp = self._hash_idx * hash(self.properties)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx * l + r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -152,6 +159,8 @@ class OWLDisjointObjectPropertiesAxiom(
 
 
 class OWLInverseObjectPropertiesAxiom(OWLObjectPropertyAxiom):
+    __slots__ = ('first', 'second', 'annotations')
+
     _hash_idx = 211
 
     def __init__(
@@ -160,9 +169,11 @@ class OWLInverseObjectPropertiesAxiom(OWLObjectPropertyAxiom):
             second: OWLObjectPropertyExpression,
             annotations: Set[OWLAnnotation] = None):
 
-        self.first = first
-        self.second = second
-        self.annotations = annotations
+        set_field(self, 'first', first)
+        set_field(self, 'second', second)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLInverseObjectPropertiesAxiom):
@@ -175,15 +186,12 @@ class OWLInverseObjectPropertiesAxiom(OWLObjectPropertyAxiom):
 
             return is_equal
 
+    @cached_hash
     def __hash__(self):
-        tmp = reduce(
-            lambda l, r: self._hash_idx * l + r,
-            map(lambda p: hash(p), [self.first, self.second]))
+        tmp = self._hash_idx * hash(self.first) + hash(self.second)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx * l + r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -195,6 +203,8 @@ class OWLInverseObjectPropertiesAxiom(OWLObjectPropertyAxiom):
 
 
 class OWLObjectPropertyDomainAxiom(OWLObjectPropertyAxiom):
+    __slots__ = ('object_property', 'domain', 'annotations')
+
     _hash_idx = 223
 
     def __init__(
@@ -203,9 +213,11 @@ class OWLObjectPropertyDomainAxiom(OWLObjectPropertyAxiom):
             domain: OWLClassExpression,
             annotations: Set[OWLAnnotation] = None):
 
-        self.object_property = object_property
-        self.domain = domain
-        self.annotations = annotations
+        set_field(self, 'object_property', object_property)
+        set_field(self, 'domain', domain)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLObjectPropertyDomainAxiom):
@@ -220,13 +232,12 @@ class OWLObjectPropertyDomainAxiom(OWLObjectPropertyAxiom):
 
             return is_equal
 
+    @cached_hash
     def __hash__(self):
         tmp = self._hash_idx * hash(self.object_property) + hash(self.domain)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx * l + r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
@@ -238,6 +249,8 @@ class OWLObjectPropertyDomainAxiom(OWLObjectPropertyAxiom):
 
 
 class OWLObjectPropertyRangeAxiom(OWLObjectPropertyAxiom):
+    __slots__ = ('object_property', 'range_ce', 'annotations')
+
     _hash_idx = 227
 
     def __init__(
@@ -246,9 +259,11 @@ class OWLObjectPropertyRangeAxiom(OWLObjectPropertyAxiom):
             range_ce: OWLClassExpression,
             annotations: Set[OWLAnnotation] = None):
 
-        self.object_property = object_property
-        self.range_ce = range_ce
-        self.annotations = annotations
+        set_field(self, 'object_property', object_property)
+        set_field(self, 'range_ce', range_ce)
+        set_field(self, 'annotations', self._init_annotations(annotations))
+
+        init_hash(self)
 
     def __eq__(self, other):
         if not isinstance(other, OWLObjectPropertyRangeAxiom):
@@ -263,13 +278,12 @@ class OWLObjectPropertyRangeAxiom(OWLObjectPropertyAxiom):
 
             return is_equal
 
+    @cached_hash
     def __hash__(self):
         tmp = self._hash_idx * hash(self.object_property) + hash(self.range_ce)
 
         if self.annotations:
-            tmp += reduce(
-                lambda l, r: self._hash_idx * l + r,
-                map(lambda a: hash(a), self.annotations))
+            tmp += hash(self.annotations)
 
         return tmp
 
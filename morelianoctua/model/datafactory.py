@@ -0,0 +1,178 @@
+from weakref import ref
+
+from rdflib import URIRef
+
+from morelianoctua.model.objects import HasIRI, OWLObject
+
+
+class OWLDataFactory(object):
+    """
+    Creates the OWLObjects of the model, i.e. entities, class expressions,
+    data ranges and the like, and hash-conses them: structurally equal
+    objects built through the same factory are one instance, so they take
+    the memory of one object and compare equal by identity. Axioms aren't
+    interned.
+
+    The factory only holds weak references to the objects, which are dropped
+    once the objects aren't referenced anywhere else. Objects constructed
+    directly, loaded from a snapshot or unpickled from another process
+    aren't interned; they still compare equal to the interned ones, just not
+    by identity.
+
+    Two threads creating the same object at the same time may both get an
+    instance of their own, which is harmless since they are equal.
+    """
+    def __init__(self):
+        # (entity class, IRI) -> weak reference to the entity
+        self._entities = {}
+        # hash -> weak reference to the object, or a list of weak references
+        # to the objects if the hashes of several objects collide
+        self._objects = {}
+        self._sweep_size = _min_sweep_size
+
+    def entity(self, entity_cls, iri):
+        """Returns the entity of type entity_cls with the IRI iri, e.g.
+        factory.entity(OWLClass, 'http://ex.com/ont#Cls1'). Can be passed to
+        the parsers as entity_factory.
+        """
+        if not isinstance(iri, URIRef):
+            iri = URIRef(iri)
+
+        key = (entity_cls, iri)
+        entity_ref = self._entities.get(key)
+
+        if entity_ref is not None:
+            entity = entity_ref()
+
+            if entity is not None:
+                return entity
+
+        entity = entity_cls(iri)
+        self._store(self._entities, key, ref(entity))
+
+        return entity
+
+    __call__ = entity
+
+    def get(self, cls, *args):
+        """Returns the interned object equal to cls(*args), e.g.
+        factory.get(OWLObjectSomeValuesFrom, obj_prop, filler). cls must be
+        an OWLObject class (see intern()).
+        """
+        return self.intern(cls(*args))
+
+    def intern(self, obj: OWLObject) -> OWLObject:
+        """Returns the interned object equal to obj, which is obj itself if
+        there is none yet.
+
+        Only OWLObjects, i.e. entities, class expressions, data ranges and
+        the like, are interned. Axioms and annotations are rarely shared and
+        can't be weakly referenced, so a TypeError is raised for them.
+        """
+        if isinstance(obj, HasIRI):
+            return self._intern_entity(obj)
+
+        elif not isinstance(obj, OWLObject):
+            raise TypeError(
+                f'Only OWLObjects can be interned, not '
+                f'{type(obj).__name__} objects')
+
+        key = hash(obj)
+        entry = self._objects.get(key)
+
+        if entry is None:
+            self._store(self._objects, key, ref(obj))
+
+            return obj
+
+        elif type(entry) is ref:
+            existing = entry()
+
+            if existing is None:
+                self._objects[key] = ref(obj)
+
+                return obj
+
+            elif existing == obj:
+                return existing
+
+            # a different object with the same hash
+            entry = [entry]
+
+        else:
+            for existing_ref in entry:
+                existing = existing_ref()
+
+                if existing is not None and existing == obj:
+                    return existing
+
+            entry = [r for r in entry if r() is not None]
+
+        entry.append(ref(obj))
+        self._objects[key] = entry
+
+        return obj
+
+    def _intern_entity(self, entity: HasIRI) -> HasIRI:
+        key = (type(entity), entity.iri)
+        entity_ref = self._entities.get(key)
+
+        if entity_ref is not None:
+            existing = entity_ref()
+
+            if existing is not None:
+                return existing
+
+        self._store(self._entities, key, ref(entity))
+
+        return entity
+
+    def _store(self, table: dict, key, obj_ref: ref):
+        table[key] = obj_ref
+
+        if len(table) > self._sweep_size:
+            self._sweep()
+
+    def _sweep(self):
+        """Removes the references to objects which don't exist anymore.
+        Instead of removing each reference in a callback when its object is
+        deleted, the tables are swept whenever they doubled in size, which
+        keeps interning cheap.
+        """
+        for table in (self._entities, self._objects):
+            for key, entry in list(table.items()):
+                if type(entry) is ref:
+                    if entry() is None:
+                        table.pop(key, None)
+
+                else:
+                    entry = [r for r in entry if r() is not None]
+
+                    if entry:
+                        table[key] = entry
+                    else:
+                        table.pop(key, None)
+
+        self._sweep_size = max(
+            _min_sweep_size,
+            2 * max(len(self._entities), len(self._objects)))
+
+    def __len__(self):
+        """The number of interned objects which still exist"""
+        num_objects = 0
+
+        for table in (self._entities, self._objects):
+            for entry in list(table.values()):
+                if type(entry) is ref:
+                    num_objects += entry() is not None
+                else:
+                    num_objects += sum(r() is not None for r in entry)
+
+        return num_objects
+
+
+# The minimum size of a table of OWLDataFactory before it is swept
+_min_sweep_size = 1 << 16
+
+# The data factory the parsers and reasoners use unless they are given one
+DEFAULT_DATA_FACTORY = OWLDataFactory()
@@ -0,0 +1,168 @@
+"""
+Indexes over the axioms of an OWLOntology, which answer questions like "all
+class assertions of an individual" or "all axioms mentioning a property"
+and give the signature of the ontology without scanning all axioms.
+"""
+from collections.abc import Set
+
+from morelianoctua.model.axioms import OWLAxiom
+from morelianoctua.model.axioms.assertionaxiom import \
+    OWLClassAssertionAxiom, OWLObjectPropertyAssertionAxiom, \
+    OWLDataPropertyAssertionAxiom
+from morelianoctua.model.axioms.classaxiom import OWLSubClassOfAxiom
+
+# axiom type --> the fields the axioms of the type are indexed by
+_indexed_fields = {
+    OWLSubClassOfAxiom: ('sub_class', 'super_class'),
+    OWLClassAssertionAxiom: ('individual', 'class_expression'),
+    OWLObjectPropertyAssertionAxiom: ('subject_individual',),
+    OWLDataPropertyAssertionAxiom: ('subject_individual',),
+}
+
+
+class SetView(Set):
+    """A read-only view of the axioms of an ontology or of the axioms or
+    entities of an entry of an OntologyIndex, which saves copying them. Get a
+    new one after changing the ontology.
+    """
+    __slots__ = ('_values',)
+
+    def __init__(self, values):
+        self._values = values
+
+    def __contains__(self, value):
+        return value in self._values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return f'SetView({self._values!r})'
+
+    @classmethod
+    def _from_iterable(cls, values):
+        # the results of set operations like view1 | view2 are plain sets
+        return set(values)
+
+
+class OntologyIndex(object):
+    """
+    The axioms of an ontology indexed by their type, by the entities they
+    mention and by the fields listed in _indexed_fields, e.g. the sub class
+    of sub-class axioms or the individual of class assertions. The entities
+    mentioned, i.e. the signature of the ontology, are also kept by their
+    type.
+    """
+    def __init__(self, axioms):
+        # concrete axiom type --> axioms
+        self._by_type = {}
+        # axiom base type like OWLClassAxiom --> axioms, for the base types
+        # asked for so far
+        self._by_base_type = {}
+        # entity --> axioms mentioning the entity
+        self._by_entity = {}
+        # entity type --> entities of the type mentioned by the axioms
+        self._entities_by_type = {}
+        # (axiom type, field name, field value) --> axioms
+        self._by_field = {}
+
+        for axiom in axioms:
+            self.add(axiom)
+
+    def add(self, axiom: OWLAxiom):
+        axiom_type = type(axiom)
+
+        _add(self._by_type, axiom_type, axiom)
+
+        for base_type, axioms in self._by_base_type.items():
+            if isinstance(axiom, base_type):
+                axioms.add(axiom)
+
+        for entity in axiom.signature():
+            if _add(self._by_entity, entity, axiom):
+                _add(self._entities_by_type, type(entity), entity)
+
+        for name in _indexed_fields.get(axiom_type, ()):
+            _add(
+                self._by_field, (axiom_type, name, getattr(axiom, name)),
+                axiom)
+
+    def remove(self, axiom: OWLAxiom):
+        axiom_type = type(axiom)
+
+        _discard(self._by_type, axiom_type, axiom)
+
+        for base_type, axioms in self._by_base_type.items():
+            axioms.discard(axiom)
+
+        for entity in axiom.signature():
+            if _discard(self._by_entity, entity, axiom):
+                _discard(self._entities_by_type, type(entity), entity)
+
+        for name in _indexed_fields.get(axiom_type, ()):
+            _discard(
+                self._by_field, (axiom_type, name, getattr(axiom, name)),
+                axiom)
+
+    def axioms_of_type(self, axiom_type) -> SetView:
+        axioms = self._by_type.get(axiom_type)
+
+        if axioms is None:
+            axioms = self._by_base_type.get(axiom_type)
+
+        if axioms is None:
+            axioms = {
+                axiom
+                for concrete_type, concrete_axioms in self._by_type.items()
+                if issubclass(concrete_type, axiom_type)
+                for axiom in concrete_axioms}
+            self._by_base_type[axiom_type] = axioms
+
+        return SetView(axioms)
+
+    def referencing_axioms(self, entity) -> SetView:
+        return SetView(self._by_entity.get(entity, _empty))
+
+    def axioms_by_field(self, axiom_type, name, value) -> SetView:
+        return SetView(self._by_field.get((axiom_type, name, value), _empty))
+
+    def signature(self) -> SetView:
+        return SetView(self._by_entity.keys())
+
+    def entities_of_type(self, entity_type) -> SetView:
+        return SetView(self._entities_by_type.get(entity_type, _empty))
+
+
+_empty = frozenset()
+
+
+def _add(index: dict, key, value) -> bool:
+    """Adds value to the values of key and returns whether key is new"""
+    try:
+        index[key].add(value)
+
+        return False
+    except KeyError:
+        index[key] = {value}
+
+        return True
+
+
+def _discard(index: dict, key, value) -> bool:
+    """Removes value from the values of key and key from the index once it
+    has no values anymore. Returns whether key was removed.
+    """
+    values = index.get(key)
+
+    if values is not None:
+        values.discard(value)
+
+        if not values:
+            del index[key]
+
+            return True
+
+    return False
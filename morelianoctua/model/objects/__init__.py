@@ -1,17 +1,151 @@
 from abc import ABC
+from functools import wraps
 
-from rdflib import URIRef
+from rdflib import Literal, URIRef
 
 
-class OWLObject(ABC):
-    pass
+# All model classes define __slots__ to keep the millions of objects of a
+# large ontology small. Classes used as one of several bases may only add
+# slots if the other bases don't.
+class Immutable(ABC):
+    """
+    The base of the objects and axioms of the model. The fields of an object
+    are set in its constructor with set_field() and can't be changed
+    afterwards. Collections are held as frozensets, so the hash of an object
+    never changes and is computed only once at the end of the constructor
+    (see cached_hash()). Entities aren't cached since they hash their IRI,
+    whose hash Python caches already.
+    """
+    __slots__ = ('_hash',)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} objects are immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} objects are immutable')
+
+    def __getstate__(self):
+        # the hashes of strings differ between processes, so the cached hash
+        # is computed again after unpickling
+        return {name: getattr(self, name) for name in _field_names(type(self))}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            set_field(self, name, value)
+
+        if hasattr(type(self).__hash__, 'compute'):
+            init_hash(self)
+
+    def signature(self) -> set:
+        """Returns the entities mentioned by this object, e.g. the classes,
+        properties and named individuals of an axiom, including the ones of
+        nested class expressions and of annotations, and the datatypes of
+        typed literals
+        """
+        entities = set()
+        self._add_signature(entities)
+
+        return entities
+
+    def _add_signature(self, entities: set):
+        """Adds the signature of this object to entities. Entities add
+        themselves, all other objects the signatures of their fields.
+        """
+        for name in _field_names(type(self)):
+            value = getattr(self, name)
+
+            if isinstance(value, Immutable):
+                value._add_signature(entities)
+
+            elif isinstance(value, Literal):
+                _add_literal_datatype(value, entities)
+
+            elif isinstance(value, frozenset):
+                for element in value:
+                    if isinstance(element, Immutable):
+                        element._add_signature(entities)
+
+                    elif isinstance(element, Literal):
+                        _add_literal_datatype(element, entities)
+
+
+# OWLDatatype, bound on first use since its module imports this one
+_datatype_cls = None
+
+
+def _add_literal_datatype(literal: Literal, entities: set):
+    global _datatype_cls
+
+    if literal.datatype is not None:
+        if _datatype_cls is None:
+            from morelianoctua.model.objects.datarange import OWLDatatype
+            _datatype_cls = OWLDatatype
+
+        entities.add(_datatype_cls(literal.datatype))
+
+
+# Sets a field of an Immutable in its constructor. This bypasses the
+# __setattr__ of Immutable, which would slow down the construction of every
+# object if it checked whether the field is set already.
+set_field = object.__setattr__
+
+
+def cached_hash(hash_fn):
+    """Decorates the __hash__ method of an Immutable, which then returns the
+    hash computed by hash_fn in init_hash()
+    """
+    @wraps(hash_fn)
+    def __hash__(self):
+        return self._hash
+
+    __hash__.compute = hash_fn
+
+    return __hash__
+
+
+def init_hash(obj: Immutable):
+    """Computes and stores the hash of obj, which must be called once all
+    fields are set
+    """
+    # reduced to the range of the hashes like hash() does
+    set_field(obj, '_hash', hash(type(obj).__hash__.compute(obj)))
+
+
+_field_names_by_class = {}
+
+
+def _field_names(cls) -> tuple:
+    """Returns the names of the slots of cls but the cached hash and the
+    weak reference slot
+    """
+    try:
+        return _field_names_by_class[cls]
+    except KeyError:
+        names = tuple(
+            name
+            for base in cls.__mro__
+            for name in base.__dict__.get('__slots__', ())
+            if name not in ('_hash', '__weakref__'))
+        _field_names_by_class[cls] = names
+
+        return names
+
+
+class OWLObject(Immutable):
+    # OWLDataFactory keeps weak references to the objects it interned
+    __slots__ = ('__weakref__',)
 
 
 class HasIRI(OWLObject):
-    iri = None
+    __slots__ = ('iri',)
+
+    def _add_signature(self, entities: set):
+        entities.add(self)
 
     def __eq__(self, other):
-        if not type(self) == type(other):
+        if self is other:
+            return True
+        elif not type(self) == type(other):
             return False
 
         else:
@@ -26,10 +160,12 @@ class HasIRI(OWLObject):
 
 
 class HasOperands(OWLObject):
-    operands = None
+    __slots__ = ('operands',)
 
     def __eq__(self, other):
-        if not type(self) == type(other):
+        if self is other:
+            return True
+        elif not type(self) == type(other):
             return False
 
         else:
@@ -37,10 +173,12 @@ class HasOperands(OWLObject):
 
 
 class HasDatatypeOperands(OWLObject):
-    operands = None
+    __slots__ = ('operands',)
 
     def __eq__(self, other):
-        if not type(self) == type(other):
+        if self is other:
+            return True
+        elif not type(self) == type(other):
             return False
 
         else:
@@ -48,17 +186,18 @@ class HasDatatypeOperands(OWLObject):
 
     @staticmethod
     def _init_operands(operands):
-        datatype_operands = set()
+        datatype_operands = []
 
         for operand in operands:
             from morelianoctua.model.objects.datarange import OWLDatatype
             if isinstance(operand, OWLDatatype):
-                datatype_operands.add(operand)
+                datatype_operands.append(operand)
 
             elif isinstance(operand, URIRef):
-                datatype_operands.add(OWLDatatype(operand))
+                datatype_operands.append(OWLDatatype(operand))
 
             else:
-                datatype_operands.add(OWLDatatype(operand))
+                datatype_operands.append(OWLDatatype(operand))
+
+        return frozenset(datatype_operands)
 
-        return datatype_operands
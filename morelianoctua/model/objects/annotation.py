@@ -1,7 +1,11 @@
+from morelianoctua.model.objects import Immutable, cached_hash, \
+    init_hash, set_field
 from morelianoctua.model.objects.property import OWLAnnotationProperty
 
 
-class OWLAnnotation(object):
+class OWLAnnotation(Immutable):
+    __slots__ = ('owl_property', 'value')
+
     _hash_idx = 3
 
     def __init__(
@@ -9,8 +13,10 @@ class OWLAnnotation(object):
             owl_property: OWLAnnotationProperty,
             value):
 
-        self.owl_property = owl_property
-        self.value = value
+        set_field(self, 'owl_property', owl_property)
+        set_field(self, 'value', value)
+
+        init_hash(self)
 
     def __str__(self):
         return f'Annotation({self.owl_property} {self.value})'
@@ -25,5 +31,6 @@ class OWLAnnotation(object):
         return self.owl_property == other.owl_property and \
             self.value == other.value
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.owl_property) + hash(self.value)
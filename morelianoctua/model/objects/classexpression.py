@@ -1,9 +1,9 @@
-from functools import reduce
-from typing import Set, Tuple
+from typing import Tuple
 
 from rdflib import OWL, Literal, RDFS, URIRef
 
-from morelianoctua.model.objects import HasIRI, HasOperands, OWLObject
+from morelianoctua.model.objects import HasIRI, HasOperands, OWLObject, \
+    cached_hash, init_hash, set_field
 from morelianoctua.model.objects.datarange import OWLDataRange, OWLDatatype
 from morelianoctua.model.objects.individual import OWLIndividual
 from morelianoctua.model.objects.property import OWLObjectPropertyExpression, \
@@ -11,14 +11,16 @@ from morelianoctua.model.objects.property import OWLObjectPropertyExpression, \
 
 
 class OWLClassExpression(OWLObject):
-    pass
+    __slots__ = ()
 
 
 class OWLClass(OWLClassExpression, HasIRI):
+    __slots__ = ()
+
     _hash_idx = 5
 
     def __init__(self, iri_or_iri_str):
-        self.iri = self._init_iri(iri_or_iri_str)
+        set_field(self, 'iri', self._init_iri(iri_or_iri_str))
 
     def __hash__(self):
         return self._hash_idx * hash(self.iri)
@@ -31,15 +33,18 @@ class OWLClass(OWLClassExpression, HasIRI):
 
 
 class OWLObjectIntersectionOf(OWLClassExpression, HasOperands):
+    __slots__ = ()
+
     _hash_idx = 7
 
     def __init__(self, *operands: Tuple[OWLClassExpression]):
-        self.operands: Set[OWLClassExpression] = {o for o in operands}
+        set_field(self, 'operands', frozenset(operands))
+
+        init_hash(self)
 
+    @cached_hash
     def __hash__(self):
-        return reduce(
-            lambda l, r: self._hash_idx*l+r,
-            map(lambda o: hash(o), self.operands))
+        return self._hash_idx * hash(self.operands)
 
     def __str__(self):
         return \
@@ -50,15 +55,18 @@ class OWLObjectIntersectionOf(OWLClassExpression, HasOperands):
 
 
 class OWLObjectUnionOf(OWLClassExpression, HasOperands):
+    __slots__ = ()
+
     _hash_idx = 11
 
     def __init__(self, *operands: Tuple[OWLClassExpression]):
-        self.operands: Set[OWLClassExpression] = {o for o in operands}
+        set_field(self, 'operands', frozenset(operands))
+
+        init_hash(self)
 
+    @cached_hash
     def __hash__(self):
-        return reduce(
-            lambda l, r: self._hash_idx*l+r,
-            map(lambda o: hash(o), self.operands))
+        return self._hash_idx * hash(self.operands)
 
     def __str__(self):
         return f'ObjectUnionOf({" ".join([str(o) for o in self.operands])})'
@@ -68,13 +76,19 @@ class OWLObjectUnionOf(OWLClassExpression, HasOperands):
 
 
 class OWLObjectComplementOf(OWLClassExpression):
+    __slots__ = ('operand',)
+
     _hash_idx = 13
 
     def __init__(self, operand: OWLClassExpression):
-        self.operand = operand
+        set_field(self, 'operand', operand)
+
+        init_hash(self)
 
     def __eq__(self, other):
-        if not isinstance(other, OWLObjectComplementOf):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLObjectComplementOf):
             return False
         else:
             return self.operand == other.operand
@@ -85,26 +99,32 @@ class OWLObjectComplementOf(OWLClassExpression):
     def __repr__(self):
         return str(self)
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.operand)
 
 
 class OWLObjectOneOf(OWLClassExpression):
+    __slots__ = ('individuals',)
+
     _hash_idx = 17
 
     def __init__(self, *individuals: Tuple[OWLIndividual]):
-        self.individuals: Set[OWLIndividual] = {i for i in individuals}
+        set_field(self, 'individuals', frozenset(individuals))
+
+        init_hash(self)
 
     def __eq__(self, other):
-        if not isinstance(other, OWLObjectOneOf):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLObjectOneOf):
             return False
         else:
             return self.individuals == other.individuals
 
+    @cached_hash
     def __hash__(self):
-        return reduce(
-            lambda l, r: self._hash_idx*l+r,
-            map(lambda i: hash(i), self.individuals))
+        return self._hash_idx * hash(self.individuals)
 
     def __str__(self):
         return f'ObjectOneOf({" ".join([str(i) for i in self.individuals])})'
@@ -114,6 +134,8 @@ class OWLObjectOneOf(OWLClassExpression):
 
 
 class OWLObjectSomeValuesFrom(OWLClassExpression):
+    __slots__ = ('owl_property', 'filler')
+
     _hash_idx = 19
 
     def __init__(
@@ -121,16 +143,21 @@ class OWLObjectSomeValuesFrom(OWLClassExpression):
             owl_property: OWLObjectPropertyExpression,
             filler: OWLClassExpression):
 
-        self.owl_property = owl_property
-        self.filler = filler
+        set_field(self, 'owl_property', owl_property)
+        set_field(self, 'filler', filler)
+
+        init_hash(self)
 
     def __eq__(self, other):
-        if not isinstance(other, OWLObjectSomeValuesFrom):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLObjectSomeValuesFrom):
             return False
         else:
             return self.owl_property == other.owl_property \
                    and self.filler == other.filler
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.owl_property) + hash(self.filler)
 
@@ -142,6 +169,8 @@ class OWLObjectSomeValuesFrom(OWLClassExpression):
 
 
 class OWLObjectAllValuesFrom(OWLClassExpression):
+    __slots__ = ('property', 'filler')
+
     _hash_idx = 23
 
     def __init__(
@@ -149,16 +178,21 @@ class OWLObjectAllValuesFrom(OWLClassExpression):
             owl_property: OWLObjectPropertyExpression,
             filler: OWLClassExpression):
 
-        self.property = owl_property
-        self.filler = filler
+        set_field(self, 'property', owl_property)
+        set_field(self, 'filler', filler)
+
+        init_hash(self)
 
     def __eq__(self, other):
-        if not isinstance(other, OWLObjectAllValuesFrom):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLObjectAllValuesFrom):
             return False
         else:
             return self.property == other.property \
                    and self.filler == other.filler
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.property) + hash(self.filler)
 
@@ -170,6 +204,8 @@ class OWLObjectAllValuesFrom(OWLClassExpression):
 
 
 class OWLObjectHasValue(OWLClassExpression):
+    __slots__ = ('property', 'value')
+
     _hash_idx = 29
 
     def __init__(
@@ -177,15 +213,20 @@ class OWLObjectHasValue(OWLClassExpression):
             owl_property: OWLObjectPropertyExpression,
             value: OWLIndividual):
 
-        self.property = owl_property
-        self.value = value
+        set_field(self, 'property', owl_property)
+        set_field(self, 'value', value)
+
+        init_hash(self)
 
     def __eq__(self, other):
-        if not isinstance(other, OWLObjectHasValue):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLObjectHasValue):
             return False
         else:
             return self.property == other.property and self.value == other.value
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.property) + hash(self.value)
 
@@ -197,17 +238,24 @@ class OWLObjectHasValue(OWLClassExpression):
 
 
 class OWLObjectHasSelf(OWLClassExpression):
+    __slots__ = ('property',)
+
     _hash_idx = 31
 
     def __init__(self, owl_property: OWLObjectPropertyExpression):
-        self.property = owl_property
+        set_field(self, 'property', owl_property)
+
+        init_hash(self)
 
     def __eq__(self, other):
-        if not isinstance(other, OWLObjectHasSelf):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLObjectHasSelf):
             return False
         else:
             return self.property == other.property
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.property)
 
@@ -219,20 +267,26 @@ class OWLObjectHasSelf(OWLClassExpression):
 
 
 class OWLObjectCardinalityRestriction(OWLClassExpression):
-    owl_property: OWLObject
+    __slots__ = ('property', 'cardinality', 'filler')
+
+    property: OWLObjectPropertyExpression
     cardinality: int
     filler: OWLClassExpression
 
     def __eq__(self, other):
-        if not type(self) == type(other):
+        if self is other:
+            return True
+        elif not type(self) == type(other):
             return False
         else:
-            return self.owl_property == other.owl_property \
+            return self.property == other.property \
                    and self.cardinality == other.cardinality \
                    and self.filler == other.filler
 
 
 class OWLObjectMinCardinality(OWLObjectCardinalityRestriction):
+    __slots__ = ()
+
     _hash_idx = 37
 
     def __init__(
@@ -241,14 +295,17 @@ class OWLObjectMinCardinality(OWLObjectCardinalityRestriction):
             cardinality: int,
             filler: OWLClassExpression = None):
 
-        self.property = owl_property
-        self.cardinality = cardinality
+        set_field(self, 'property', owl_property)
+        set_field(self, 'cardinality', cardinality)
 
         if filler is None:
-            self.filler = OWLClass(OWL.Thing)
+            set_field(self, 'filler', OWLClass(OWL.Thing))
         else:
-            self.filler = filler
+            set_field(self, 'filler', filler)
 
+        init_hash(self)
+
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.property) + \
                (self._hash_idx * hash(self.cardinality)) + hash(self.filler)
@@ -263,6 +320,8 @@ class OWLObjectMinCardinality(OWLObjectCardinalityRestriction):
 
 
 class OWLObjectMaxCardinality(OWLObjectCardinalityRestriction):
+    __slots__ = ()
+
     _hash_idx = 41
 
     def __init__(
@@ -271,13 +330,16 @@ class OWLObjectMaxCardinality(OWLObjectCardinalityRestriction):
             cardinality: int,
             filler: OWLClassExpression = None):
 
-        self.property = owl_property
-        self.cardinality = cardinality
+        set_field(self, 'property', owl_property)
+        set_field(self, 'cardinality', cardinality)
         if filler is None:
-            self.filler = OWLClass(OWL.Thing)
+            set_field(self, 'filler', OWLClass(OWL.Thing))
         else:
-            self.filler = filler
+            set_field(self, 'filler', filler)
+
+        init_hash(self)
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.property) + \
                (self._hash_idx * hash(self.cardinality)) + hash(self.filler)
@@ -292,6 +354,8 @@ class OWLObjectMaxCardinality(OWLObjectCardinalityRestriction):
 
 
 class OWLObjectExactCardinality(OWLObjectCardinalityRestriction):
+    __slots__ = ()
+
     _hash_idx = 53
 
     def __init__(
@@ -300,14 +364,17 @@ class OWLObjectExactCardinality(OWLObjectCardinalityRestriction):
             cardinality: int,
             filler: OWLClassExpression = None):
 
-        self.property = owl_property
-        self.cardinality = cardinality
+        set_field(self, 'property', owl_property)
+        set_field(self, 'cardinality', cardinality)
 
         if filler is None:
-            self.filler = OWLClass(OWL.Thing)
+            set_field(self, 'filler', OWLClass(OWL.Thing))
         else:
-            self.filler = filler
+            set_field(self, 'filler', filler)
+
+        init_hash(self)
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.property) + \
                (self._hash_idx * hash(self.cardinality)) + hash(self.filler)
@@ -322,23 +389,30 @@ class OWLObjectExactCardinality(OWLObjectCardinalityRestriction):
 
 
 class OWLDataSomeValuesFrom(OWLClassExpression):
+    __slots__ = ('property', 'filler')
+
     _hash_idx = 47
 
     def __init__(self, owl_property: OWLDataProperty, filler: OWLDataRange):
-        self.property = owl_property
+        set_field(self, 'property', owl_property)
 
         if isinstance(filler, URIRef):
-            self.filler = OWLDatatype(filler)
+            set_field(self, 'filler', OWLDatatype(filler))
         else:
-            self.filler = filler
+            set_field(self, 'filler', filler)
+
+        init_hash(self)
 
     def __eq__(self, other):
-        if not isinstance(other, OWLDataSomeValuesFrom):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLDataSomeValuesFrom):
             return False
         else:
             return self.property == other.property and \
                    self.filler == other.filler
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.property) + hash(self.filler)
 
@@ -350,23 +424,30 @@ class OWLDataSomeValuesFrom(OWLClassExpression):
 
 
 class OWLDataAllValuesFrom(OWLClassExpression):
+    __slots__ = ('property', 'filler')
+
     _hash_idx = 53
 
     def __init__(self, owl_property: OWLDataProperty, filler: OWLDataRange):
-        self.property = owl_property
+        set_field(self, 'property', owl_property)
 
         if isinstance(filler, URIRef):
-            self.filler = OWLDatatype(filler)
+            set_field(self, 'filler', OWLDatatype(filler))
         else:
-            self.filler = filler
+            set_field(self, 'filler', filler)
+
+        init_hash(self)
 
     def __eq__(self, other):
-        if not isinstance(other, OWLDataAllValuesFrom):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLDataAllValuesFrom):
             return False
         else:
             return self.property == other.property \
                    and self.filler == other.filler
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.property) + hash(self.filler)
 
@@ -378,19 +459,26 @@ class OWLDataAllValuesFrom(OWLClassExpression):
 
 
 class OWLDataHasValue(OWLClassExpression):
+    __slots__ = ('owl_property', 'value')
+
     _hash_idx = 59
 
     def __init__(self, owl_property: OWLDataProperty, value: Literal):
-        self.owl_property = owl_property
-        self.value = value
+        set_field(self, 'owl_property', owl_property)
+        set_field(self, 'value', value)
+
+        init_hash(self)
 
     def __eq__(self, other):
-        if not isinstance(other, OWLDataHasValue):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLDataHasValue):
             return False
         else:
             return self.owl_property == other.owl_property and \
                 self.value == other.value
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.owl_property) + hash(self.value)
 
@@ -406,20 +494,26 @@ class OWLDataHasValue(OWLClassExpression):
 
 
 class OWLDataCardinalityRestriction(OWLClassExpression):
-    owl_property: OWLDataProperty
+    __slots__ = ('property', 'cardinality', 'filler')
+
+    property: OWLDataProperty
     cardinality: int
     filler: OWLDataRange
 
     def __eq__(self, other):
-        if not type(self) == type(other):
+        if self is other:
+            return True
+        elif not type(self) == type(other):
             return False
         else:
-            return self.owl_property == other.owl_property \
+            return self.property == other.property \
                    and self.cardinality == other.cardinality \
                    and self.filler == other.filler
 
 
 class OWLDataMinCardinality(OWLDataCardinalityRestriction):
+    __slots__ = ()
+
     _hash_idx = 61
 
     def __init__(
@@ -428,16 +522,19 @@ class OWLDataMinCardinality(OWLDataCardinalityRestriction):
             cardinality: int,
             filler: OWLDataRange = None):
 
-        self.property = owl_property
-        self.cardinality = cardinality
+        set_field(self, 'property', owl_property)
+        set_field(self, 'cardinality', cardinality)
 
         if filler is None:
-            self.filler = OWLDatatype(RDFS.Literal)
+            set_field(self, 'filler', OWLDatatype(RDFS.Literal))
         elif isinstance(filler, URIRef):
-            self.filler = OWLDatatype(filler)
+            set_field(self, 'filler', OWLDatatype(filler))
         else:
-            self.filler = filler
+            set_field(self, 'filler', filler)
 
+        init_hash(self)
+
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.property) + \
                (self._hash_idx * hash(self.cardinality)) + hash(self.filler)
@@ -452,6 +549,8 @@ class OWLDataMinCardinality(OWLDataCardinalityRestriction):
 
 
 class OWLDataMaxCardinality(OWLDataCardinalityRestriction):
+    __slots__ = ()
+
     _hash_idx = 67
 
     def __init__(
@@ -460,16 +559,19 @@ class OWLDataMaxCardinality(OWLDataCardinalityRestriction):
             cardinality: int,
             filler: OWLDataRange = None):
 
-        self.property = owl_property
-        self.cardinality = cardinality
+        set_field(self, 'property', owl_property)
+        set_field(self, 'cardinality', cardinality)
 
         if filler is None:
-            self.filler = OWLDatatype(RDFS.Literal)
+            set_field(self, 'filler', OWLDatatype(RDFS.Literal))
         elif isinstance(filler, URIRef):
-            self.filler = OWLDatatype(filler)
+            set_field(self, 'filler', OWLDatatype(filler))
         else:
-            self.filler = filler
+            set_field(self, 'filler', filler)
+
+        init_hash(self)
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.property) + \
                (self._hash_idx * hash(self.cardinality)) + hash(self.filler)
@@ -484,6 +586,8 @@ class OWLDataMaxCardinality(OWLDataCardinalityRestriction):
 
 
 class OWLDataExactCardinality(OWLDataCardinalityRestriction):
+    __slots__ = ()
+
     _hash_idx = 71
 
     def __init__(
@@ -492,16 +596,19 @@ class OWLDataExactCardinality(OWLDataCardinalityRestriction):
             cardinality: int,
             filler: OWLDataRange = None):
 
-        self.property = owl_property
-        self.cardinality = cardinality
+        set_field(self, 'property', owl_property)
+        set_field(self, 'cardinality', cardinality)
 
         if filler is None:
-            self.filler = OWLDatatype(RDFS.Literal)
+            set_field(self, 'filler', OWLDatatype(RDFS.Literal))
         elif isinstance(filler, URIRef):
-            self.filler = OWLDatatype(filler)
+            set_field(self, 'filler', OWLDatatype(filler))
         else:
-            self.filler = filler
+            set_field(self, 'filler', filler)
+
+        init_hash(self)
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.property) + \
                (self._hash_idx * hash(self.cardinality)) + hash(self.filler)
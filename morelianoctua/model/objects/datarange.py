@@ -1,23 +1,26 @@
-from functools import reduce
-
 from rdflib import Literal, URIRef
 
-from morelianoctua.model.objects import HasDatatypeOperands, HasIRI, OWLObject
+from morelianoctua.model.objects import HasDatatypeOperands, HasIRI, \
+    OWLObject, cached_hash, init_hash, set_field
 from morelianoctua.model.objects.facet import OWLFacetRestriction
 
 
 class OWLDataRange(OWLObject):
-    pass
+    __slots__ = ()
 
 
 class OWLDatatype(OWLDataRange, HasIRI):
+    __slots__ = ()
+
     _hash_idx = 73
 
     def __init__(self, iri_or_iri_str):
-        self.iri = self._init_iri(iri_or_iri_str)
+        set_field(self, 'iri', self._init_iri(iri_or_iri_str))
 
     def __eq__(self, other):
-        if not isinstance(other, OWLDatatype):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLDatatype):
             return False
         else:
             return self.iri == other.iri
@@ -33,15 +36,18 @@ class OWLDatatype(OWLDataRange, HasIRI):
 
 
 class OWLDataIntersectionOf(OWLDataRange, HasDatatypeOperands):
+    __slots__ = ()
+
     _hash_idx = 79
 
     def __init__(self, *operands):
-        self.operands = self._init_operands(operands)
+        set_field(self, 'operands', self._init_operands(operands))
+
+        init_hash(self)
 
+    @cached_hash
     def __hash__(self):
-        return reduce(
-            lambda l, r: self._hash_idx*l+r,
-            map(lambda o: hash(o), self.operands))
+        return self._hash_idx * hash(self.operands)
 
     def __str__(self):
         return \
@@ -52,15 +58,18 @@ class OWLDataIntersectionOf(OWLDataRange, HasDatatypeOperands):
 
 
 class OWLDataUnionOf(OWLDataRange, HasDatatypeOperands):
+    __slots__ = ()
+
     _hash_idx = 83
 
     def __init__(self, *operands):
-        self.operands = self._init_operands(operands)
+        set_field(self, 'operands', self._init_operands(operands))
+
+        init_hash(self)
 
+    @cached_hash
     def __hash__(self):
-        return reduce(
-            lambda l, r: self._hash_idx*l+r,
-            map(lambda o: hash(o), self.operands))
+        return self._hash_idx * hash(self.operands)
 
     def __str__(self):
         return \
@@ -72,20 +81,27 @@ class OWLDataUnionOf(OWLDataRange, HasDatatypeOperands):
 
 
 class OWLDataComplementOf(OWLDataRange):
+    __slots__ = ('data_range',)
+
     _hash_idx = 89
 
     def __init__(self, data_range: OWLDataRange):
         if isinstance(data_range, URIRef):
-            self.data_range = OWLDatatype(data_range)
+            set_field(self, 'data_range', OWLDatatype(data_range))
         else:
-            self.data_range = data_range
+            set_field(self, 'data_range', data_range)
+
+        init_hash(self)
 
     def __eq__(self, other):
-        if not isinstance(other, OWLDataComplementOf):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLDataComplementOf):
             return False
         else:
             return self.data_range == other.data_range
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.data_range)
 
@@ -97,25 +113,29 @@ class OWLDataComplementOf(OWLDataRange):
 
 
 class OWLDataOneOf(OWLDataRange):
+    __slots__ = ('operands',)
+
     _hash_idx = 97
 
     def __init__(self, *values):
-        self.operands = set()
-
         for v in values:
             assert isinstance(v, Literal)
-            self.operands.add(v)
+
+        set_field(self, 'operands', frozenset(values))
+
+        init_hash(self)
 
     def __eq__(self, other):
-        if not isinstance(other, OWLDataOneOf):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLDataOneOf):
             return False
         else:
             return self.operands == other.operands
 
+    @cached_hash
     def __hash__(self):
-        return reduce(
-            lambda l, r: self._hash_idx*l+r,
-            map(lambda l: hash(l), self.operands))
+        return self._hash_idx * hash(self.operands)
 
     def __str__(self):
         operands_strs = [f'"{o.value}"^^<{o.datatype}>' for o in self.operands]
@@ -126,27 +146,32 @@ class OWLDataOneOf(OWLDataRange):
 
 
 class OWLDatatypeRestriction(OWLDataRange):
+    __slots__ = ('datatype', 'facet_restrictions')
+
     _hash_idx = 101
 
     def __init__(self, datatype: OWLDatatype, facet_restrictions):
-        self.datatype = datatype
-        self.facet_restrictions = set()
+        set_field(self, 'datatype', datatype)
+        set_field(self, 'facet_restrictions', frozenset(facet_restrictions))
 
-        for facet_restriction in facet_restrictions:
+        for facet_restriction in self.facet_restrictions:
             assert isinstance(facet_restriction, OWLFacetRestriction)
-            self.facet_restrictions.add(facet_restriction)
+
+        init_hash(self)
 
     def __eq__(self, other):
-        if not isinstance(other, OWLDatatypeRestriction):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLDatatypeRestriction):
             return False
         else:
             return self.datatype == other.datatype \
                    and self.facet_restrictions == other.facet_restrictions
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.datatype) + \
-               reduce(lambda l, r: l*r,
-                      map(lambda fr: hash(fr), self.facet_restrictions))
+            hash(self.facet_restrictions)
 
     def __str__(self):
         return \
@@ -1,6 +1,7 @@
 from rdflib import XSD, RDF, Literal, URIRef
 
-from morelianoctua.model.objects import OWLObject
+from morelianoctua.model.objects import OWLObject, cached_hash, init_hash, \
+    set_field
 
 LENGTH = XSD.length
 MIN_LENGTH = XSD.minLength
@@ -16,19 +17,26 @@ LANG_RANGE = URIRef(RDF.uri + 'langRange')
 
 
 class OWLFacetRestriction(OWLObject):
+    __slots__ = ('facet', 'facet_value')
+
     _hash_idx = 103
 
     def __init__(self, facet: URIRef, facet_value: Literal):
-        self.facet = facet
-        self.facet_value = facet_value
+        set_field(self, 'facet', facet)
+        set_field(self, 'facet_value', facet_value)
+
+        init_hash(self)
 
     def __eq__(self, other):
-        if not isinstance(other, OWLFacetRestriction):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLFacetRestriction):
             return False
         else:
             return self.facet == other.facet \
                    and self.facet_value == other.facet_value
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.facet) + hash(self.facet_value)
 
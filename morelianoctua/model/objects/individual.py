@@ -1,17 +1,19 @@
 from rdflib import BNode
 
-from morelianoctua.model.objects import HasIRI, OWLObject
+from morelianoctua.model.objects import HasIRI, OWLObject, set_field
 
 
 class OWLIndividual(OWLObject):
-    pass
+    __slots__ = ()
 
 
 class OWLNamedIndividual(OWLIndividual, HasIRI):
+    __slots__ = ()
+
     _hash_idx = 107
 
     def __init__(self, individual_iri_or_str):
-        self.iri = self._init_iri(individual_iri_or_str)
+        set_field(self, 'iri', self._init_iri(individual_iri_or_str))
 
     def __hash__(self):
         return self._hash_idx * hash(self.iri)
@@ -24,20 +26,24 @@ class OWLNamedIndividual(OWLIndividual, HasIRI):
 
 
 class OWLAnonymousIndividual(OWLIndividual):
+    __slots__ = ('bnode',)
+
     _hash_idx = 109
 
     def __init__(self, bnode_or_bnode_id):
         if isinstance(bnode_or_bnode_id, BNode):
-            self.bnode = bnode_or_bnode_id
+            set_field(self, 'bnode', bnode_or_bnode_id)
         else:
             assert isinstance(bnode_or_bnode_id, str)
 
             if bnode_or_bnode_id.startswith('_:'):
                 bnode_or_bnode_id = bnode_or_bnode_id[2:]
-            self.bnode = BNode(bnode_or_bnode_id)
+            set_field(self, 'bnode', BNode(bnode_or_bnode_id))
 
     def __eq__(self, other):
-        if not isinstance(other, OWLAnonymousIndividual):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLAnonymousIndividual):
             return False
         else:
             return self.bnode == other.bnode
@@ -0,0 +1,150 @@
+import re
+from decimal import Decimal, InvalidOperation
+
+import rdflib
+from rdflib import Literal, URIRef, XSD
+from rdflib.term import _castLexicalToPython, _is_valid_langtag, \
+    _toPythonMapping
+
+# the slot of rdflib's Literal holding the converted value
+_value_slot = Literal.__dict__['_value']
+
+
+class LazyLiteral(Literal):
+    """
+    An rdflib Literal which converts its lexical form to a Python value only
+    when the value is accessed for the first time.
+
+    LazyLiterals are only created by lazy_literal() for lexical forms which
+    rdflib wouldn't normalize, so they have the same lexical form, language
+    and datatype as the Literal rdflib would create and compare and hash
+    exactly like it.
+    """
+    __slots__ = ()
+
+    @property
+    def _value(self):
+        try:
+            return _value_slot.__get__(self, LazyLiteral)
+        except AttributeError:
+            value = _castLexicalToPython(str(self), self._datatype)
+            _value_slot.__set__(self, value)
+
+            return value
+
+    @_value.setter
+    def _value(self, value):
+        _value_slot.__set__(self, value)
+
+    def __reduce__(self):
+        return _create_lazy_literal, (str(self), self.language, self.datatype)
+
+
+def lazy_literal(lexical_form, language=None, datatype=None) -> Literal:
+    """Creates a literal like rdflib.Literal(lexical_form, language,
+    datatype) which converts its lexical form to a Python value only on
+    first access.
+
+    If rdflib would change the lexical form while converting it (e.g. "01"
+    to "1" for an xsd:int), the lexical form it normalizes to isn't known
+    without converting it and an ordinary Literal is returned.
+    """
+    if language == '':
+        language = None
+
+    if language is not None and \
+            (datatype is not None or not _is_valid_langtag(language)):
+        # rdflib reports the error
+        return Literal(lexical_form, language, datatype)
+
+    if datatype is not None and type(datatype) is not URIRef:
+        datatype = URIRef(datatype)
+
+    if not _keeps_lexical_form(lexical_form, datatype):
+        return Literal(lexical_form, language, datatype)
+
+    return _create_lazy_literal(lexical_form, language, datatype)
+
+
+def _create_lazy_literal(lexical_form, language, datatype) -> LazyLiteral:
+    literal = str.__new__(LazyLiteral, lexical_form)
+    literal._language = language
+    literal._datatype = datatype
+
+    return literal
+
+
+def _keeps_lexical_form(lexical_form, datatype) -> bool:
+    """Checks (without running rdflib's conversion) whether rdflib keeps the
+    lexical form of a literal of the given datatype as it is
+    """
+    if datatype is None or not rdflib.NORMALIZE_LITERALS:
+        return True
+
+    convert = _toPythonMapping.get(datatype, False)
+
+    if convert is None or convert is False:
+        # the value is the lexical form itself or the datatype is unknown
+        # and there's no value to normalize to
+        return True
+
+    check = _lexical_form_checks.get(datatype)
+
+    return check is not None and convert is _checked_conversions[datatype] \
+        and check(lexical_form)
+
+
+_integer_pattern = re.compile(r'0|-?[1-9][0-9]*')
+_date_pattern = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+_date_time_pattern = re.compile(
+    r'[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}')
+
+
+def _is_canonical_float(lexical_form) -> bool:
+    try:
+        return repr(float(lexical_form)) == lexical_form
+    except ValueError:
+        return False
+
+
+def _is_canonical_decimal(lexical_form) -> bool:
+    try:
+        return str(Decimal(lexical_form)) == lexical_form
+    except InvalidOperation:
+        return False
+
+
+def _is_canonical_boolean(lexical_form) -> bool:
+    return lexical_form == 'true' or lexical_form == 'false'
+
+
+# Checks whether a lexical form is the one rdflib normalizes the values of a
+# datatype to. Dates and times matching the patterns are either invalid, in
+# which case rdflib keeps them, or equal to their ISO format.
+_lexical_form_checks = {
+    XSD.integer: _integer_pattern.fullmatch,
+    XSD.int: _integer_pattern.fullmatch,
+    XSD.long: _integer_pattern.fullmatch,
+    XSD.short: _integer_pattern.fullmatch,
+    XSD.byte: _integer_pattern.fullmatch,
+    XSD.nonNegativeInteger: _integer_pattern.fullmatch,
+    XSD.nonPositiveInteger: _integer_pattern.fullmatch,
+    XSD.positiveInteger: _integer_pattern.fullmatch,
+    XSD.negativeInteger: _integer_pattern.fullmatch,
+    XSD.unsignedLong: _integer_pattern.fullmatch,
+    XSD.unsignedInt: _integer_pattern.fullmatch,
+    XSD.unsignedShort: _integer_pattern.fullmatch,
+    XSD.unsignedByte: _integer_pattern.fullmatch,
+    XSD.double: _is_canonical_float,
+    XSD.float: _is_canonical_float,
+    XSD.decimal: _is_canonical_decimal,
+    XSD.boolean: _is_canonical_boolean,
+    XSD.date: _date_pattern.fullmatch,
+    XSD.dateTime: _date_time_pattern.fullmatch,
+}
+
+# The conversions the checks were written for. Datatypes re-bound to other
+# conversions (see rdflib.term.bind()) aren't created lazily.
+_checked_conversions = {
+    datatype: _toPythonMapping.get(datatype)
+    for datatype in _lexical_form_checks}
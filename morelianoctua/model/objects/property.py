@@ -1,9 +1,12 @@
-from morelianoctua.model.objects import HasIRI, OWLObject
+from morelianoctua.model.objects import HasIRI, OWLObject, cached_hash, \
+    init_hash, set_field
 
 
 class OWLProperty(HasIRI):
     """Either OWLAnnotationProperty, OWLDataProperty, or OWLObjectProperty"""
 
+    __slots__ = ()
+
     def __str__(self):
         return f'<{self.iri}>'
 
@@ -12,41 +15,52 @@ class OWLProperty(HasIRI):
 
 
 class OWLObjectPropertyExpression(OWLObject):
-    pass
+    __slots__ = ()
 
 
 class OWLAnnotationProperty(OWLProperty):
+    __slots__ = ()
+
     _hash_idx = 113
 
     def __init__(self, property_iri_or_iri_str):
-        self.iri = self._init_iri(property_iri_or_iri_str)
+        set_field(self, 'iri', self._init_iri(property_iri_or_iri_str))
 
     def __hash__(self):
         return self._hash_idx * hash(self.iri)
 
 
 class OWLObjectProperty(OWLProperty, OWLObjectPropertyExpression):
+    __slots__ = ()
+
     _hash_idx = 127
 
     def __init__(self, property_iri_or_iri_str):
-        self.iri = self._init_iri(property_iri_or_iri_str)
+        set_field(self, 'iri', self._init_iri(property_iri_or_iri_str))
 
     def __hash__(self):
         return self._hash_idx * hash(self.iri)
 
 
 class OWLObjectInverseOf(OWLObjectPropertyExpression):
+    __slots__ = ('inverse_property',)
+
     _hash_idx = 131
 
     def __init__(self, inverse_property: OWLObjectProperty):
-        self.inverse_property = inverse_property
+        set_field(self, 'inverse_property', inverse_property)
+
+        init_hash(self)
 
     def __eq__(self, other):
-        if not isinstance(other, OWLObjectInverseOf):
+        if self is other:
+            return True
+        elif not isinstance(other, OWLObjectInverseOf):
             return False
         else:
             return self.inverse_property == other.inverse_property
 
+    @cached_hash
     def __hash__(self):
         return self._hash_idx * hash(self.inverse_property)
 
@@ -55,10 +69,12 @@ class OWLObjectInverseOf(OWLObjectPropertyExpression):
 
 
 class OWLDataProperty(OWLProperty):
+    __slots__ = ()
+
     _hash_idx = 137
 
     def __init__(self, property_iri_or_iri_str):
-        self.iri = self._init_iri(property_iri_or_iri_str)
+        set_field(self, 'iri', self._init_iri(property_iri_or_iri_str))
 
     def __hash__(self):
         return self._hash_idx * hash(self.iri)
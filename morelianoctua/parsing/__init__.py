@@ -1,6 +1,92 @@
 from abc import ABC
 
 
+class OWLAxiomStream(object):
+    """
+    The axioms of an ontology document, parsed one at a time while iterating.
+
+    The prefixes and the ontology header (IRI, version IRI, imports and
+    ontology annotations) are read when the stream is created, so they are
+    available before the first axiom is parsed. A stream can only be iterated
+    once and should be closed (or used as context manager) to release the
+    underlying file.
+    """
+    def __init__(
+            self,
+            prefix_declarations: dict,
+            axioms,
+            ontology_iri=None,
+            version_iri=None,
+            annotations=None,
+            close_fn=None,
+            imports=None):
+
+        self.prefixes = prefix_declarations
+        self.iri = ontology_iri
+        self.version_iri = version_iri
+
+        if annotations is not None:
+            self.annotations = annotations
+        else:
+            self.annotations = []
+
+        if imports is not None:
+            self.imports = imports
+        else:
+            self.imports = []
+
+        self._axioms = axioms
+        self._close_fn = close_fn
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._axioms)
+        except StopIteration:
+            self.close()
+            raise
+
+    def close(self):
+        if self._close_fn is not None:
+            self._close_fn()
+            self._close_fn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 class OWLParser(ABC):
     def parse_file(self, file_path):
         pass
+
+    def parse_stream(self, stream):
+        pass
+
+    def parse_many(self, paths, workers=None):
+        pass
+
+    def iter_axioms(self, file_path) -> OWLAxiomStream:
+        pass
+
+    def scan_header(self, file_path):
+        pass
+
+    def scan_declarations(self, file_path):
+        pass
+
+    def index_file(self, file_path, index_path=None):
+        pass
+
+    def load_axioms_at(self, file_path, offsets):
+        pass
+
+    def parse_document(self, file_path):
+        pass
+
+    def reparse_document(self, previous, file_path):
+        pass
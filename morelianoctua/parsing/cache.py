@@ -0,0 +1,129 @@
+"""
+Binary snapshots of parsed ontologies, stored in a cache directory under the
+hash of the content of the parsed document.
+
+Snapshots are pickles, so a cache directory must not be writable by
+untrusted users.
+"""
+import datetime
+import decimal
+import gc
+import hashlib
+import os
+import pickle
+import tempfile
+
+import rdflib
+from rdflib import Literal, URIRef
+
+from morelianoctua.model import OWLOntology
+
+# to be increased whenever the model classes change incompatibly
+SNAPSHOT_FORMAT_VERSION = 5
+
+_hash_chunk_size = 1 << 20
+
+# Literals are restored without re-running the conversion of their lexical
+# form which depends on the attributes of rdflib's Literal implementation
+_fast_literals = Literal.__slots__ == ('_language', '_datatype', '_value')
+_plain_literal_value_types = {
+    type(None), str, bool, int, float, decimal.Decimal, datetime.date,
+    datetime.time, datetime.datetime}
+
+
+def snapshot_path(cache_dir, file_path, parser_key) -> str:
+    """Returns the path of the snapshot of the document at file_path.
+
+    parser_key identifies the parser configuration the document is parsed
+    with, since e.g. a different set of default prefixes can lead to a
+    different ontology for the same document.
+    """
+    content_hash = hashlib.sha256()
+    content_hash.update(
+        f'{SNAPSHOT_FORMAT_VERSION} {rdflib.__version__} {parser_key}\n'
+        .encode('utf-8'))
+
+    with open(file_path, 'rb') as document_file:
+        for chunk in iter(lambda: document_file.read(_hash_chunk_size), b''):
+            content_hash.update(chunk)
+
+    return os.path.join(cache_dir, f'{content_hash.hexdigest()}.pickle')
+
+
+def load_snapshot(path) -> OWLOntology:
+    """Returns the ontology stored at path or None if there is no usable
+    snapshot
+    """
+    # the cyclic garbage collector would run over and over again while the
+    # objects of the model are created, but none of them can be garbage yet
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        with open(path, 'rb') as snapshot_file:
+            ontology = pickle.load(snapshot_file)
+    except Exception:
+        # the document of a missing, truncated or otherwise broken snapshot
+        # is parsed again and the snapshot replaced
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    if not isinstance(ontology, OWLOntology):
+        return None
+
+    return ontology
+
+
+def save_snapshot(ontology: OWLOntology, path):
+    """Stores ontology at path. The snapshot is written to a temporary file
+    first, so concurrent readers never see a partial snapshot.
+    """
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+
+    try:
+        with os.fdopen(fd, 'wb') as snapshot_file:
+            _SnapshotPickler(
+                snapshot_file, pickle.HIGHEST_PROTOCOL).dump(ontology)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _restore_iri(iri):
+    return str.__new__(URIRef, iri)
+
+
+def _restore_literal(lexical_form, language, datatype, value):
+    literal = str.__new__(Literal, lexical_form)
+    literal._language = language
+    literal._datatype = datatype
+    literal._value = value
+
+    return literal
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """Pickles the IRIs and literals of an ontology in a way that they can
+    be restored without validating and converting them again, which would
+    make up most of the loading time
+    """
+    def reducer_override(self, obj):
+        obj_type = type(obj)
+
+        if obj_type is URIRef:
+            return _restore_iri, (str(obj),)
+
+        elif obj_type is Literal and _fast_literals and \
+                type(obj.value) in _plain_literal_value_types:
+            return _restore_literal, (
+                str(obj), obj.language, obj.datatype, obj.value)
+
+        else:
+            return NotImplemented
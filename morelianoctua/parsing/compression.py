@@ -0,0 +1,46 @@
+"""
+Transparent decompression of ontology documents compressed with gzip, bzip2
+or xz. The compression is detected from the magic bytes at the beginning of
+the file, independent of its name.
+"""
+import bz2
+import gzip
+import lzma
+from typing import Optional
+
+_decompressors = {
+    'gzip': (b'\x1f\x8b', gzip.open),
+    'bz2': (b'BZh', bz2.open),
+    'xz': (b'\xfd7zXZ\x00', lzma.open),
+}
+
+_max_magic_length = max(
+    len(magic) for magic, _ in _decompressors.values())
+
+
+def detect_compression(file_path) -> Optional[str]:
+    """Returns 'gzip', 'bz2' or 'xz' if the file at file_path is compressed
+    and None otherwise
+    """
+    with open(file_path, 'rb') as document_file:
+        header = document_file.read(_max_magic_length)
+
+    for compression, (magic, _) in _decompressors.items():
+        if header.startswith(magic):
+            return compression
+
+    return None
+
+
+def open_document(file_path):
+    """Opens the document at file_path for reading bytes. Compressed
+    documents are decompressed while they are read.
+    """
+    compression = detect_compression(file_path)
+
+    if compression is None:
+        return open(file_path, 'rb')
+
+    _, open_fn = _decompressors[compression]
+
+    return open_fn(file_path, 'rb')
@@ -0,0 +1,794 @@
+import mmap
+import re
+
+from rdflib import Literal as RDFLiteral
+from rdflib import URIRef, BNode
+
+from morelianoctua.model import OWLOntology
+from morelianoctua.model.axioms.assertionaxiom import \
+    OWLDataPropertyAssertionAxiom, OWLObjectPropertyAssertionAxiom, \
+    OWLClassAssertionAxiom
+from morelianoctua.model.axioms.classaxiom import OWLSubClassOfAxiom, \
+    OWLEquivalentClassesAxiom, OWLDisjointClassesAxiom, OWLDisjointUnionAxiom
+from morelianoctua.model.axioms.declarationaxiom import \
+    OWLClassDeclarationAxiom, OWLDatatypeDeclarationAxiom, \
+    OWLObjectPropertyDeclarationAxiom, OWLDataPropertyDeclarationAxiom, \
+    OWLAnnotationPropertyDeclarationAxiom, OWLNamedIndividualDeclarationAxiom
+from morelianoctua.model.axioms.owldatapropertyaxiom import \
+    OWLDataPropertyDomainAxiom, OWLDataPropertyRangeAxiom
+from morelianoctua.model.axioms.owlobjectpropertyaxiom import \
+    OWLObjectPropertyRangeAxiom, OWLObjectPropertyDomainAxiom, \
+    OWLInverseObjectPropertiesAxiom, OWLDisjointObjectPropertiesAxiom, \
+    OWLEquivalentObjectPropertiesAxiom, OWLSubObjectPropertyOfAxiom
+from morelianoctua.model.objects.annotation import OWLAnnotation
+from morelianoctua.model.objects.classexpression import OWLClass, \
+    OWLObjectIntersectionOf, OWLObjectUnionOf, OWLObjectComplementOf, \
+    OWLObjectOneOf, OWLObjectSomeValuesFrom, OWLObjectAllValuesFrom, \
+    OWLObjectHasValue, OWLObjectHasSelf, OWLDataSomeValuesFrom, \
+    OWLDataAllValuesFrom, OWLDataHasValue, OWLObjectExactCardinality, \
+    OWLObjectMaxCardinality, OWLObjectMinCardinality, \
+    OWLDataExactCardinality, OWLDataMaxCardinality, OWLDataMinCardinality
+from morelianoctua.model.objects.datarange import OWLDataIntersectionOf, \
+    OWLDataUnionOf, OWLDataComplementOf, OWLDatatype, OWLDataOneOf, \
+    OWLDatatypeRestriction
+from morelianoctua.model.objects.facet import OWLFacetRestriction
+from morelianoctua.model.objects.individual import OWLAnonymousIndividual, \
+    OWLNamedIndividual
+from morelianoctua.model.objects.property import OWLAnnotationProperty, \
+    OWLObjectProperty, OWLDataProperty, OWLObjectInverseOf
+from morelianoctua.parsing.compression import detect_compression
+from morelianoctua.parsing.functional import FunctionalSyntaxParser, \
+    ParseContext
+from morelianoctua.parsing.scanner import iter_elements, iter_buffer_elements
+
+# Comments are matched outside of the capturing group and thus show up as
+# empty strings in the findall() result. Whitespace is skipped by findall()
+# itself. The last alternative catches stray characters (e.g. an unterminated
+# quoted string) so that they are reported by the parser instead of being
+# silently dropped.
+_token_pattern = re.compile(
+    r'#[^\n]*|('
+    r'<[^>]*>|'                 # full IRI
+    r'"(?:[^"\\]|\\.)*"|'       # quoted string
+    r'[()=]|'
+    r'\^\^|'
+    r'@[A-Za-z0-9\-]+|'         # language tag
+    r'[^\s()<>"=^@#]+|'         # keyword, abbreviated IRI, node ID, integer
+    r'\S)',
+    re.DOTALL)
+
+_escape_pattern = re.compile(r'\\(.)', re.DOTALL)
+
+
+def _tokenize(text):
+    return [t for t in _token_pattern.findall(text) if t]
+
+
+class _TokenParser(object):
+    """Predictive recursive-descent parser working on the token list of one
+    input string. A keyword followed by an opening parenthesis selects the
+    production to apply, everything else is an IRI, a literal, or a node ID,
+    so no backtracking is needed.
+    """
+    def __init__(self, tokens, context: ParseContext):
+        self.tokens = tokens
+        self.pos = 0
+        self.context = context
+
+        # rdflib validates every new URIRef character by character, so
+        # resolved IRIs are kept for the repeated occurrences of a token
+        self.iris = context.iris
+        self.entity = context.entity
+        self.intern = context.intern
+
+    def error(self, msg):
+        return RuntimeError(f'{msg} (at token {self.pos})')
+
+    def next(self):
+        try:
+            token = self.tokens[self.pos]
+        except IndexError:
+            raise self.error('Unexpected end of input')
+
+        self.pos += 1
+        return token
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        else:
+            return None
+
+    def expect(self, expected):
+        token = self.next()
+
+        if token != expected:
+            raise self.error(f'Expected {expected} but found {token}')
+
+    def at_call(self):
+        """Whether the current token is a keyword followed by '('"""
+        pos = self.pos + 1
+        return pos < len(self.tokens) and self.tokens[pos] == '('
+
+    def expect_end(self):
+        if self.pos != len(self.tokens):
+            raise self.error(f'Unexpected token {self.tokens[self.pos]}')
+
+    def call(self, table, kind):
+        keyword = self.next()
+        parse_fn = table.get(keyword)
+
+        if parse_fn is None:
+            raise self.error(f'Unsupported {kind} {keyword}')
+
+        self.expect('(')
+        return parse_fn(self)
+
+    def repeat(self, parse_fn, minimum):
+        """Applies parse_fn until the closing parenthesis is reached and
+        consumes the parenthesis
+        """
+        parsed = []
+        tokens = self.tokens
+
+        while self.pos < len(tokens) and tokens[self.pos] != ')':
+            parsed.append(parse_fn(self))
+
+        if len(parsed) < minimum:
+            raise self.error(
+                f'Expected at least {minimum} arguments but got {len(parsed)}')
+
+        self.expect(')')
+        return parsed
+
+    # -- terminals ------------------------------------------------------------
+
+    def iri(self, token=None):
+        if token is None:
+            token = self.next()
+
+        try:
+            return self.iris[token]
+        except KeyError:
+            pass
+
+        if token[0] == '<':
+            return self.context.cache_iri(token, URIRef(token[1:-1]))
+
+        try:
+            return self.context.expand_curie(token)
+        except KeyError:
+            raise self.error(f'Unknown prefix in {token}')
+
+    def literal(self):
+        token = self.next()
+
+        if token[0] != '"':
+            raise self.error(f'Expected a literal but found {token}')
+
+        lexical_form = token[1:-1]
+        if '\\' in lexical_form:
+            lexical_form = _escape_pattern.sub(r'\1', lexical_form)
+
+        next_token = self.peek()
+
+        if next_token == '^^':
+            self.pos += 1
+            # resolved as an entity like in the grammar, so entity factories
+            # see the datatypes of literals as well
+            datatype = self.entity(OWLDatatype, self.iri())
+
+            return self.context.literal(lexical_form, None, datatype.iri)
+
+        elif next_token is not None and next_token[0] == '@':
+            self.pos += 1
+            return self.context.literal(lexical_form, next_token[1:])
+
+        else:
+            return self.context.literal(lexical_form)
+
+    def non_negative_integer(self):
+        token = self.next()
+
+        if not token.isdigit():
+            raise self.error(
+                f'Expected a non-negative integer but found {token}')
+
+        return int(token)
+
+    def individual(self):
+        token = self.next()
+
+        if token.startswith('_:'):
+            return self.intern(OWLAnonymousIndividual(BNode(token[2:])))
+        else:
+            return self.entity(OWLNamedIndividual, self.iri(token))
+
+    def owl_class(self):
+        return self.entity(OWLClass, self.iri())
+
+    def data_property(self):
+        return self.entity(OWLDataProperty, self.iri())
+
+    def object_property_expression(self):
+        if self.peek() == 'ObjectInverseOf' and self.at_call():
+            self.pos += 2
+            obj_prop = self.entity(OWLObjectProperty, self.iri())
+            self.expect(')')
+
+            return self.intern(OWLObjectInverseOf(obj_prop))
+
+        return self.entity(OWLObjectProperty, self.iri())
+
+    # -- annotations ----------------------------------------------------------
+
+    def annotation(self):
+        self.expect('Annotation')
+        self.expect('(')
+        ann_prop = self.entity(OWLAnnotationProperty, self.iri())
+
+        token = self.peek()
+        if token is None:
+            raise self.error('Unexpected end of input')
+        elif token[0] == '"':
+            value = self.literal()
+        elif token.startswith('_:'):
+            value = self.individual()
+        else:
+            value = self.iri()
+
+        self.expect(')')
+
+        return OWLAnnotation(ann_prop, value)
+
+    def axiom_annotations(self):
+        annotations = []
+
+        while self.peek() == 'Annotation' and self.at_call():
+            annotations.append(self.annotation())
+
+        return annotations
+
+    # -- class expressions and data ranges ------------------------------------
+
+    def class_expression(self):
+        if self.at_call():
+            return self.intern(
+                self.call(_class_expression_parsers, 'class expression'))
+        else:
+            return self.entity(OWLClass, self.iri())
+
+    def data_range(self):
+        if self.at_call():
+            return self.intern(self.call(_data_range_parsers, 'data range'))
+        else:
+            return self.entity(OWLDatatype, self.iri())
+
+    # -- axioms ---------------------------------------------------------------
+
+    def axiom(self):
+        return self.call(_axiom_parsers, 'axiom type')
+
+    # -- ontology document ----------------------------------------------------
+
+    def prefix_declaration(self):
+        self.expect('Prefix')
+        self.expect('(')
+        prefix_name = self.next()
+
+        if not prefix_name.endswith(':'):
+            raise self.error(f'Invalid prefix name {prefix_name}')
+
+        self.expect('=')
+        iri_token = self.next()
+
+        if iri_token[0] != '<':
+            raise self.error(f'Expected a full IRI but found {iri_token}')
+
+        self.expect(')')
+
+        prefix_name = prefix_name[:-1]
+        if not prefix_name:
+            prefix_name = OWLOntology.default_prefix_dummy
+
+        return prefix_name, URIRef(iri_token[1:-1])
+
+    def import_declaration(self) -> URIRef:
+        self.expect('Import')
+        self.expect('(')
+        iri = self.iri()
+        self.expect(')')
+
+        return iri
+
+    def ontology_document(self) -> OWLOntology:
+        prefixes = {}
+
+        while self.peek() == 'Prefix':
+            prefix_name, prefix_iri = self.prefix_declaration()
+            prefixes[prefix_name] = prefix_iri
+
+        # the context is created for this parse, so the document prefixes
+        # can be added to it
+        self.context.add_prefixes(prefixes)
+
+        self.expect('Ontology')
+        self.expect('(')
+
+        ontology_iri = None
+        version_iri = None
+
+        if self.peek() != ')' and not self.at_call():
+            ontology_iri = self.iri()
+
+            if self.peek() != ')' and not self.at_call():
+                version_iri = self.iri()
+
+        imports = []
+        while self.peek() == 'Import' and self.at_call():
+            imports.append(self.import_declaration())
+
+        annotations = self.axiom_annotations()
+
+        axioms = set()
+        tokens = self.tokens
+        while self.pos < len(tokens) and tokens[self.pos] != ')':
+            axioms.add(self.axiom())
+
+        self.expect(')')
+        self.expect_end()
+
+        return OWLOntology(
+            prefixes,
+            axioms,
+            ontology_iri=ontology_iri,
+            version_iri=version_iri,
+            annotations=annotations,
+            imports=imports)
+
+
+def _class_expressions(parser: _TokenParser, minimum):
+    return parser.repeat(_TokenParser.class_expression, minimum)
+
+
+def _data_ranges(parser: _TokenParser, minimum):
+    return parser.repeat(_TokenParser.data_range, minimum)
+
+
+def _optional_close(parser: _TokenParser, parse_fn):
+    if parser.peek() == ')':
+        parser.pos += 1
+        return None
+
+    parsed = parse_fn(parser)
+    parser.expect(')')
+
+    return parsed
+
+
+def _parse_object_intersection_of(parser):
+    return OWLObjectIntersectionOf(*_class_expressions(parser, 2))
+
+
+def _parse_object_union_of(parser):
+    return OWLObjectUnionOf(*_class_expressions(parser, 2))
+
+
+def _parse_object_complement_of(parser):
+    operand = parser.class_expression()
+    parser.expect(')')
+
+    return OWLObjectComplementOf(operand)
+
+
+def _parse_object_one_of(parser):
+    return OWLObjectOneOf(*parser.repeat(_TokenParser.individual, 1))
+
+
+def _parse_object_some_values_from(parser):
+    obj_prop = parser.object_property_expression()
+    filler = parser.class_expression()
+    parser.expect(')')
+
+    return OWLObjectSomeValuesFrom(obj_prop, filler)
+
+
+def _parse_object_all_values_from(parser):
+    obj_prop = parser.object_property_expression()
+    filler = parser.class_expression()
+    parser.expect(')')
+
+    return OWLObjectAllValuesFrom(obj_prop, filler)
+
+
+def _parse_object_has_value(parser):
+    obj_prop = parser.object_property_expression()
+    individual = parser.individual()
+    parser.expect(')')
+
+    return OWLObjectHasValue(obj_prop, individual)
+
+
+def _parse_object_has_self(parser):
+    obj_prop = parser.object_property_expression()
+    parser.expect(')')
+
+    return OWLObjectHasSelf(obj_prop)
+
+
+def _object_cardinality_parser(cardinality_cls):
+    def parse_fn(parser):
+        cardinality = parser.non_negative_integer()
+        obj_prop = parser.object_property_expression()
+        filler = _optional_close(parser, _TokenParser.class_expression)
+
+        if filler is None:
+            return cardinality_cls(obj_prop, cardinality)
+        else:
+            return cardinality_cls(obj_prop, cardinality, filler)
+
+    return parse_fn
+
+
+def _parse_data_some_values_from(parser):
+    data_prop = parser.data_property()
+    filler = parser.data_range()
+    parser.expect(')')
+
+    return OWLDataSomeValuesFrom(data_prop, filler)
+
+
+def _parse_data_all_values_from(parser):
+    data_prop = parser.data_property()
+    filler = parser.data_range()
+    parser.expect(')')
+
+    return OWLDataAllValuesFrom(data_prop, filler)
+
+
+def _parse_data_has_value(parser):
+    data_prop = parser.data_property()
+    value = parser.literal()
+    parser.expect(')')
+
+    return OWLDataHasValue(data_prop, value)
+
+
+def _data_cardinality_parser(cardinality_cls):
+    def parse_fn(parser):
+        cardinality = parser.non_negative_integer()
+        data_prop = parser.data_property()
+        filler = _optional_close(parser, _TokenParser.data_range)
+
+        if filler is None:
+            return cardinality_cls(data_prop, cardinality)
+        else:
+            return cardinality_cls(data_prop, cardinality, filler)
+
+    return parse_fn
+
+
+def _parse_data_intersection_of(parser):
+    return OWLDataIntersectionOf(*_data_ranges(parser, 2))
+
+
+def _parse_data_union_of(parser):
+    return OWLDataUnionOf(*_data_ranges(parser, 2))
+
+
+def _parse_data_complement_of(parser):
+    data_range = parser.data_range()
+    parser.expect(')')
+
+    return OWLDataComplementOf(data_range)
+
+
+def _parse_data_one_of(parser):
+    return OWLDataOneOf(*parser.repeat(_TokenParser.literal, 1))
+
+
+def _parse_datatype_restriction(parser):
+    dtype = parser.entity(OWLDatatype, parser.iri())
+    facet_restrictions = set()
+
+    while True:
+        facet = parser.iri()
+        restriction_value = parser.literal()
+        facet_restrictions.add(OWLFacetRestriction(facet, restriction_value))
+
+        if parser.peek() == ')':
+            parser.pos += 1
+            break
+
+    return OWLDatatypeRestriction(dtype, facet_restrictions)
+
+
+_class_expression_parsers = {
+    'ObjectIntersectionOf': _parse_object_intersection_of,
+    'ObjectUnionOf': _parse_object_union_of,
+    'ObjectComplementOf': _parse_object_complement_of,
+    'ObjectOneOf': _parse_object_one_of,
+    'ObjectSomeValuesFrom': _parse_object_some_values_from,
+    'ObjectAllValuesFrom': _parse_object_all_values_from,
+    'ObjectHasValue': _parse_object_has_value,
+    'ObjectHasSelf': _parse_object_has_self,
+    'ObjectMinCardinality':
+        _object_cardinality_parser(OWLObjectMinCardinality),
+    'ObjectMaxCardinality':
+        _object_cardinality_parser(OWLObjectMaxCardinality),
+    'ObjectExactCardinality':
+        _object_cardinality_parser(OWLObjectExactCardinality),
+    'DataSomeValuesFrom': _parse_data_some_values_from,
+    'DataAllValuesFrom': _parse_data_all_values_from,
+    'DataHasValue': _parse_data_has_value,
+    'DataMinCardinality': _data_cardinality_parser(OWLDataMinCardinality),
+    'DataMaxCardinality': _data_cardinality_parser(OWLDataMaxCardinality),
+    'DataExactCardinality': _data_cardinality_parser(OWLDataExactCardinality),
+}
+
+_data_range_parsers = {
+    'DataIntersectionOf': _parse_data_intersection_of,
+    'DataUnionOf': _parse_data_union_of,
+    'DataComplementOf': _parse_data_complement_of,
+    'DataOneOf': _parse_data_one_of,
+    'DatatypeRestriction': _parse_datatype_restriction,
+}
+
+
+def _declared_entity_parser(entity_cls, declaration_cls):
+    def parse_fn(parser):
+        entity = parser.entity(entity_cls, parser.iri())
+        parser.expect(')')
+
+        return entity, declaration_cls
+
+    return parse_fn
+
+
+_entity_parsers = {
+    'Class': _declared_entity_parser(OWLClass, OWLClassDeclarationAxiom),
+    'Datatype':
+        _declared_entity_parser(OWLDatatype, OWLDatatypeDeclarationAxiom),
+    'ObjectProperty': _declared_entity_parser(
+        OWLObjectProperty, OWLObjectPropertyDeclarationAxiom),
+    'DataProperty': _declared_entity_parser(
+        OWLDataProperty, OWLDataPropertyDeclarationAxiom),
+    'AnnotationProperty': _declared_entity_parser(
+        OWLAnnotationProperty, OWLAnnotationPropertyDeclarationAxiom),
+    'NamedIndividual': _declared_entity_parser(
+        OWLNamedIndividual, OWLNamedIndividualDeclarationAxiom),
+}
+
+
+def _parse_declaration(parser):
+    annotations = parser.axiom_annotations()
+    entity, declaration_cls = parser.call(_entity_parsers, 'entity type')
+    parser.expect(')')
+
+    return declaration_cls(entity, annotations)
+
+
+def _binary_axiom_parser(axiom_cls, parse_first, parse_second):
+    def parse_fn(parser):
+        annotations = parser.axiom_annotations()
+        first = parse_first(parser)
+        second = parse_second(parser)
+        parser.expect(')')
+
+        if annotations:
+            return axiom_cls(first, second, set(annotations))
+        else:
+            return axiom_cls(first, second)
+
+    return parse_fn
+
+
+def _nary_axiom_parser(axiom_cls, parse_fn):
+    def nary_parse_fn(parser):
+        annotations = parser.axiom_annotations()
+        operands = set(parser.repeat(parse_fn, 2))
+
+        if annotations:
+            return axiom_cls(operands, set(annotations))
+        else:
+            return axiom_cls(operands)
+
+    return nary_parse_fn
+
+
+def _parse_disjoint_union(parser):
+    annotations = parser.axiom_annotations()
+    owl_class = parser.owl_class()
+    class_expressions = set(_class_expressions(parser, 2))
+
+    if annotations:
+        return OWLDisjointUnionAxiom(
+            owl_class, class_expressions, set(annotations))
+    else:
+        return OWLDisjointUnionAxiom(owl_class, class_expressions)
+
+
+def _parse_class_assertion(parser):
+    annotations = parser.axiom_annotations()
+    class_expression = parser.class_expression()
+    individual = parser.individual()
+    parser.expect(')')
+
+    if annotations:
+        return OWLClassAssertionAxiom(
+            individual, class_expression, set(annotations))
+    else:
+        return OWLClassAssertionAxiom(individual, class_expression)
+
+
+def _parse_object_property_assertion(parser):
+    annotations = parser.axiom_annotations()
+    obj_prop = parser.object_property_expression()
+    subject_individual = parser.individual()
+    object_individual = parser.individual()
+    parser.expect(')')
+
+    if annotations:
+        return OWLObjectPropertyAssertionAxiom(
+            subject_individual, obj_prop, object_individual, set(annotations))
+    else:
+        return OWLObjectPropertyAssertionAxiom(
+            subject_individual, obj_prop, object_individual)
+
+
+def _parse_data_property_assertion(parser):
+    annotations = parser.axiom_annotations()
+    data_prop = parser.data_property()
+    subject_individual = parser.individual()
+    value = parser.literal()
+    parser.expect(')')
+
+    if annotations:
+        return OWLDataPropertyAssertionAxiom(
+            subject_individual, data_prop, value, set(annotations))
+    else:
+        return OWLDataPropertyAssertionAxiom(
+            subject_individual, data_prop, value)
+
+
+_axiom_parsers = {
+    'Declaration': _parse_declaration,
+    'SubClassOf': _binary_axiom_parser(
+        OWLSubClassOfAxiom,
+        _TokenParser.class_expression,
+        _TokenParser.class_expression),
+    'EquivalentClasses': _nary_axiom_parser(
+        OWLEquivalentClassesAxiom, _TokenParser.class_expression),
+    'DisjointClasses': _nary_axiom_parser(
+        OWLDisjointClassesAxiom, _TokenParser.class_expression),
+    'DisjointUnion': _parse_disjoint_union,
+    'SubObjectPropertyOf': _binary_axiom_parser(
+        OWLSubObjectPropertyOfAxiom,
+        _TokenParser.object_property_expression,
+        _TokenParser.object_property_expression),
+    'EquivalentObjectProperties': _nary_axiom_parser(
+        OWLEquivalentObjectPropertiesAxiom,
+        _TokenParser.object_property_expression),
+    'DisjointObjectProperties': _nary_axiom_parser(
+        OWLDisjointObjectPropertiesAxiom,
+        _TokenParser.object_property_expression),
+    'InverseObjectProperties': _binary_axiom_parser(
+        OWLInverseObjectPropertiesAxiom,
+        _TokenParser.object_property_expression,
+        _TokenParser.object_property_expression),
+    'ObjectPropertyDomain': _binary_axiom_parser(
+        OWLObjectPropertyDomainAxiom,
+        _TokenParser.object_property_expression,
+        _TokenParser.class_expression),
+    'ObjectPropertyRange': _binary_axiom_parser(
+        OWLObjectPropertyRangeAxiom,
+        _TokenParser.object_property_expression,
+        _TokenParser.class_expression),
+    'ClassAssertion': _parse_class_assertion,
+    'ObjectPropertyAssertion': _parse_object_property_assertion,
+    'DataPropertyAssertion': _parse_data_property_assertion,
+    'DataPropertyDomain': _binary_axiom_parser(
+        OWLDataPropertyDomainAxiom,
+        _TokenParser.data_property,
+        _TokenParser.class_expression),
+    'DataPropertyRange': _binary_axiom_parser(
+        OWLDataPropertyRangeAxiom,
+        _TokenParser.data_property,
+        _TokenParser.data_range),
+}
+
+
+class FastFunctionalSyntaxParser(FunctionalSyntaxParser):
+    """
+    Drop-in replacement for the pyparsing based FunctionalSyntaxParser.
+
+    The input is split into tokens by a single regular expression and then
+    processed by a predictive recursive-descent parser that dispatches on the
+    keyword in front of each opening parenthesis. It supports the same subset
+    of the OWL 2 functional syntax and builds the same model objects as the
+    pyparsing grammar.
+    """
+    def _token_parser(self, text) -> _TokenParser:
+        return _TokenParser(_tokenize(text), self._begin_document({}))
+
+    def _parse(self, text, parse_fn):
+        parser = self._token_parser(text)
+        parsed = parse_fn(parser)
+        parser.expect_end()
+
+        return parsed
+
+    def parse_string(self, text) -> OWLOntology:
+        return self._token_parser(text).ontology_document()
+
+    def _parse_file(self, file_path, axiom_filter=None) -> OWLOntology:
+        if detect_compression(file_path) is not None:
+            return self._parse_scanned_file(file_path, axiom_filter)
+
+        # the document is scanned in place in a memory map and only the text
+        # of the element currently parsed is copied out and decoded
+        with open(file_path, 'rb') as ontology_file:
+            try:
+                buffer = mmap.mmap(
+                    ontology_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # empty files, pipes etc. can't be mapped
+                return self._parse_elements(
+                    iter_elements(ontology_file), axiom_filter)
+
+            with buffer:
+                return self._parse_elements(
+                    iter_buffer_elements(buffer), axiom_filter)
+
+    def _parse_prefix_element(self, text) -> dict:
+        prefix_name, prefix_iri = \
+            self._token_parser(text).prefix_declaration()
+
+        return {prefix_name: prefix_iri}
+
+    @staticmethod
+    def _parse_element(context: ParseContext, text, parse_fn):
+        # the resolved IRIs are kept in the context to be re-used for all
+        # elements of the document
+        parser = _TokenParser(_tokenize(text), context)
+        parsed = parse_fn(parser)
+        parser.expect_end()
+
+        return parsed
+
+    def _parse_iri_element(self, context, text) -> URIRef:
+        return self._parse_element(context, text, _TokenParser.iri)
+
+    def _parse_import_element(self, context, text) -> URIRef:
+        return self._parse_element(
+            context, text, _TokenParser.import_declaration)
+
+    def _parse_annotation_element(self, context, text) -> OWLAnnotation:
+        return self._parse_element(context, text, _TokenParser.annotation)
+
+    def _parse_axiom_element(self, context, text):
+        return self._parse_element(context, text, _TokenParser.axiom)
+
+    def parse_axiom(self, text):
+        return self._parse(text, _TokenParser.axiom)
+
+    def parse_class_expression(self, text):
+        return self._parse(text, _TokenParser.class_expression)
+
+    def parse_data_range(self, text):
+        return self._parse(text, _TokenParser.data_range)
+
+    def parse_object_property_expression(self, text):
+        return self._parse(text, _TokenParser.object_property_expression)
+
+    def parse_individual(self, text):
+        return self._parse(text, _TokenParser.individual)
+
+    def parse_annotation(self, text) -> OWLAnnotation:
+        return self._parse(text, _TokenParser.annotation)
+
+    def parse_literal(self, text) -> RDFLiteral:
+        return self._parse(text, _TokenParser.literal)
+
+    def parse_iri(self, text) -> URIRef:
+        return self._parse(text, _TokenParser.iri)
@@ -1,5 +1,17 @@
-from pyparsing import Literal, alphas, Word, OneOrMore, nums, Optional, \
-    ZeroOrMore, alphanums, lineEnd, printables, Combine, White, Forward
+import inspect
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from io import BytesIO, TextIOBase
+from itertools import chain
+from typing import NamedTuple, Union
+
+from pyparsing import Literal, alphas, Word, nums, Optional, \
+    ZeroOrMore, alphanums, LineEnd, printables, Combine, White, Forward, \
+    ParserElement, ParseException, ParseBaseException, Regex
 from rdflib import Literal as RDFLiteral
 from rdflib import URIRef, BNode
 
@@ -20,6 +32,8 @@ from morelianoctua.model.axioms.owlobjectpropertyaxiom import \
     OWLObjectPropertyRangeAxiom, OWLObjectPropertyDomainAxiom, \
     OWLInverseObjectPropertiesAxiom, OWLDisjointObjectPropertiesAxiom, \
     OWLEquivalentObjectPropertiesAxiom, OWLSubObjectPropertyOfAxiom
+from morelianoctua.model.datafactory import OWLDataFactory, \
+    DEFAULT_DATA_FACTORY
 from morelianoctua.model.objects import HasIRI
 from morelianoctua.model.objects.annotation import OWLAnnotation
 from morelianoctua.model.objects.classexpression import OWLClass, \
@@ -34,13 +48,281 @@ from morelianoctua.model.objects.datarange import OWLDataIntersectionOf, OWLData
 from morelianoctua.model.objects.facet import OWLFacetRestriction
 from morelianoctua.model.objects.individual import OWLAnonymousIndividual, \
     OWLNamedIndividual
+from morelianoctua.model.objects.literal import lazy_literal
 from morelianoctua.model.objects.property import OWLAnnotationProperty, \
     OWLObjectProperty, OWLDataProperty, OWLObjectInverseOf, \
     OWLObjectPropertyExpression
-from morelianoctua.parsing import OWLParser
+from morelianoctua.parsing import OWLParser, OWLAxiomStream
+from morelianoctua.parsing.cache import snapshot_path, load_snapshot, \
+    save_snapshot
+from morelianoctua.parsing.compression import detect_compression, \
+    open_document
+from morelianoctua.parsing.incremental import ParsedDocument, AxiomSpan, \
+    AxiomDiff, axiom_digest
+from morelianoctua.parsing.index import AxiomIndex, default_index_path
+from morelianoctua.parsing.profiler import ParseProfiler
+from morelianoctua.parsing.scanner import iter_elements, DocumentElement, \
+    DEFAULT_CHUNK_SIZE
+
+
+class ParseContext(object):
+    """The state of a single parse, i.e. the prefixes in effect, the IRIs
+    resolved so far, and the entities created so far.
+
+    Entities (classes, properties, named individuals and datatypes) are
+    interned: all occurrences of an entity in the parsed document share one
+    instance, which is taken from the data_factory. If an entity_factory is
+    given, it is called with the entity class and the IRI instead. Class
+    expressions, data ranges and inverse object properties are interned
+    with the data_factory as well (see OWLDataFactory).
+
+    With lazy_literals=True literals are created as LazyLiterals where
+    possible, which convert their lexical form to a value on first access.
+
+    Grammars with packrat parsing enabled memoize the results of their
+    elements in the packrat_cache of the context, if it has one.
+    """
+    def __init__(
+            self, prefixes: dict, entity_factory=None, lazy_literals=False,
+            data_factory: OWLDataFactory = None,
+            packrat_cache: '_PackratCache' = None):
+        self.prefixes = prefixes
+        # memo of the IRIs resolved from abbreviated or full IRI tokens
+        self.iris = {}
+        # the IRIs of the prefixes as str which concatenates faster
+        self._namespaces = {}
+        self.entities = {}
+        self._entity_factory = entity_factory
+
+        if data_factory is None:
+            data_factory = DEFAULT_DATA_FACTORY
+
+        self.data_factory = data_factory
+        self.intern = data_factory.intern
+        self.packrat_cache = packrat_cache
+
+        if lazy_literals:
+            self.literal = lazy_literal
+        else:
+            self.literal = RDFLiteral
 
+    def add_prefixes(self, prefixes: dict):
+        self.prefixes.update(prefixes)
+        self._namespaces.clear()
+        self.iris.clear()
 
-class FunctionalSyntaxParser(OWLParser):
+    def cache_iri(self, token, iri: URIRef) -> URIRef:
+        """Remembers the IRI resolved from token. The number of cached IRIs
+        is bounded to keep the memory use of long parses in check.
+        """
+        if len(self.iris) >= _max_cached_iris:
+            self.iris.clear()
+
+        self.iris[token] = iri
+
+        return iri
+
+    def expand_curie(self, curie) -> URIRef:
+        """Expands an abbreviated IRI like ex:Cls. The prefix name ends at
+        the first colon, so local names may contain colons. Names without
+        colon and an empty prefix name refer to the default prefix. Raises a
+        KeyError if the prefix isn't declared.
+        """
+        try:
+            return self.iris[curie]
+        except KeyError:
+            pass
+
+        prefix_name, colon, local_name = curie.partition(':')
+
+        if not colon:
+            prefix_name = OWLOntology.default_prefix_dummy
+            local_name = curie
+        elif not prefix_name:
+            prefix_name = OWLOntology.default_prefix_dummy
+
+        try:
+            namespace = self._namespaces[prefix_name]
+        except KeyError:
+            namespace = str(self.prefixes[prefix_name])
+            self._namespaces[prefix_name] = namespace
+
+        return self.cache_iri(curie, URIRef(namespace + local_name))
+
+    def entity(self, entity_cls, iri):
+        if self._entity_factory is not None:
+            return self._entity_factory(entity_cls, iri)
+
+        key = (entity_cls, iri)
+
+        try:
+            return self.entities[key]
+        except KeyError:
+            entity = self.data_factory.entity(entity_cls, iri)
+            self.entities[key] = entity
+
+            return entity
+
+
+# Maximum number of IRIs cached by a ParseContext
+_max_cached_iris = 100000
+
+
+class _PackratCache(object):
+    """The results of the elements of a grammar parsed at a location of the
+    input during a single parse. At most size results are kept, the oldest
+    ones are evicted first.
+    """
+    def __init__(self, size):
+        self._size = size
+        self._results = OrderedDict()
+
+    def get(self, key):
+        return self._results.get(key)
+
+    def set(self, key, result):
+        results = self._results
+        results[key] = result
+
+        if len(results) > self._size:
+            results.popitem(last=False)
+
+
+def _elements(grammar: 'FunctionalSyntaxGrammar'):
+    """Yields every element of grammar, including unnamed sub-elements, once
+    """
+    elements = [
+        element for element in vars(grammar).values()
+        if isinstance(element, ParserElement)]
+    seen = set()
+
+    while elements:
+        element = elements.pop()
+
+        if id(element) in seen:
+            continue
+
+        seen.add(id(element))
+        yield element
+
+        elements.extend(getattr(element, 'exprs', ()))
+        if getattr(element, 'expr', None) is not None:
+            elements.append(element.expr)
+
+
+def _prepare(grammar: 'FunctionalSyntaxGrammar'):
+    """Does the work pyparsing does on the first use of the elements of
+    grammar, so that parses running in several threads don't do it
+    concurrently: streamlining the elements, which rewrites their
+    sub-elements, and detecting the arguments each parse action takes,
+    which pyparsing does by calling it until it doesn't raise a TypeError.
+    """
+    for element in _elements(grammar):
+        element.streamline()
+        element.parseAction = [
+            _fixed_arity_action(action) for action in element.parseAction]
+
+
+def _fixed_arity_action(action):
+    """Returns a parse action taking the string, location and tokens which
+    calls the function action was created from by pyparsing's _trim_arity()
+    with the trailing arguments it accepts
+    """
+    code = getattr(action, '__code__', None)
+    if code is None or 'func' not in code.co_freevars:
+        return action
+
+    func = action.__closure__[code.co_freevars.index('func')].cell_contents
+
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        # builtins without signature are called with the tokens by pyparsing
+        # without detection
+        return action
+
+    num_args = 0
+    for parameter in parameters:
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            num_args = 3
+        elif parameter.kind in (
+                parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD):
+            num_args += 1
+
+    num_skipped = 3 - min(num_args, 3)
+
+    def fixed_arity_action(string, loc, tokens):
+        return func(*(string, loc, tokens)[num_skipped:])
+
+    fixed_arity_action.__name__ = action.__name__
+
+    return fixed_arity_action
+
+
+def _enable_packrat(grammar: 'FunctionalSyntaxGrammar'):
+    """Makes all elements of grammar memoize their results in the packrat
+    cache of the ParseContext of the current parse (packrat parsing).
+
+    Unlike ParserElement.enablePackrat() this only affects the elements of
+    grammar, and only while they parse with a context having a cache, so
+    other grammars and other pyparsing users in the process aren't
+    affected. For this the grammar must not contain elements shared with
+    others, like pyparsing's module-level lineEnd.
+    """
+    for element in _elements(grammar):
+        # pyparsing calls the _parse() method of the sub-elements, which is
+        # overridden per element like ParserElement.setBreak() does
+        element._parse = _memoizing_parse(grammar, element)
+
+
+def _memoizing_parse(grammar: 'FunctionalSyntaxGrammar', element):
+    """Returns the _parse() method of element for packrat parsing, which
+    works like pyparsing's ParserElement._parseCache() with the cache of
+    the current parse
+    """
+    parse = element._parseNoCache
+
+    def memoizing_parse(instring, loc, doActions=True, callPreParse=True):
+        cache = grammar.context.packrat_cache
+
+        if cache is None:
+            return parse(instring, loc, doActions, callPreParse)
+
+        key = (element, instring, loc, callPreParse, doActions)
+        result = cache.get(key)
+
+        if result is None:
+            try:
+                loc, tokens = parse(instring, loc, doActions, callPreParse)
+            except ParseBaseException as exception:
+                # a copy without the traceback
+                cache.set(key, type(exception)(*exception.args))
+                raise
+
+            cache.set(key, (loc, tokens.copy()))
+
+            return loc, tokens
+
+        elif isinstance(result, ParseBaseException):
+            raise result
+
+        else:
+            loc, tokens = result
+
+            return loc, tokens.copy()
+
+    return memoizing_parse
+
+# Full IRIs and quoted strings are matched as single tokens. The IRI pattern
+# excludes the characters which may not appear in an IRI unescaped (see
+# RFC 3987); the quoted string pattern allows any character but an unescaped
+# double quote or backslash, including line breaks.
+_full_iri_pattern = re.compile(r'<[^<>"{}|^`\\\x00-\x20]*>')
+_quoted_string_pattern = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_escape_pattern = re.compile(r'\\(.)', re.DOTALL)
+
+
+class FunctionalSyntaxGrammar(object):
     """
     Definition from
     https://www.w3.org/TR/owl2-syntax/#Canonical_Parsing_of_OWL_2_Ontologies:
@@ -57,8 +339,17 @@ class FunctionalSyntaxParser(OWLParser):
     versionIRI := IRI
     directlyImportsDocuments := { 'Import' '(' IRI ')' }
     axioms := { Axiom }
+
+    The grammar is built only once per process and shared by all
+    FunctionalSyntaxParser instances. Parse actions which depend on the
+    document being parsed (like the prefixes) read the ParseContext of the
+    parse running in their thread, so several threads can parse with the
+    grammar at the same time without locking.
     """
-    def __init__(self, prefixes=None):
+    def __init__(self):
+        # the context of the parse running in the current thread
+        self._local = threading.local()
+
         # helper literals
         self.open_paren = Literal('(')
         self.close_paren = Literal(')')
@@ -81,26 +372,14 @@ class FunctionalSyntaxParser(OWLParser):
 
         # local part
         # FIXME: this is highly simplified!
-        self.pn_local = Word(alphanums + '_', alphanums + '-_.')
+        self.pn_local = Word(alphanums + '_:', alphanums + '-_.:')
 
         self.pn_prefix = Word(alphas, alphanums + '_-.')
         self.prefix_name = Optional(self.pn_prefix) + self.colon
 
-        # FIXME: this is just to get started; not a correct expression for IRIs!
-        self.full_iri = (
-            self.open_angle.suppress() +
-            OneOrMore(
-                Word(alphanums) |
-                self.colon |
-                self.dash |
-                self.slash |
-                self.dot |
-                self.hsh |
-                self.question_mark |
-                self.underscore |
-                self.percent) +
-            self.close_angle.suppress())\
-            .addParseAction(lambda parsed: URIRef(''.join(parsed)))
+        # fullIRI := '<' IRI as defined in [RFC3987] '>'
+        self.full_iri = Regex(_full_iri_pattern).setName('full_iri')\
+            .addParseAction(self._create_iri)
 
         self.prefix_decl = \
             self.prefix_name + \
@@ -112,7 +391,7 @@ class FunctionalSyntaxParser(OWLParser):
             self.open_paren.suppress() +
             self.prefix_decl +
             self.close_paren.suppress() +
-            lineEnd.suppress()).addParseAction(self._create_prefix)
+            LineEnd().suppress()).addParseAction(self._create_prefix)
 
         self.prefix_declarations = \
             ZeroOrMore(self.prefix_declaration)\
@@ -132,24 +411,26 @@ class FunctionalSyntaxParser(OWLParser):
 
         self.comment = (
             self.hsh +
-            ZeroOrMore(Word(printables), lineEnd) +
-            lineEnd).suppress()
+            ZeroOrMore(Word(printables), LineEnd()) +
+            LineEnd()).suppress()
 
-        # FIXME: Imports are ignored
-        self.directly_imports_documents = Optional(
-            Literal('Import') +
-            self.open_paren +
+        self.import_declaration = (
+            Literal('Import').suppress() +
+            self.open_paren.suppress() +
             self.iri +
-            self.close_paren).suppress()
+            self.close_paren.suppress()
+        ).addParseAction(self._create_import)
+
+        self.directly_imports_documents = ZeroOrMore(
+            self.import_declaration | self.comment)
 
         self.node_id = '_:' + Word(alphanums)
 
-        self.quoted_string = (
-            self.double_quotes.suppress() +
-            ZeroOrMore(Word(alphanums + "'-_.:,;*+?`´=)(&%$§!<>|")) +
-            self.double_quotes.suppress()
-        ).setName('quoted_string').addParseAction(
-            lambda parsed: ' '.join(parsed))
+        # quotedString := a finite sequence of characters in which " (U+22)
+        #   and \ (U+5C) occur only in pairs of the form \" and \\,
+        #   enclosed in a pair of " (U+22) characters
+        self.quoted_string = Regex(_quoted_string_pattern)\
+            .setName('quoted_string').addParseAction(self._unquote)
 
         self.lexical_form = self.quoted_string
 
@@ -157,7 +438,7 @@ class FunctionalSyntaxParser(OWLParser):
             (self.full_iri | self.abbreviated_iri) +
             ~ self.open_paren
         ).setName('datatype').addParseAction(
-            lambda parsed: OWLDatatype(parsed[0]))
+            self._entity_action(OWLDatatype))
 
         # typedLiteral := lexicalForm '^^' Datatype
         self.typed_literal = \
@@ -246,18 +527,20 @@ class FunctionalSyntaxParser(OWLParser):
         # DataRange := Datatype | DataIntersectionOf | DataUnionOf |
         #   DataComplementOf | DataOneOf | DatatypeRestriction
         self.data_range << (
-            self.datatype |
-            self.data_intersection_of |
-            self.data_union_of |
-            self.data_complement_of |
-            self.data_one_of |
-            self.datatype_restriction
+            self.datatype | (
+                self.data_intersection_of |
+                self.data_union_of |
+                self.data_complement_of |
+                self.data_one_of |
+                self.datatype_restriction
+            ).addParseAction(self._intern_action)
         ).setName('data_range')
 
         self.anonymous_individual = (
             '_:' + Word(alphanums)
         ).setName('anon_indiv').addParseAction(
-            lambda parsed: OWLAnonymousIndividual(BNode(parsed[1])))
+            lambda parsed: self.context.intern(
+                OWLAnonymousIndividual(BNode(parsed[1]))))
 
         self.annotation_value = (
                 self.anonymous_individual |
@@ -267,7 +550,7 @@ class FunctionalSyntaxParser(OWLParser):
         self.annotation_property = (
             self.full_iri | self.abbreviated_iri
         ).setName('ann_prop').addParseAction(
-            lambda parsed: OWLAnnotationProperty(parsed[0]))
+            self._entity_action(OWLAnnotationProperty))
 
         self.annotation = (
             Literal('Annotation').suppress() +
@@ -279,7 +562,7 @@ class FunctionalSyntaxParser(OWLParser):
 
         # ontologyAnnotations := { Annotation }
         self.ontology_annotations = ZeroOrMore(self.annotation)
-        self.empty_line = White() + lineEnd
+        self.empty_line = White() + LineEnd()
 
         self.axiom_annotations = ZeroOrMore(self.annotation)
 
@@ -287,28 +570,28 @@ class FunctionalSyntaxParser(OWLParser):
         # ObjectUnionOf was recognized as abbreviated class IRI
         self.class_ = (
             self.full_iri | self.abbreviated_iri + ~self.open_paren
-        ).setName('class').addParseAction(lambda parsed: OWLClass(parsed[0]))
+        ).setName('class').addParseAction(self._entity_action(OWLClass))
 
         self.obj_prop = (
             ~ Literal('ObjectInverseOf') +
             (self.full_iri | self.abbreviated_iri)
         ).setName('obj_prop').addParseAction(
-            lambda parsed: OWLObjectProperty(parsed[0]))
+            self._entity_action(OWLObjectProperty))
 
         self.data_prop = (
             self.full_iri | self.abbreviated_iri
         ).setName('data_prop').addParseAction(
-            lambda parsed: OWLDataProperty(parsed[0]))
+            self._entity_action(OWLDataProperty))
 
         self.ann_prop = (
             self.full_iri | self.abbreviated_iri
         ).setName('ann_prop').addParseAction(
-            lambda parsed: OWLAnnotationProperty(parsed[0]))
+            self._entity_action(OWLAnnotationProperty))
 
         self.named_indiv = (
             self.full_iri | self.abbreviated_iri
         ).setName('named_individual').addParseAction(
-            lambda parsed: OWLNamedIndividual(parsed[0]))
+            self._entity_action(OWLNamedIndividual))
 
         self.individual = self.named_indiv | self.anonymous_individual
 
@@ -318,7 +601,9 @@ class FunctionalSyntaxParser(OWLParser):
             self.open_paren.suppress() +
             self.obj_prop +
             self.close_paren.suppress()
-        ).addParseAction(lambda obj_props: OWLObjectInverseOf(obj_props[0]))
+        ).addParseAction(
+            lambda obj_props: self.context.intern(
+                OWLObjectInverseOf(obj_props[0])))
 
         # ObjectPropertyExpression := ObjectProperty | InverseObjectProperty
         self.object_property_expression = (
@@ -329,7 +614,7 @@ class FunctionalSyntaxParser(OWLParser):
         self.data_property_expression = (
             self.full_iri | self.abbreviated_iri
         ).setName('data_prop_expr').addParseAction(
-            lambda parsed: OWLDataProperty(parsed[0]))
+            self._entity_action(OWLDataProperty))
 
         # Entity :=
         #   'Class' '(' Class ')' |
@@ -551,7 +836,8 @@ class FunctionalSyntaxParser(OWLParser):
             self.open_paren.suppress() +
             self.non_negative_integer +
             self.data_property_expression +
-            Optional(self.data_range)
+            Optional(self.data_range) +
+            self.close_paren.suppress()
         ).setName('data_min_cardinality').addParseAction(
             self._create_data_min_cardinality)
 
@@ -590,24 +876,25 @@ class FunctionalSyntaxParser(OWLParser):
         #     DataHasValue | DataMinCardinality | DataMaxCardinality |
         #     DataExactCardinality
         self.class_expression << (
-            self.class_ |
-            self.object_union_of |
-            self.object_intersection_of |
-            self.object_complement_of |
-            self.object_one_of |
-            self.object_some_values_from |
-            self.object_all_values_from |
-            self.object_has_value |
-            self.object_has_self |
-            self.object_min_cardinality |
-            self.object_max_cardinality |
-            self.object_exact_cardinality |
-            self.data_some_values_from |
-            self.data_all_values_from |
-            self.data_has_value |
-            self.data_min_cardinality |
-            self.data_max_cardinality |
-            self.data_exact_cardinality
+            self.class_ | (
+                self.object_union_of |
+                self.object_intersection_of |
+                self.object_complement_of |
+                self.object_one_of |
+                self.object_some_values_from |
+                self.object_all_values_from |
+                self.object_has_value |
+                self.object_has_self |
+                self.object_min_cardinality |
+                self.object_max_cardinality |
+                self.object_exact_cardinality |
+                self.data_some_values_from |
+                self.data_all_values_from |
+                self.data_has_value |
+                self.data_min_cardinality |
+                self.data_max_cardinality |
+                self.data_exact_cardinality
+            ).addParseAction(self._intern_action)
         )
 
         # SubClassOf := 'SubClassOf' '(' axiomAnnotations subClassExpression
@@ -881,9 +1168,11 @@ class FunctionalSyntaxParser(OWLParser):
             Literal('Ontology').suppress() + \
             self.open_paren.suppress() + \
             ZeroOrMore(self.comment) + \
-            Optional(self.ontology_iri + Optional(self.version_iri)) + \
+            Optional(
+                self.ontology_iri + ~self.open_paren +
+                Optional(self.version_iri + ~self.open_paren)) + \
             ZeroOrMore(self.comment) + \
-            Optional(self.directly_imports_documents) + \
+            self.directly_imports_documents + \
             ZeroOrMore(self.comment) + \
             Optional(self.ontology_annotations) + \
             ZeroOrMore(self.comment) + \
@@ -897,10 +1186,43 @@ class FunctionalSyntaxParser(OWLParser):
             self.ontology
         ).addParseAction(self._create_ontology)
 
-        if prefixes is None:
-            self._prefixes = dict()
-        else:
-            self._prefixes = prefixes
+        # pyparsing expands tabs before parsing by default, which would change
+        # the lexical forms of literals containing tabs
+        for element in vars(self).values():
+            if isinstance(element, ParserElement):
+                element.parseWithTabs()
+
+        _prepare(self)
+
+    @property
+    def context(self) -> ParseContext:
+        """The ParseContext of the parse running in the current thread"""
+        return getattr(self._local, 'context', None)
+
+    def _entity_action(self, entity_cls):
+        """Returns a parse action creating an entity of type entity_cls from
+        the parsed IRI
+        """
+        return lambda parsed: self.context.entity(entity_cls, parsed[0])
+
+    def _intern_action(self, parsed):
+        """Parse action replacing a parsed class expression or data range by
+        the equal one interned in the data factory of the parse
+        """
+        return self.context.intern(parsed[0])
+
+    @contextmanager
+    def parsing(self, context: ParseContext):
+        """Makes context the context of the parse run inside of the with
+        block by the current thread
+        """
+        previous_context = self.context
+        self._local.context = context
+
+        try:
+            yield self
+        finally:
+            self._local.context = previous_context
 
     @staticmethod
     def _create_ontology(parsed) -> OWLOntology:
@@ -911,12 +1233,16 @@ class FunctionalSyntaxParser(OWLParser):
         ontology_iri = None
         ontology_version_iri = None
         annotations = []
+        imports = []
         axioms = set()
 
         for part in parts:
             if isinstance(part, dict):
                 prefixes = part
 
+            elif isinstance(part, _Import):
+                imports.append(part.iri)
+
             elif isinstance(part, OWLAxiom):
                 axioms.add(part)
 
@@ -937,7 +1263,8 @@ class FunctionalSyntaxParser(OWLParser):
             axioms,
             ontology_iri=ontology_iri,
             version_iri=ontology_version_iri,
-            annotations=annotations)
+            annotations=annotations,
+            imports=imports)
 
     @staticmethod
     def _create_dtype_restriction(parsed) -> OWLDatatypeRestriction:
@@ -1298,19 +1625,19 @@ class FunctionalSyntaxParser(OWLParser):
             raise RuntimeError(f'Unknown declaration type for '
                                f'{declared_entity}')
 
-    @staticmethod
-    def _create_literal(parsed) -> RDFLiteral:
+    def _create_literal(self, parsed) -> RDFLiteral:
         if len(parsed) == 1:
-            return RDFLiteral(parsed[0])
+            return self.context.literal(parsed[0])
 
         elif len(parsed) == 2:
             lexical_val, lang_or_type = parsed
 
             if isinstance(lang_or_type, URIRef) \
                     or isinstance(lang_or_type, HasIRI):
-                return RDFLiteral(lexical_val, None, lang_or_type.iri)
+                return self.context.literal(
+                    lexical_val, None, lang_or_type.iri)
             else:
-                return RDFLiteral(lexical_val, lang_or_type)
+                return self.context.literal(lexical_val, lang_or_type)
 
         else:
             raise RuntimeError(
@@ -1322,18 +1649,33 @@ class FunctionalSyntaxParser(OWLParser):
 
         return OWLAnnotation(ann_prop, ann_value)
 
-    def _create_full_iri(self, parsed) -> URIRef:
-        parts = parsed[0].split(':')
-        parts = [p for p in parts if not p == '']
+    def _create_iri(self, parsed) -> URIRef:
+        token = parsed[0]
 
-        if len(parts) == 1:
-            uri_part1 = self._prefixes[OWLOntology.default_prefix_dummy]
-            uri_part2 = parts[0]
-        else:
-            uri_part1 = self._prefixes[parts[0]]
-            uri_part2 = parts[1]
+        try:
+            return self.context.iris[token]
+        except KeyError:
+            return self.context.cache_iri(token, URIRef(token[1:-1]))
+
+    def _create_full_iri(self, string, loc, parsed) -> URIRef:
+        try:
+            return self.context.expand_curie(parsed[0])
+        except KeyError:
+            raise ParseException(
+                string, loc, f'Unknown prefix in {parsed[0]}')
+
+    @staticmethod
+    def _unquote(parsed) -> str:
+        lexical_form = parsed[0][1:-1]
+
+        if '\\' in lexical_form:
+            lexical_form = _escape_pattern.sub(r'\1', lexical_form)
 
-        return URIRef(uri_part1 + uri_part2)
+        return lexical_form
+
+    @staticmethod
+    def _create_import(parsed) -> '_Import':
+        return _Import(parsed[0])
 
     @staticmethod
     def _create_prefix(parsed) -> dict:
@@ -1351,7 +1693,7 @@ class FunctionalSyntaxParser(OWLParser):
         for prefix in prefixes:
             res.update(prefix)
 
-        self._prefixes = res
+        self.context.add_prefixes(res)
         return res
 
     def __dbg__(self, parsed):
@@ -1360,8 +1702,860 @@ class FunctionalSyntaxParser(OWLParser):
         a = 23
         return parsed
 
-    def parse_file(self, file_path):
-        return self.ontology_document.parseFile(file_path, True)[0]
+
+# packrat parsing enabled --> the grammar shared by the parsers
+_grammars = {}
+_grammar_lock = threading.Lock()
+
+
+def _shared_grammar(packrat=False) -> FunctionalSyntaxGrammar:
+    grammar = _grammars.get(packrat)
+
+    if grammar is None:
+        with _grammar_lock:
+            grammar = _grammars.get(packrat)
+
+            if grammar is None:
+                grammar = FunctionalSyntaxGrammar()
+                if packrat:
+                    _enable_packrat(grammar)
+
+                _grammars[packrat] = grammar
+
+    return grammar
+
+
+class _BoundElement(object):
+    """An element of the shared grammar which parses with the prefixes of a
+    parser
+    """
+    def __init__(self, element: ParserElement, parser):
+        self._element = element
+        self._parser = parser
+
+    def parseString(self, text, parseAll=False):
+        with self._parser._parsing(self._parser._begin_document({})):
+            return self._element.parseString(text, parseAll)
+
+    def parseFile(self, file_path, parseAll=False):
+        with self._parser._parsing(self._parser._begin_document({})):
+            return self._element.parseFile(file_path, parseAll)
+
+
+class FunctionalSyntaxParser(OWLParser):
+    """
+    Parses OWL 2 functional syntax documents with the FunctionalSyntaxGrammar.
+
+    The grammar is built on first use and shared by all parsers of a process.
+    The state of a parse is kept in a ParseContext, so one parser can be used
+    from several threads at the same time. The elements of the grammar are
+    accessible as attributes of the parser, e.g. parser.axiom.parseString(),
+    and parse with the prefixes the parser was created with.
+
+    All occurrences of an entity in a parsed document share one instance.
+    Entities, class expressions and data ranges are created through the
+    data_factory, DEFAULT_DATA_FACTORY unless another one is passed, so
+    equal ones are shared with other documents and with the objects the
+    application builds through the factory. To create entities differently,
+    an entity_factory can be passed (see ParseContext).
+
+    Setting packrat_cache_size enables the memoization of intermediate parse
+    results (packrat parsing) which avoids re-parsing sub-expressions shared
+    by alternatives of the grammar. Each parse has a cache of its own which
+    keeps at most packrat_cache_size results, older ones are evicted first.
+    Only the parsers asking for it parse with memoization; they share a
+    grammar of their own. On this grammar most alternatives fail on their
+    first keyword, so memoization costs more than it saves: in
+    benchmarks/packrat.py it makes parsing about two times slower and the
+    peak memory grows with the cache size. It is off by default.
+
+    With lazy_literals=True the lexical forms of literals are converted to
+    Python values only when the value of a literal is accessed (see
+    LazyLiteral). This saves most of the time spent on literals in data
+    heavy documents.
+
+    If a ParseProfiler is passed as profiler, the parser builds a grammar of
+    its own which records the time spent in each rule and parse action (see
+    morelianoctua.parsing.profiler). Axioms parsed by worker processes
+    aren't profiled, and the parses of the parser are serialized.
+    """
+    def __init__(
+            self, prefixes=None, packrat_cache_size=None, entity_factory=None,
+            profiler: ParseProfiler = None, lazy_literals=False,
+            data_factory: OWLDataFactory = None):
+        if prefixes is None:
+            self._prefixes = dict()
+        else:
+            self._prefixes = prefixes
+
+        self._packrat_cache_size = packrat_cache_size
+        self._entity_factory = entity_factory
+        self._lazy_literals = lazy_literals
+        self._data_factory = data_factory
+        self._profiler = profiler
+        self._profiled_grammar = None
+        # the profiler records the rules being matched in a single stack
+        self._profiler_lock = threading.RLock()
+
+    def __getattr__(self, name):
+        if not name.startswith('_'):
+            element = getattr(self._grammar(), name, None)
+
+            if isinstance(element, ParserElement):
+                return _BoundElement(element, self)
+
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def parse_file(
+            self, file_path, workers=None, cache_dir=None, include=None,
+            exclude=None) -> OWLOntology:
+        """Parses the ontology document at file_path.
+
+        include and exclude are lists of axiom types (like
+        OWLSubClassOfAxiom or OWLClassAxiom) to restrict the parsed axioms
+        to. Axioms of other types are only scanned over, but not parsed.
+
+        If workers is greater than 1 the axioms are parsed in a pool of that
+        many processes. The axioms are split at the boundaries of top-level
+        elements into byte ranges which are then parsed independently with the
+        prefixes declared in the document.
+
+        Documents compressed with gzip, bzip2 or xz are decompressed while
+        they are parsed. They are always parsed in a single process since
+        the workers can't seek to their byte ranges.
+
+        If a cache_dir is given, a snapshot of the parsed ontology is stored
+        there under the hash of the document content and loaded instead of
+        parsing the same document again. The entity_factory isn't used for
+        ontologies loaded from a snapshot.
+        """
+        axiom_filter = None
+        if include is not None or exclude is not None:
+            axiom_filter = _AxiomFilter(include, exclude)
+
+        if cache_dir is not None:
+            path = snapshot_path(
+                cache_dir, file_path, self._snapshot_key(axiom_filter))
+            ontology = load_snapshot(path)
+
+            if ontology is None:
+                ontology = self.parse_file(
+                    file_path, workers, include=include, exclude=exclude)
+                save_snapshot(ontology, path)
+
+            return ontology
+
+        elif workers is not None and workers > 1 and \
+                detect_compression(file_path) is None:
+            return self._parse_file_in_parallel(
+                file_path, workers, axiom_filter)
+        else:
+            return self._parse_file(file_path, axiom_filter)
+
+    def _snapshot_key(self, axiom_filter):
+        """Identifies the configuration of the parser which influences the
+        parsed ontology
+        """
+        prefixes = sorted(
+            (prefix_name, str(iri))
+            for prefix_name, iri in self._prefixes.items())
+
+        return f'{type(self).__module__}.{type(self).__qualname__} ' \
+            f'{prefixes} {axiom_filter} lazy_literals={self._lazy_literals}'
+
+    def _parse_file(self, file_path, axiom_filter=None) -> OWLOntology:
+        if axiom_filter is not None or \
+                detect_compression(file_path) is not None:
+            # the grammar for whole documents can't skip axioms and would
+            # need the whole decompressed document in memory
+            return self._parse_scanned_file(file_path, axiom_filter)
+
+        with self._parsing(self._begin_document({})) as grammar:
+            return grammar.ontology_document.parseFile(file_path, True)[0]
+
+    def _grammar(self) -> FunctionalSyntaxGrammar:
+        packrat = self._packrat_cache_size is not None
+
+        if self._profiler is None:
+            return _shared_grammar(packrat)
+
+        if self._profiled_grammar is None:
+            with _grammar_lock:
+                if self._profiled_grammar is None:
+                    grammar = FunctionalSyntaxGrammar()
+                    self._profiler.install(grammar)
+                    if packrat:
+                        _enable_packrat(grammar)
+
+                    self._profiled_grammar = grammar
+
+        return self._profiled_grammar
+
+    @contextmanager
+    def _parsing(self, context: ParseContext):
+        """Parses with the grammar of the parser inside of the with block"""
+        grammar = self._grammar()
+
+        if self._profiler is None:
+            with grammar.parsing(context):
+                yield grammar
+        else:
+            with self._profiler_lock, grammar.parsing(context), \
+                    self._profiler.profiling():
+                yield grammar
+
+    def parse_stream(
+            self, stream, chunk_size=DEFAULT_CHUNK_SIZE, include=None,
+            exclude=None) -> OWLOntology:
+        """Parses the ontology document read from the file-like object
+        stream, e.g. a pipe or a response body, in chunks of chunk_size
+        bytes. The axioms are parsed while the document is still being
+        received. Text streams are read as UTF-8 encoded bytes.
+        """
+        axiom_filter = None
+        if include is not None or exclude is not None:
+            axiom_filter = _AxiomFilter(include, exclude)
+
+        if isinstance(stream, TextIOBase):
+            stream = _EncodingReader(stream)
+
+        return self._parse_elements(
+            iter_elements(stream, chunk_size), axiom_filter)
+
+    def _parse_scanned_file(
+            self, file_path, axiom_filter=None) -> OWLOntology:
+        """Parses the document at file_path element by element while it's
+        read and, if necessary, decompressed
+        """
+        with open_document(file_path) as ontology_file:
+            return self._parse_elements(
+                iter_elements(ontology_file), axiom_filter)
+
+    def _parse_file_in_parallel(
+            self, file_path, workers, axiom_filter=None) -> OWLOntology:
+        batch_size = \
+            os.path.getsize(file_path) // (workers * _batches_per_worker)
+        batch_size = max(_min_batch_size, min(_max_batch_size, batch_size))
+
+        with open(file_path, 'rb') as ontology_file:
+            elements = iter_elements(ontology_file)
+            header = self._read_header(elements)
+
+            with ProcessPoolExecutor(workers) as executor:
+                # the ranges are submitted while the document is still being
+                # scanned, so that the workers can start right away
+                futures = [
+                    executor.submit(
+                        _parse_axiom_range,
+                        type(self),
+                        header.context.prefixes,
+                        self._lazy_literals,
+                        file_path,
+                        start,
+                        end,
+                        axiom_filter,
+                        self._packrat_cache_size)
+                    for start, end in _axiom_ranges(
+                        header.first_axiom_element, elements, batch_size)]
+
+                axioms = set()
+                for future in futures:
+                    axioms.update(future.result())
+
+        return header.ontology(axioms)
+
+    def parse_many(self, paths, workers=None):
+        """Parses the ontology documents at paths and yields (path,
+        ontology) pairs as the documents are parsed.
+
+        Unless the parser has an entity_factory, entities are shared by all
+        documents parsed in the same process and taken from the data_factory
+        of the parser. If workers is greater than 1, the documents are parsed
+        in batches by a pool of that many processes, each of which builds the
+        grammar only once, and the pairs are yielded in the order the batches
+        complete. Entities are shared within a batch then and created through
+        the default data factory of the worker process, so they aren't the
+        instances of the data_factory of the parser.
+        """
+        paths = list(paths)
+
+        if workers is None or workers < 2 or len(paths) < 2:
+            parser = self
+            if self._entity_factory is None:
+                parser = type(self)(
+                    prefixes=self._prefixes,
+                    packrat_cache_size=self._packrat_cache_size,
+                    entity_factory=_EntityTable(
+                        self._data_factory or DEFAULT_DATA_FACTORY),
+                    profiler=self._profiler,
+                    lazy_literals=self._lazy_literals,
+                    data_factory=self._data_factory)
+
+            for file_path in paths:
+                yield file_path, parser.parse_file(file_path)
+
+            return
+
+        batch_size = len(paths) // (workers * _batches_per_worker)
+        batch_size = max(1, min(_max_documents_per_batch, batch_size))
+
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [
+                executor.submit(
+                    _parse_documents,
+                    type(self),
+                    self._prefixes,
+                    self._packrat_cache_size,
+                    self._lazy_literals,
+                    paths[start:start + batch_size])
+                for start in range(0, len(paths), batch_size)]
+
+            for future in as_completed(futures):
+                yield from future.result()
+
+    def iter_axioms(
+            self, file_path, include=None, exclude=None) -> OWLAxiomStream:
+        """Parses the axioms of the ontology document at file_path one by one
+        while the returned stream is iterated. Only the axiom currently being
+        parsed is held in memory. include and exclude restrict the parsed
+        axiom types like in parse_file().
+        """
+        axiom_filter = None
+        if include is not None or exclude is not None:
+            axiom_filter = _AxiomFilter(include, exclude)
+
+        ontology_file = open_document(file_path)
+
+        try:
+            return self._axiom_stream(ontology_file, axiom_filter)
+        except Exception:
+            ontology_file.close()
+            raise
+
+    def scan_header(self, file_path) -> OWLOntology:
+        """Reads only the prefixes and the ontology header (IRI, version IRI,
+        imports and ontology annotations) of the document at file_path. The
+        returned ontology has no axioms.
+        """
+        with open_document(file_path) as ontology_file:
+            header = self._read_header(
+                iter_elements(ontology_file, _header_chunk_size))
+
+        return header.ontology(set())
+
+    def scan_declarations(self, file_path) -> OWLOntology:
+        """Reads the ontology header and the Declaration(...) axioms of the
+        document at file_path. All other axioms are only scanned, but not
+        parsed.
+        """
+        with open_document(file_path) as ontology_file:
+            return self._parse_elements(
+                iter_elements(ontology_file), _declarations_filter)
+
+    def index_file(self, file_path, index_path=None) -> AxiomIndex:
+        """Parses the axioms of the document at file_path and writes an index
+        of their byte offsets and the entities they mention to index_path
+        (by default the path of the document followed by .index). The index
+        can be read with morelianoctua.parsing.index.load_index() and its
+        offsets passed to load_axioms_at().
+        """
+        if detect_compression(file_path) is not None:
+            raise RuntimeError(f'Compressed document {file_path} cannot be '
+                               f'indexed')
+
+        if index_path is None:
+            index_path = default_index_path(file_path)
+
+        stat = os.stat(file_path)
+        index = AxiomIndex(stat.st_size, stat.st_mtime_ns)
+
+        # the axioms are only parsed to find the entities they mention, so
+        # their literals don't need to be converted
+        recorder = _EntityRecorder()
+        parser = type(self)(
+            prefixes=self._prefixes, entity_factory=recorder,
+            lazy_literals=True)
+
+        with open(file_path, 'rb') as ontology_file:
+            elements = iter_elements(ontology_file)
+            header = parser._read_header(elements)
+
+            for element in header.axiom_elements(elements):
+                _check_axiom_element(element)
+
+                recorder.iris.clear()
+                parser._parse_axiom_element(
+                    header.context, element.text.decode('utf-8'))
+                index.add(element.start, recorder.iris)
+
+        index.save(index_path)
+
+        return index
+
+    def load_axioms_at(self, file_path, offsets) -> list:
+        """Parses only the axioms starting at the byte offsets of the
+        document at file_path (e.g. taken from an AxiomIndex) and returns
+        them in the order of the offsets
+        """
+        if detect_compression(file_path) is not None:
+            raise RuntimeError(f'Compressed document {file_path} cannot be '
+                               f'read at offsets')
+
+        axioms = []
+
+        with open(file_path, 'rb') as ontology_file:
+            header = self._read_header(
+                iter_elements(ontology_file, _header_chunk_size))
+
+            for offset in offsets:
+                ontology_file.seek(offset)
+                element = next(
+                    iter_elements(
+                        ontology_file, _axiom_chunk_size, in_ontology=True,
+                        offset=offset),
+                    None)
+
+                if element is None or element.start != offset:
+                    raise RuntimeError(f'No axiom at byte {offset}')
+
+                _check_axiom_element(element)
+                axioms.append(self._parse_axiom_element(
+                    header.context, element.text.decode('utf-8')))
+
+        return axioms
+
+    def parse_document(self, file_path) -> ParsedDocument:
+        """Parses the document at file_path like parse_file() but also keeps
+        the byte spans and the digests of the texts of its axioms, so that
+        the document can be re-parsed with reparse_document() after it was
+        edited
+        """
+        return self._parse_document(file_path)[0]
+
+    def reparse_document(self, previous: ParsedDocument, file_path):
+        """Re-parses the document at file_path which was parsed into
+        previous before it was edited. The document is scanned again, but
+        only the axioms whose text isn't found in previous are parsed. All
+        other axioms are taken over from previous, unless the prefixes of the
+        document changed.
+
+        Returns the new ParsedDocument and an AxiomDiff of the axioms added
+        to and removed from the ontology of previous.
+        """
+        return self._parse_document(file_path, previous)
+
+    def _parse_document(self, file_path, previous=None):
+        with open_document(file_path) as ontology_file:
+            elements = iter_elements(ontology_file)
+            header = self._read_header(elements)
+            context = header.context
+
+            previous_axioms = {}
+            if previous is not None:
+                context.entities = dict(previous.entities)
+
+                if previous.prefixes == context.prefixes:
+                    previous_axioms = previous.axioms_by_digest()
+
+            spans = []
+            axioms = set()
+            parsed = []
+            reused = set()
+
+            for element in header.axiom_elements(elements):
+                _check_axiom_element(element)
+                digest = axiom_digest(element.text)
+
+                try:
+                    axiom = previous_axioms[digest]
+                    reused.add(digest)
+                except KeyError:
+                    axiom = self._parse_axiom_element(
+                        context, element.text.decode('utf-8'))
+                    parsed.append(axiom)
+
+                spans.append(
+                    AxiomSpan(element.start, element.end, digest, axiom))
+                axioms.add(axiom)
+
+        document = ParsedDocument(
+            header.ontology(axioms), context.prefixes, spans,
+            context.entities)
+
+        if previous is None:
+            return document, AxiomDiff(axioms, set())
+
+        # only the axioms of changed spans need to be compared with the
+        # axioms of the other version
+        if previous_axioms:
+            dropped = [
+                axiom for digest, axiom in previous_axioms.items()
+                if digest not in reused]
+        else:
+            dropped = previous.ontology.axioms
+
+        added = {
+            axiom for axiom in parsed
+            if axiom not in previous.ontology.axioms}
+        removed = {axiom for axiom in dropped if axiom not in axioms}
+
+        return document, AxiomDiff(added, removed)
+
+    def _axiom_stream(
+            self, binary_file, axiom_filter=None) -> OWLAxiomStream:
+        elements = iter_elements(binary_file)
+        header = self._read_header(elements)
+
+        return OWLAxiomStream(
+            header.prefixes,
+            self._iter_axiom_elements(
+                header.context, header.axiom_elements(elements),
+                axiom_filter),
+            ontology_iri=header.ontology_iri,
+            version_iri=header.version_iri,
+            annotations=header.annotations,
+            close_fn=binary_file.close,
+            imports=header.imports)
+
+    def _read_header(self, elements) -> '_DocumentHeader':
+        """Consumes the prefix declarations and the ontology header from the
+        scanned document elements
+        """
+        prefixes = {}
+        context = None
+        ontology_iri = None
+        version_iri = None
+        imports = []
+        annotations = []
+        first_axiom_element = None
+
+        for element in elements:
+            text = element.text.decode('utf-8')
+
+            if element.depth == 0:
+                if element.keyword == 'Prefix':
+                    prefixes.update(self._parse_prefix_element(text))
+                elif element.keyword == 'Ontology':
+                    context = self._begin_document(prefixes)
+                else:
+                    raise RuntimeError(
+                        f'Unexpected {element.keyword} outside of the '
+                        f'ontology at byte {element.start}')
+
+            elif element.keyword is None:
+                if ontology_iri is None:
+                    ontology_iri = self._parse_iri_element(context, text)
+                elif version_iri is None:
+                    version_iri = self._parse_iri_element(context, text)
+                else:
+                    raise RuntimeError(
+                        f'Unexpected IRI {text} at byte {element.start}')
+
+            elif element.keyword == 'Import':
+                imports.append(self._parse_import_element(context, text))
+
+            elif element.keyword == 'Annotation':
+                annotations.append(
+                    self._parse_annotation_element(context, text))
+
+            else:
+                first_axiom_element = element
+                break
+
+        if context is None:
+            raise RuntimeError('Missing Ontology( in the document')
+
+        return _DocumentHeader(
+            prefixes, context, ontology_iri, version_iri, imports,
+            annotations, first_axiom_element)
+
+    def _parse_elements(self, elements, axiom_filter=None) -> OWLOntology:
+        """Builds the ontology from the scanned elements of a document"""
+        header = self._read_header(elements)
+        axioms = set(self._iter_axiom_elements(
+            header.context, header.axiom_elements(elements), axiom_filter))
+
+        return header.ontology(axioms)
+
+    def _iter_axiom_elements(self, context, elements, axiom_filter=None):
+        for element in elements:
+            _check_axiom_element(element)
+
+            if axiom_filter is not None and \
+                    not axiom_filter.parses(element.keyword):
+                continue
+
+            axiom = self._parse_axiom_element(
+                context, element.text.decode('utf-8'))
+
+            if axiom_filter is None or axiom_filter.accepts(axiom):
+                yield axiom
+
+    # The following methods parse the single elements of a document read by
+    # the scanner and are overridden by other parsing engines
+
+    def _parse_prefix_element(self, text) -> dict:
+        return self._parse_with_grammar(
+            self._begin_document({}), 'prefix_declaration', text)
+
+    def _begin_document(self, prefixes: dict) -> ParseContext:
+        """Creates the context for parsing a document declaring prefixes"""
+        document_prefixes = dict(self._prefixes)
+        document_prefixes.update(prefixes)
+
+        packrat_cache = None
+        if self._packrat_cache_size is not None:
+            packrat_cache = _PackratCache(self._packrat_cache_size)
+
+        return ParseContext(
+            document_prefixes, self._entity_factory, self._lazy_literals,
+            self._data_factory, packrat_cache)
+
+    def _parse_iri_element(self, context, text) -> URIRef:
+        return self._parse_with_grammar(context, 'iri', text)
+
+    def _parse_import_element(self, context, text) -> URIRef:
+        return self._parse_with_grammar(
+            context, 'import_declaration', text).iri
+
+    def _parse_annotation_element(self, context, text) -> OWLAnnotation:
+        return self._parse_with_grammar(context, 'annotation', text)
+
+    def _parse_axiom_element(self, context, text) -> OWLAxiom:
+        return self._parse_with_grammar(context, 'axiom', text)
+
+    def _parse_with_grammar(self, context, element_name, text):
+        with self._parsing(context) as grammar:
+            return getattr(grammar, element_name).parseString(text, True)[0]
+
+
+class _EncodingReader(object):
+    """Reads the text of a text stream as UTF-8 encoded bytes"""
+    def __init__(self, text_stream: TextIOBase):
+        self._text_stream = text_stream
+
+    def read(self, size=-1) -> bytes:
+        return self._text_stream.read(size).encode('utf-8')
+
+
+class _Import(NamedTuple):
+    """The IRI of an Import(...) declaration, as distinguished from the
+    ontology IRI and version IRI in the parse results
+    """
+    iri: URIRef
+
+
+class _DocumentHeader(NamedTuple):
+    prefixes: dict
+    context: ParseContext
+    ontology_iri: Union[URIRef, None]
+    version_iri: Union[URIRef, None]
+    imports: list
+    annotations: list
+    first_axiom_element: Union[DocumentElement, None]
+
+    def axiom_elements(self, elements):
+        """Returns the axiom elements of the document given the elements
+        following the header
+        """
+        if self.first_axiom_element is None:
+            return iter(())
+
+        return chain([self.first_axiom_element], elements)
+
+    def ontology(self, axioms) -> OWLOntology:
+        return OWLOntology(
+            self.prefixes, axioms, self.ontology_iri, self.version_iri,
+            self.annotations, self.imports)
+
+
+# The keyword of the functional syntax element of each axiom type
+_axiom_keywords = {
+    OWLClassDeclarationAxiom: 'Declaration',
+    OWLDatatypeDeclarationAxiom: 'Declaration',
+    OWLObjectPropertyDeclarationAxiom: 'Declaration',
+    OWLDataPropertyDeclarationAxiom: 'Declaration',
+    OWLAnnotationPropertyDeclarationAxiom: 'Declaration',
+    OWLNamedIndividualDeclarationAxiom: 'Declaration',
+    OWLSubClassOfAxiom: 'SubClassOf',
+    OWLEquivalentClassesAxiom: 'EquivalentClasses',
+    OWLDisjointClassesAxiom: 'DisjointClasses',
+    OWLDisjointUnionAxiom: 'DisjointUnion',
+    OWLSubObjectPropertyOfAxiom: 'SubObjectPropertyOf',
+    OWLEquivalentObjectPropertiesAxiom: 'EquivalentObjectProperties',
+    OWLDisjointObjectPropertiesAxiom: 'DisjointObjectProperties',
+    OWLInverseObjectPropertiesAxiom: 'InverseObjectProperties',
+    OWLObjectPropertyDomainAxiom: 'ObjectPropertyDomain',
+    OWLObjectPropertyRangeAxiom: 'ObjectPropertyRange',
+    OWLDataPropertyDomainAxiom: 'DataPropertyDomain',
+    OWLDataPropertyRangeAxiom: 'DataPropertyRange',
+    OWLClassAssertionAxiom: 'ClassAssertion',
+    OWLObjectPropertyAssertionAxiom: 'ObjectPropertyAssertion',
+    OWLDataPropertyAssertionAxiom: 'DataPropertyAssertion',
+}
+
+
+class _AxiomFilter(object):
+    """Restricts the parsed axioms to the types in include (all types if
+    it's None) which aren't in exclude.
+
+    Elements are only parsed if their keyword belongs to an accepted axiom
+    type. Since all declarations share the Declaration keyword, the parsed
+    axioms are checked once more.
+    """
+    def __init__(self, include=None, exclude=None):
+        for axiom_type in [*(include or []), *(exclude or [])]:
+            if not (isinstance(axiom_type, type) and
+                    issubclass(axiom_type, OWLAxiom)):
+                raise RuntimeError(f'{axiom_type} is no axiom type')
+
+        self.include = None if include is None else tuple(include)
+        self.exclude = tuple(exclude or [])
+        self.keywords = frozenset(
+            keyword for axiom_type, keyword in _axiom_keywords.items()
+            if self._accepts_type(axiom_type))
+
+    def _accepts_type(self, axiom_type) -> bool:
+        return (self.include is None or issubclass(axiom_type, self.include)) \
+            and not issubclass(axiom_type, self.exclude)
+
+    def parses(self, keyword) -> bool:
+        # without include, unknown keywords are parsed to report them
+        return keyword in self.keywords or \
+            (self.include is None and keyword not in _filtered_keywords)
+
+    def accepts(self, axiom) -> bool:
+        return self._accepts_type(type(axiom))
+
+    def __str__(self):
+        def names(axiom_types):
+            return sorted(
+                f'{t.__module__}.{t.__qualname__}' for t in axiom_types)
+
+        include = None if self.include is None else names(self.include)
+
+        return f'include={include} exclude={names(self.exclude)}'
+
+
+_filtered_keywords = frozenset(_axiom_keywords.values())
+
+_declarations_filter = _AxiomFilter(include=[OWLDeclarationAxiom])
+
+
+# The header is usually found at the very beginning of a document, so only
+# small chunks are read when scanning for it
+_header_chunk_size = 1 << 16
+
+# Single axioms are read in small chunks when loaded at their offsets
+_axiom_chunk_size = 1 << 12
+
+# Bounds of the size of the byte ranges parsed by one worker process when
+# parsing in parallel
+_min_batch_size = 1 << 16
+_max_batch_size = 1 << 22
+_batches_per_worker = 4
+
+# Maximum number of documents parsed by one task of parse_many()
+_max_documents_per_batch = 64
+
+
+def _check_axiom_element(element: DocumentElement):
+    if element.depth == 0 or element.keyword is None:
+        raise RuntimeError(
+            f'Unexpected {element.text.decode("utf-8")} at byte '
+            f'{element.start}')
+
+
+def _axiom_ranges(first_element, elements, batch_size):
+    """Groups consecutive axiom elements into byte ranges of roughly
+    batch_size bytes
+    """
+    if first_element is None:
+        return
+
+    start = first_element.start
+    end = first_element.end
+
+    for element in elements:
+        _check_axiom_element(element)
+
+        if element.end - start > batch_size:
+            yield start, end
+            start = element.start
+
+        end = element.end
+
+    yield start, end
+
+
+def _parse_axiom_range(
+        parser_cls, prefixes, lazy_literals, file_path, start, end,
+        axiom_filter=None, packrat_cache_size=None):
+    """Runs in a worker process and parses the axioms between the byte
+    offsets start and end of the document at file_path
+    """
+    parser = parser_cls(
+        prefixes=prefixes, packrat_cache_size=packrat_cache_size,
+        lazy_literals=lazy_literals)
+    context = parser._begin_document({})
+
+    with open(file_path, 'rb') as ontology_file:
+        ontology_file.seek(start)
+        axioms_range = BytesIO(ontology_file.read(end - start))
+
+    return list(parser._iter_axiom_elements(
+        context,
+        iter_elements(axioms_range, in_ontology=True, offset=start),
+        axiom_filter))
+
+
+class _EntityTable(object):
+    """An entity factory sharing the entities of several documents. The
+    entities are taken from data_factory and kept in a table of their own,
+    which keeps them alive while the documents are parsed.
+    """
+    def __init__(self, data_factory: OWLDataFactory):
+        self._data_factory = data_factory
+        self._entities = {}
+
+    def __call__(self, entity_cls, iri):
+        key = (entity_cls, iri)
+
+        try:
+            return self._entities[key]
+        except KeyError:
+            entity = self._data_factory.entity(entity_cls, iri)
+            self._entities[key] = entity
+
+            return entity
+
+
+class _EntityRecorder(object):
+    """An entity factory recording the IRIs of the created entities"""
+    def __init__(self):
+        self.iris = set()
+
+    def __call__(self, entity_cls, iri):
+        self.iris.add(iri)
+
+        return entity_cls(iri)
+
+
+def _parse_documents(
+        parser_cls, prefixes, packrat_cache_size, lazy_literals,
+        paths) -> list:
+    """Runs in a worker process and parses a batch of documents. The
+    entities are shared within the batch, which keeps them shared once the
+    batch is unpickled.
+    """
+    parser = parser_cls(
+        prefixes=prefixes,
+        packrat_cache_size=packrat_cache_size,
+        entity_factory=_EntityTable(DEFAULT_DATA_FACTORY),
+        lazy_literals=lazy_literals)
+
+    return [(path, parser.parse_file(path)) for path in paths]
 
 
 if __name__ == '__main__':
@@ -0,0 +1,60 @@
+"""
+Parsed documents which keep the byte spans and content digests of their
+axioms, so that an edited version of the document can be re-parsed
+incrementally: axioms whose text didn't change are taken over from the
+previous parse and only the changed ones are parsed again.
+"""
+import hashlib
+from typing import NamedTuple
+
+from morelianoctua.model import OWLOntology
+from morelianoctua.model.axioms import OWLAxiom
+
+_digest_size = 16
+
+
+def axiom_digest(text: bytes) -> bytes:
+    """Returns the digest of the text of an axiom element"""
+    return hashlib.blake2b(text, digest_size=_digest_size).digest()
+
+
+class AxiomSpan(NamedTuple):
+    """An axiom of a parsed document, the byte offsets of its start and end
+    and the digest of its text
+    """
+    start: int
+    end: int
+    digest: bytes
+    axiom: OWLAxiom
+
+
+class AxiomDiff(NamedTuple):
+    """The axioms added to and removed from an ontology by an edit of its
+    document
+    """
+    added: set
+    removed: set
+
+    def is_empty(self) -> bool:
+        return not self.added and not self.removed
+
+
+class ParsedDocument(object):
+    """
+    The ontology parsed from a document together with the spans of its axioms
+    in document order.
+
+    prefixes are all prefixes the axioms were parsed with and entities the
+    entities created while parsing, which are shared with the re-parsed
+    versions of the document.
+    """
+    def __init__(
+            self, ontology: OWLOntology, prefixes: dict, spans: list,
+            entities: dict):
+        self.ontology = ontology
+        self.prefixes = prefixes
+        self.spans = spans
+        self.entities = entities
+
+    def axioms_by_digest(self) -> dict:
+        return {span.digest: span.axiom for span in self.spans}
@@ -0,0 +1,113 @@
+"""
+Sidecar indexes of the axioms of ontology documents, mapping the ordinal of
+each axiom and the IRIs of the entities it mentions to the byte offset of the
+axiom in the document.
+
+Indexes are pickles, so they must not be read from locations writable by
+untrusted users.
+"""
+import os
+import pickle
+import tempfile
+from array import array
+
+# to be increased whenever the index format changes incompatibly
+INDEX_FORMAT_VERSION = 1
+
+
+class AxiomIndex(object):
+    """
+    The byte offsets of the axioms of a document in document order, i.e.
+    offsets[i] is the offset of the i-th axiom, and for each entity IRI the
+    ordinals of the axioms mentioning it.
+
+    document_size and document_mtime identify the version of the document
+    the index was built for.
+    """
+    def __init__(self, document_size, document_mtime):
+        self.document_size = document_size
+        self.document_mtime = document_mtime
+        self.offsets = array('Q')
+        self._ordinals = {}
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def add(self, offset, iris):
+        """Appends the axiom at byte offset which mentions the entities with
+        the IRIs iris
+        """
+        ordinal = len(self.offsets)
+        self.offsets.append(offset)
+
+        for iri in iris:
+            # rdflib's URIRefs don't compare equal to plain strings
+            iri = str(iri)
+
+            ordinals = self._ordinals.get(iri)
+            if ordinals is None:
+                ordinals = self._ordinals[iri] = array('Q')
+
+            ordinals.append(ordinal)
+
+    def ordinals_of(self, iri) -> list:
+        """Returns the ordinals of the axioms mentioning the entity iri"""
+        return list(self._ordinals.get(str(iri), ()))
+
+    def offsets_of(self, iri) -> list:
+        """Returns the byte offsets of the axioms mentioning the entity
+        iri
+        """
+        return [self.offsets[i] for i in self._ordinals.get(str(iri), ())]
+
+    def is_current(self, file_path) -> bool:
+        """Checks whether the document at file_path is still the one the
+        index was built for
+        """
+        stat = os.stat(file_path)
+
+        return stat.st_size == self.document_size and \
+            stat.st_mtime_ns == self.document_mtime
+
+    def save(self, path):
+        """Writes the index to path. The index is written to a temporary file
+        first, so concurrent readers never see a partial index.
+        """
+        index_dir = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=index_dir, suffix='.tmp')
+
+        try:
+            with os.fdopen(fd, 'wb') as index_file:
+                pickle.dump(
+                    (INDEX_FORMAT_VERSION, self), index_file,
+                    pickle.HIGHEST_PROTOCOL)
+
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
+def default_index_path(file_path) -> str:
+    """Returns the path of the sidecar index of the document at file_path"""
+    return f'{file_path}.index'
+
+
+def load_index(path, file_path=None) -> AxiomIndex:
+    """Returns the index stored at path or None if there is no usable index.
+    If the path of the indexed document is given, None is also returned if
+    the document was changed after the index was built.
+    """
+    try:
+        with open(path, 'rb') as index_file:
+            version, index = pickle.load(index_file)
+    except Exception:
+        return None
+
+    if version != INDEX_FORMAT_VERSION or not isinstance(index, AxiomIndex):
+        return None
+
+    if file_path is not None and not index.is_current(file_path):
+        return None
+
+    return index
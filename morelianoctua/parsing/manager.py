@@ -0,0 +1,197 @@
+"""
+Loading of ontology documents together with the closure of the documents
+they import.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from rdflib import URIRef
+
+from morelianoctua.model import OWLOntology
+from morelianoctua.parsing.functional import FunctionalSyntaxParser
+
+
+class OWLOntologyManager(object):
+    """
+    Loads ontology documents and resolves their Import(...) declarations.
+
+    Imported ontologies are looked up in catalog, a dict mapping ontology
+    IRIs (or version IRIs) to local files, and among the documents loaded
+    before. All documents of an import closure are parsed only once, even if
+    they are imported several times, and are kept by the manager, so later
+    loads importing them reuse the parsed ontologies.
+
+    The headers of the documents are scanned first to find the whole import
+    closure. If workers is greater than 1, the documents not loaded yet are
+    then parsed in a pool of that many processes, starting with the largest
+    one, so that loading a modular ontology takes about as long as parsing
+    its largest document. Entities aren't shared between ontologies parsed
+    in different processes.
+
+    parser_cls, prefixes and lazy_literals configure the parsers used, and
+    a cache_dir is passed on to their parse_file() method to keep snapshots
+    of the parsed documents between runs.
+    """
+    def __init__(
+            self, catalog: dict = None, parser_cls=FunctionalSyntaxParser,
+            prefixes=None, lazy_literals=False, workers=None,
+            cache_dir=None):
+        self._catalog = {}
+        if catalog is not None:
+            for iri, file_path in catalog.items():
+                self.add_mapping(iri, file_path)
+
+        self._parser_cls = parser_cls
+        self._prefixes = prefixes
+        self._lazy_literals = lazy_literals
+        self._parser = parser_cls(
+            prefixes=prefixes, lazy_literals=lazy_literals)
+        self._workers = workers
+        self._cache_dir = cache_dir
+
+        # absolute file path --> loaded ontology
+        self._ontologies = {}
+        # ontology IRI or version IRI --> absolute file path of every
+        # document whose header was read
+        self._documents = {}
+
+    def add_mapping(self, iri, file_path):
+        """Makes imports of iri load the document at file_path"""
+        self._catalog[URIRef(iri)] = os.path.abspath(file_path)
+
+    def load_ontology(self, file_path) -> OWLOntology:
+        """Loads the ontology document at file_path and all documents in its
+        import closure which weren't loaded before
+        """
+        file_path = os.path.abspath(file_path)
+
+        if file_path not in self._ontologies:
+            self._load_documents(self._closure_paths(file_path))
+
+        return self._ontologies[file_path]
+
+    def load_ontology_from_iri(self, iri) -> OWLOntology:
+        """Loads the ontology document iri is resolved to and its import
+        closure
+        """
+        return self.load_ontology(self._resolve(URIRef(iri)))
+
+    def get_ontology(self, iri) -> OWLOntology:
+        """Returns the loaded ontology with the IRI or version IRI iri or
+        None if there is none
+        """
+        file_path = self._documents.get(URIRef(iri))
+        if file_path is None:
+            file_path = self._catalog.get(URIRef(iri))
+
+        return self._ontologies.get(file_path)
+
+    def imports_closure(self, ontology: OWLOntology) -> list:
+        """Returns ontology followed by all ontologies it imports directly or
+        indirectly. Imported ontologies not loaded yet are loaded.
+        """
+        closure = [ontology]
+        seen = {id(ontology)}
+
+        for current in closure:
+            for iri in current.imports:
+                imported = self.get_ontology(iri)
+                if imported is None:
+                    imported = self.load_ontology_from_iri(iri)
+
+                if id(imported) not in seen:
+                    seen.add(id(imported))
+                    closure.append(imported)
+
+        return closure
+
+    def _resolve(self, iri: URIRef) -> str:
+        file_path = self._catalog.get(iri)
+        if file_path is None:
+            file_path = self._documents.get(iri)
+
+        if file_path is None:
+            raise RuntimeError(f'Could not resolve import of {iri}')
+
+        return file_path
+
+    def _closure_paths(self, file_path) -> list:
+        """Returns the paths of the documents in the import closure of the
+        document at file_path which aren't loaded yet
+        """
+        paths = [file_path]
+        seen = {file_path}
+        # imports which can't be resolved until the header of the document
+        # they refer to (e.g. by its version IRI) was read
+        unresolved = []
+        num_scanned = 0
+
+        while num_scanned < len(paths):
+            for current_path in paths[num_scanned:]:
+                num_scanned += 1
+
+                ontology = self._ontologies.get(current_path)
+                if ontology is None:
+                    ontology = self._parser.scan_header(current_path)
+                    self._register(ontology, current_path)
+
+                unresolved.extend(ontology.imports)
+
+            iris = unresolved
+            unresolved = []
+
+            for iri in iris:
+                try:
+                    imported_path = self._resolve(iri)
+                except RuntimeError:
+                    unresolved.append(iri)
+                    continue
+
+                if imported_path not in seen:
+                    seen.add(imported_path)
+                    paths.append(imported_path)
+
+        if unresolved:
+            raise RuntimeError(f'Could not resolve import of {unresolved[0]}')
+
+        return [path for path in paths if path not in self._ontologies]
+
+    def _register(self, ontology: OWLOntology, file_path):
+        for iri in (ontology.iri, ontology.version_iri):
+            if iri is not None:
+                self._documents.setdefault(iri, file_path)
+
+    def _load_documents(self, paths):
+        if self._workers is None or self._workers < 2 or len(paths) < 2:
+            for file_path in paths:
+                self._ontologies[file_path] = self._parser.parse_file(
+                    file_path, cache_dir=self._cache_dir)
+
+            return
+
+        # the largest documents are started first, so that they don't end up
+        # being parsed after all others
+        paths = sorted(paths, key=os.path.getsize, reverse=True)
+
+        with ProcessPoolExecutor(min(self._workers, len(paths))) as executor:
+            futures = [
+                executor.submit(
+                    _load_document,
+                    self._parser_cls,
+                    self._prefixes,
+                    self._lazy_literals,
+                    file_path,
+                    self._cache_dir)
+                for file_path in paths]
+
+            for file_path, future in zip(paths, futures):
+                self._ontologies[file_path] = future.result()
+
+
+def _load_document(
+        parser_cls, prefixes, lazy_literals, file_path,
+        cache_dir) -> OWLOntology:
+    """Runs in a worker process and parses the document at file_path"""
+    parser = parser_cls(prefixes=prefixes, lazy_literals=lazy_literals)
+
+    return parser.parse_file(file_path, cache_dir=cache_dir)
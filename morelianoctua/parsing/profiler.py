@@ -0,0 +1,174 @@
+"""
+Profiling of the rules and parse actions of the pyparsing based
+FunctionalSyntaxGrammar.
+
+A ParseProfiler is passed to a FunctionalSyntaxParser which then parses with
+a grammar of its own that reports to the profiler. The grammar shared by all
+other parsers isn't touched, so parsers without a profiler don't pay for it.
+"""
+import time
+from contextlib import contextmanager
+
+from pyparsing import ParserElement
+
+
+class RuleStats(object):
+    """Statistics of a named rule of the grammar.
+
+    calls counts all attempts to match the rule, successes and failures
+    (i.e. backtracks) how they ended. cumulative_time is the time spent in
+    the rule including its sub-rules and parse actions, own_time excludes
+    them. Time spent in recursive calls of a rule is only counted once in
+    its cumulative_time.
+    """
+    def __init__(self):
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.cumulative_time = 0.0
+        self.own_time = 0.0
+
+
+class ActionStats(object):
+    """Statistics of a parse action of a rule"""
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+
+
+class ParseProfiler(object):
+    """
+    Records call counts, successes, failures and times per rule of the
+    grammar (keyed by the attribute name of the rule) and per parse action
+    (keyed by rule name and function name).
+
+    A profiler is not thread-safe, so it shouldn't be shared by parsers used
+    concurrently.
+    """
+    def __init__(self):
+        self.rules = {}
+        self.actions = {}
+
+        self._rule_names = {}
+        # one [rule name, start time, time spent in children] per rule
+        # currently being matched
+        self._stack = []
+        self._active_calls = {}
+
+    def install(self, grammar):
+        """Makes all named rules of grammar report to this profiler. The
+        grammar shouldn't be used by any parser without this profiler
+        afterwards.
+        """
+        for name, element in vars(grammar).items():
+            if not isinstance(element, ParserElement) or \
+                    id(element) in self._rule_names:
+                # an element can be referenced by several names
+                continue
+
+            self._rule_names[id(element)] = name
+            element.setDebugActions(
+                self._start_rule, self._succeed_rule, self._fail_rule)
+            element.parseAction = [
+                self._timed_action(name, action)
+                for action in element.parseAction]
+
+    @contextmanager
+    def profiling(self):
+        """Wraps a single parse run"""
+        depth = len(self._stack)
+
+        try:
+            yield self
+        finally:
+            # rules aborted by other exceptions than parse exceptions don't
+            # report their end
+            while len(self._stack) > depth:
+                name, _, _ = self._stack.pop()
+                self._active_calls[name] -= 1
+
+    def report(self, limit=None) -> str:
+        """Returns a report of the rules and parse actions sorted by the
+        time spent in them, which is limited to limit lines per table
+        """
+        rules = sorted(
+            self.rules.items(), key=lambda item: item[1].own_time,
+            reverse=True)[:limit]
+        actions = sorted(
+            ((name, stats) for name, stats in self.actions.items()
+             if stats.calls > 0),
+            key=lambda item: item[1].time, reverse=True)[:limit]
+
+        lines = [
+            f'{"rule":<40} {"calls":>9} {"successes":>9} {"failures":>9} '
+            f'{"cumulative":>11} {"own":>9}']
+
+        for name, stats in rules:
+            lines.append(
+                f'{name:<40} {stats.calls:>9} {stats.successes:>9} '
+                f'{stats.failures:>9} {stats.cumulative_time:>10.3f}s '
+                f'{stats.own_time:>8.3f}s')
+
+        lines.append('')
+        lines.append(f'{"parse action":<60} {"calls":>9} {"time":>11}')
+
+        for name, stats in actions:
+            lines.append(
+                f'{name:<60} {stats.calls:>9} {stats.time:>10.3f}s')
+
+        return '\n'.join(lines)
+
+    def _start_rule(self, string, loc, element):
+        name = self._rule_names[id(element)]
+
+        self._stack.append([name, time.perf_counter(), 0.0])
+        self._active_calls[name] = self._active_calls.get(name, 0) + 1
+
+    def _succeed_rule(self, string, start, end, element, tokens):
+        self._end_rule(True)
+
+    def _fail_rule(self, string, loc, element, exception):
+        self._end_rule(False)
+
+    def _end_rule(self, succeeded):
+        name, start, children_time = self._stack.pop()
+        duration = time.perf_counter() - start
+        self._active_calls[name] -= 1
+
+        stats = self.rules.get(name)
+        if stats is None:
+            stats = self.rules[name] = RuleStats()
+
+        stats.calls += 1
+        if succeeded:
+            stats.successes += 1
+        else:
+            stats.failures += 1
+
+        stats.own_time += duration - children_time
+        if self._active_calls[name] == 0:
+            stats.cumulative_time += duration
+
+        if self._stack:
+            self._stack[-1][2] += duration
+
+    def _timed_action(self, rule_name, action):
+        name = f'{rule_name}: {getattr(action, "__name__", action)}'
+        stats = self.actions[name] = ActionStats()
+
+        # the actions are already wrapped by pyparsing to take the string,
+        # location and tokens
+        def timed_action(string, loc, tokens):
+            start = time.perf_counter()
+
+            try:
+                return action(string, loc, tokens)
+            finally:
+                duration = time.perf_counter() - start
+                stats.calls += 1
+                stats.time += duration
+
+                if self._stack:
+                    self._stack[-1][2] += duration
+
+        return timed_action
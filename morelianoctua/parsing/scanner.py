@@ -0,0 +1,241 @@
+"""
+Splits an OWL 2 functional syntax document into its top-level elements
+without parsing them.
+
+The scanner only looks at the lexical structure of the document (IRIs in
+angle brackets, quoted strings, comments and parentheses), so it runs much
+faster than any of the parsers and can be used to feed them one axiom at a
+time. It works on bytes which makes all offsets byte offsets into the
+document. The structural characters are all ASCII and can't occur inside a
+multi-byte UTF-8 sequence.
+"""
+import re
+from typing import NamedTuple, Optional
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# The alternatives for IRIs, quoted strings and comments also match a prefix
+# of their token so that a token cut off at the end of a chunk is detected
+# instead of being misread
+_token_pattern = re.compile(
+    rb'\s+|'
+    rb'#[^\n]*\n?|'
+    rb'<[^>]*>?|'
+    rb'"(?:[^"\\]|\\.)*(")?|'
+    rb'[()]|'
+    rb'[^\s()<"#]+',
+    re.DOTALL)
+
+_whitespace = b' \t\r\n\f\v'
+
+# Nesting depth up to which whole elements are matched by _element_pattern
+_max_fast_path_depth = 12
+
+
+def _nested_pattern(depth):
+    # every alternative starts with a different character, so the regex
+    # engine never has to backtrack between them
+    leaf = rb'[^()"<#]|"(?:[^"\\]|\\.)*"|<[^>]*>|#[^\n]*'
+
+    if depth == 0:
+        return rb'(?:' + leaf + rb')*'
+    else:
+        return \
+            rb'(?:' + leaf + rb'|\(' + _nested_pattern(depth - 1) + rb'\))*'
+
+
+# Matches a complete keyword(...) element inside of the ontology including
+# the whitespace and comments in front of it. Elements which are nested too
+# deeply, cut off at the end of a chunk, or malformed don't match and are
+# handled token by token instead.
+_element_pattern = re.compile(
+    rb'(?:\s+|#[^\n]*\n)*'
+    rb'([^\s()"<#]+)\s*\(' + _nested_pattern(_max_fast_path_depth) + rb'\)',
+    re.DOTALL)
+
+
+class DocumentElement(NamedTuple):
+    """A top-level element of an ontology document.
+
+    keyword is the word in front of the opening parenthesis of a block like
+    Prefix(...) or SubClassOf(...) and None for a bare IRI (like the ontology
+    IRI). depth is 0 for elements in front of the Ontology( header and 1 for
+    the elements inside of it. start and end are the byte offsets of the
+    element in the document.
+    """
+    keyword: Optional[str]
+    text: bytes
+    start: int
+    end: int
+    depth: int
+
+
+def iter_elements(
+        binary_file, chunk_size=DEFAULT_CHUNK_SIZE, in_ontology=False,
+        offset=0):
+    """Yields the top-level DocumentElements of the document read from
+    binary_file, i.e. the prefix declarations, a marker element with keyword
+    'Ontology' (which has an empty text), and then the ontology IRI, version
+    IRI, imports, ontology annotations and axioms in document order.
+
+    With in_ontology=True binary_file is expected to contain only a part of
+    the content of an Ontology(...) block, e.g. a range of axioms. offset is
+    added to all reported offsets which is needed if binary_file does not
+    start at the beginning of the document.
+    """
+    return _iter_elements(b'', binary_file, chunk_size, in_ontology, offset)
+
+
+def iter_buffer_elements(buffer, in_ontology=False, offset=0):
+    """Like iter_elements() but scans a complete document held by a bytes
+    object or an mmap of the document file. Nothing but the text of the
+    yielded elements is copied out of the buffer.
+    """
+    return _iter_elements(buffer, None, 0, in_ontology, offset)
+
+
+def _iter_elements(buf, binary_file, chunk_size, in_ontology, offset):
+    buf_offset = offset  # absolute offset of buf[0]
+    pos = 0
+    eof = binary_file is None
+
+    # 1 once the Ontology( header was read
+    base_depth = 1 if in_ontology else 0
+    depth = base_depth
+    block_start = None  # absolute offset of the current block
+    block_keyword = None
+    pending = None  # (absolute start, end) of an atom at base depth
+
+    while True:
+        if base_depth == 1 and depth == 1 and pending is None:
+            match = _element_pattern.match(buf, pos)
+
+            if match is not None:
+                start, end = match.span(1)[0], match.end()
+                pos = end
+
+                yield DocumentElement(
+                    buf[start:match.end(1)].decode('utf-8'),
+                    buf[start:end],
+                    buf_offset + start,
+                    buf_offset + end,
+                    1)
+                continue
+
+        match = _token_pattern.match(buf, pos)
+
+        if match is None or (not eof and _is_incomplete(buf, match)):
+            if eof:
+                if pos < len(buf):
+                    raise RuntimeError(
+                        f'Unterminated token at byte {buf_offset + pos}')
+                break
+
+            keep = pos
+            if block_start is not None:
+                keep = min(keep, block_start - buf_offset)
+            if pending is not None:
+                keep = min(keep, pending[0] - buf_offset)
+
+            chunk = binary_file.read(chunk_size)
+            eof = not chunk
+            buf = buf[keep:] + chunk
+            buf_offset += keep
+            pos -= keep
+            continue
+
+        start, end = match.span()
+        pos = end
+        first = buf[start]
+
+        if first in _whitespace or first == 35:  # '#'
+            continue
+
+        elif first == 40:  # '('
+            if depth == base_depth:
+                if pending is None:
+                    raise RuntimeError(
+                        f'Missing keyword in front of ( at byte '
+                        f'{buf_offset + start}')
+
+                keyword_start, keyword_end = pending
+                pending = None
+                keyword = buf[
+                    keyword_start - buf_offset:
+                    keyword_end - buf_offset].decode('utf-8')
+
+                if base_depth == 0 and keyword == 'Ontology':
+                    base_depth = 1
+                    depth = 1
+                    yield DocumentElement(
+                        keyword, b'', keyword_start, buf_offset + end, 0)
+                    continue
+
+                block_start = keyword_start
+                block_keyword = keyword
+
+            depth += 1
+
+        elif first == 41:  # ')'
+            if depth == base_depth:
+                if pending is not None:
+                    yield _atom_element(buf, buf_offset, pending, base_depth)
+                    pending = None
+
+                if base_depth == 0 or in_ontology:
+                    raise RuntimeError(
+                        f'Unbalanced ) at byte {buf_offset + start}')
+
+                # end of the ontology
+                base_depth = 0
+                depth = 0
+                continue
+
+            depth -= 1
+
+            if depth == base_depth:
+                yield DocumentElement(
+                    block_keyword,
+                    buf[block_start - buf_offset:end],
+                    block_start,
+                    buf_offset + end,
+                    base_depth)
+                block_start = None
+                block_keyword = None
+
+        elif depth == base_depth:
+            # an atom on the top-level is either the keyword of the next
+            # block or a bare IRI
+            if pending is not None:
+                yield _atom_element(buf, buf_offset, pending, base_depth)
+
+            pending = (buf_offset + start, buf_offset + end)
+
+    if depth != (1 if in_ontology else 0) or block_start is not None:
+        raise RuntimeError('Unexpected end of document')
+
+    if pending is not None:
+        raise RuntimeError(
+            f'Unexpected content after the ontology at byte {pending[0]}')
+
+
+def _is_incomplete(buf, match):
+    token = match.group()
+    first = token[0]
+
+    if first == 34:  # '"'
+        return match.group(1) is None
+    elif first == 60:  # '<'
+        return token[-1] != 62  # '>'
+    elif first == 35:  # '#'
+        return token[-1] != 10  # '\n'
+    else:
+        # whitespace and atoms may continue in the next chunk
+        return match.end() == len(buf)
+
+
+def _atom_element(buf, buf_offset, span, depth) -> DocumentElement:
+    start, end = span
+
+    return DocumentElement(
+        None, buf[start - buf_offset:end - buf_offset], start, end, depth)
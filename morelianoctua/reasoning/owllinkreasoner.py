@@ -19,6 +19,8 @@ from morelianoctua.model.axioms.owldatapropertyaxiom import \
     OWLDataPropertyDomainAxiom, OWLDataPropertyRangeAxiom
 from morelianoctua.model.axioms.owlobjectpropertyaxiom import \
     OWLObjectPropertyRangeAxiom, OWLObjectPropertyDomainAxiom
+from morelianoctua.model.datafactory import OWLDataFactory, \
+    DEFAULT_DATA_FACTORY
 from morelianoctua.model.objects.classexpression import OWLClass, \
     OWLObjectSomeValuesFrom, OWLObjectAllValuesFrom, OWLDataSomeValuesFrom, \
     OWLDataAllValuesFrom, OWLDataHasValue, OWLObjectUnionOf, OWLClassExpression
@@ -419,9 +421,12 @@ class OWLLinkReasoner(OWLReasoner):
         'owl': 'http://www.w3.org/2002/07/owl#'
     }
 
-    def __init__(self, ontology: OWLOntology, owllink_server_url: str):
+    def __init__(
+            self, ontology: OWLOntology, owllink_server_url: str,
+            data_factory: OWLDataFactory = DEFAULT_DATA_FACTORY):
         self.ontology = ontology
         self.server_url = owllink_server_url
+        self.data_factory = data_factory
 
         self.kb_uri = self._init_kb()
 
@@ -461,14 +466,15 @@ class OWLLinkReasoner(OWLReasoner):
 
     def _make_class_expression(self, node: Element) -> OWLClassExpression:
         if node.tag == '{http://www.w3.org/2002/07/owl#}Class':
-            return OWLClass(node.get('IRI'))
+            return self.data_factory.entity(OWLClass, node.get('IRI'))
         else:
             raise NotImplementedError(f'Node type {node.tag} not supported, '
                                       f'yet')
 
     def _make_individual(self, node: Element) -> OWLIndividual:
         if node.tag == '{http://www.w3.org/2002/07/owl#}NamedIndividual':
-            return OWLNamedIndividual(node.get('IRI'))
+            return self.data_factory.entity(
+                OWLNamedIndividual, node.get('IRI'))
         else:
             raise NotImplementedError(
                 f'Node type {node.tag} not supported, '
@@ -598,7 +604,8 @@ class OWLLinkReasoner(OWLReasoner):
         # </ResponseMessage>
         object_properties = set()
         for oprop_node in etree.findall('*/owl:ObjectProperty', self._prefixes):
-            object_properties.add(OWLObjectProperty(oprop_node.get('IRI')))
+            object_properties.add(self.data_factory.entity(
+                OWLObjectProperty, oprop_node.get('IRI')))
 
         return object_properties
 
@@ -620,7 +627,8 @@ class OWLLinkReasoner(OWLReasoner):
 
         classes = set()
         for class_node in etree.findall('*/owl:Class', self._prefixes):
-            classes.add(OWLClass(class_node.get('IRI')))
+            classes.add(
+                self.data_factory.entity(OWLClass, class_node.get('IRI')))
 
         return classes
 
@@ -667,7 +675,7 @@ class OWLLinkReasoner(OWLReasoner):
                         raise Exception(f'Unknown prefix {prefix}')
 
                 dtype_iri = namespace + local_part
-            datatypes.add(OWLDatatype(dtype_iri))
+            datatypes.add(self.data_factory.entity(OWLDatatype, dtype_iri))
 
         return datatypes
 
@@ -696,7 +704,8 @@ class OWLLinkReasoner(OWLReasoner):
 
         data_properties = set()
         for dprop_node in etree.findall('*/owl:DataProperty', self._prefixes):
-            data_properties.add(OWLDataProperty(dprop_node.get('IRI')))
+            data_properties.add(self.data_factory.entity(
+                OWLDataProperty, dprop_node.get('IRI')))
 
         return data_properties
 
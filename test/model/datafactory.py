@@ -0,0 +1,93 @@
+import gc
+import unittest
+from unittest import mock
+
+from rdflib import URIRef
+
+from morelianoctua.model.axioms.classaxiom import OWLSubClassOfAxiom
+from morelianoctua.model.datafactory import OWLDataFactory
+from morelianoctua.model.objects.classexpression import OWLClass, \
+    OWLObjectIntersectionOf, OWLObjectSomeValuesFrom, OWLObjectUnionOf
+from morelianoctua.model.objects.property import OWLObjectProperty
+
+
+def _iri(name):
+    return f'http://ex.com/ont#{name}'
+
+
+class TestOWLDataFactory(unittest.TestCase):
+    def setUp(self):
+        self.factory = OWLDataFactory()
+
+    def test_entity(self):
+        cls = self.factory.entity(OWLClass, _iri('Cls1'))
+
+        self.assertIsInstance(cls, OWLClass)
+        self.assertIs(cls, self.factory.entity(OWLClass, _iri('Cls1')))
+        self.assertIs(cls, self.factory.entity(OWLClass, URIRef(_iri('Cls1'))))
+        self.assertIs(cls, self.factory.intern(OWLClass(_iri('Cls1'))))
+        self.assertIsNot(
+            cls, self.factory.entity(OWLObjectProperty, _iri('Cls1')))
+
+    def test_class_expressions_are_interned(self):
+        obj_prop = self.factory.entity(OWLObjectProperty, _iri('objProp1'))
+        cls1 = self.factory.entity(OWLClass, _iri('Cls1'))
+        cls2 = self.factory.entity(OWLClass, _iri('Cls2'))
+
+        some = self.factory.get(OWLObjectSomeValuesFrom, obj_prop, cls1)
+        intersection = self.factory.get(OWLObjectIntersectionOf, cls1, cls2)
+
+        self.assertIs(
+            some, self.factory.get(OWLObjectSomeValuesFrom, obj_prop, cls1))
+        self.assertIs(
+            some,
+            self.factory.intern(OWLObjectSomeValuesFrom(
+                OWLObjectProperty(_iri('objProp1')), OWLClass(_iri('Cls1')))))
+        # the order of the operands doesn't matter
+        self.assertIs(
+            intersection,
+            self.factory.get(OWLObjectIntersectionOf, cls2, cls1))
+        self.assertIsNot(
+            intersection, self.factory.get(OWLObjectUnionOf, cls1, cls2))
+
+    def test_hash_collisions(self):
+        cls1 = self.factory.entity(OWLClass, _iri('Cls1'))
+        cls2 = self.factory.entity(OWLClass, _iri('Cls2'))
+
+        with mock.patch.object(
+                OWLObjectIntersectionOf.__hash__, 'compute',
+                lambda obj: 42):
+            intersection = self.factory.get(OWLObjectIntersectionOf, cls1)
+            other = self.factory.get(OWLObjectIntersectionOf, cls2)
+
+            self.assertEqual(hash(intersection), hash(other))
+            self.assertNotEqual(intersection, other)
+            self.assertIs(
+                intersection, self.factory.get(OWLObjectIntersectionOf, cls1))
+            self.assertIs(
+                other, self.factory.get(OWLObjectIntersectionOf, cls2))
+
+    def test_objects_arent_kept_alive(self):
+        cls = self.factory.entity(OWLClass, _iri('Cls1'))
+        self.factory.get(OWLObjectIntersectionOf, cls)
+        self.factory.entity(OWLClass, _iri('Cls2'))
+        gc.collect()
+
+        self.assertEqual(1, len(self.factory))
+
+        with mock.patch(
+                'morelianoctua.model.datafactory._min_sweep_size', 0):
+            self.factory._sweep()
+
+        self.assertEqual(1, len(self.factory._entities))
+        self.assertEqual(0, len(self.factory._objects))
+
+    def test_axioms_arent_interned(self):
+        cls1 = self.factory.entity(OWLClass, _iri('Cls1'))
+        cls2 = self.factory.entity(OWLClass, _iri('Cls2'))
+
+        with self.assertRaises(TypeError):
+            self.factory.intern(OWLSubClassOfAxiom(cls1, cls2))
+
+        with self.assertRaises(TypeError):
+            self.factory.get(OWLSubClassOfAxiom, cls1, cls2)
@@ -0,0 +1,95 @@
+import pickle
+import unittest
+
+from morelianoctua.model.axioms.classaxiom import OWLSubClassOfAxiom, \
+    OWLEquivalentClassesAxiom
+from morelianoctua.model.axioms.declarationaxiom import \
+    OWLClassDeclarationAxiom
+from morelianoctua.model.objects.annotation import OWLAnnotation
+from morelianoctua.model.objects.classexpression import OWLClass, \
+    OWLObjectIntersectionOf, OWLObjectSomeValuesFrom
+from morelianoctua.model.objects.property import OWLObjectProperty, \
+    OWLAnnotationProperty
+
+
+def _cls(i):
+    return OWLClass(f'http://ex.com/ont#Cls{i}')
+
+
+class TestImmutable(unittest.TestCase):
+    def test_fields_cant_be_changed(self):
+        cls = _cls(1)
+        axiom = OWLSubClassOfAxiom(cls, _cls(2))
+
+        with self.assertRaises(AttributeError):
+            cls.iri = 'http://ex.com/ont#Cls3'
+
+        with self.assertRaises(AttributeError):
+            axiom.sub_class = _cls(3)
+
+        with self.assertRaises(AttributeError):
+            del axiom.super_class
+
+        self.assertEqual(_cls(1), axiom.sub_class)
+
+    def test_collections_are_frozen(self):
+        intersection = OWLObjectIntersectionOf(_cls(1), _cls(2))
+        axiom = OWLEquivalentClassesAxiom(
+            {_cls(1), intersection},
+            [OWLAnnotation(
+                OWLAnnotationProperty('http://ex.com/ont#annProp'), 'a')])
+
+        self.assertIsInstance(intersection.operands, frozenset)
+        self.assertIsInstance(axiom.class_expressions, frozenset)
+        self.assertIsInstance(axiom.annotations, frozenset)
+
+        # no annotations are normalized to None
+        self.assertIsNone(OWLSubClassOfAxiom(_cls(1), _cls(2), []).annotations)
+        self.assertEqual(
+            OWLSubClassOfAxiom(_cls(1), _cls(2), set()),
+            OWLSubClassOfAxiom(_cls(1), _cls(2)))
+
+    def test_hash_is_order_independent(self):
+        classes = [_cls(i) for i in range(100)]
+
+        first = OWLObjectIntersectionOf(*classes)
+        second = OWLObjectIntersectionOf(*reversed(classes))
+
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(
+            hash(OWLEquivalentClassesAxiom(classes)),
+            hash(OWLEquivalentClassesAxiom(list(reversed(classes)))))
+
+    def test_hash_is_cached(self):
+        expression = OWLObjectSomeValuesFrom(
+            OWLObjectProperty('http://ex.com/ont#objProp'), _cls(1))
+
+        self.assertEqual(hash(expression), hash(expression))
+        self.assertEqual(hash(expression), expression._hash)
+
+    def test_declarations_are_compared_structurally(self):
+        self.assertEqual(
+            OWLClassDeclarationAxiom(_cls(1)),
+            OWLClassDeclarationAxiom(_cls(1)))
+        self.assertNotEqual(
+            OWLClassDeclarationAxiom(_cls(1)),
+            OWLClassDeclarationAxiom(_cls(2)))
+        self.assertEqual(
+            1,
+            len({OWLClassDeclarationAxiom(_cls(1)),
+                 OWLClassDeclarationAxiom(_cls(1))}))
+
+    def test_cached_hash_isnt_pickled(self):
+        axiom = OWLSubClassOfAxiom(_cls(1), _cls(2))
+
+        self.assertNotIn('_hash', axiom.__getstate__())
+
+        copy = pickle.loads(pickle.dumps(axiom))
+
+        self.assertEqual(axiom, copy)
+        self.assertEqual(hash(axiom), hash(copy))
+
+
+if __name__ == '__main__':
+    unittest.main()
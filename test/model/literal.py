@@ -0,0 +1,85 @@
+import pickle
+import unittest
+from unittest import mock
+
+from rdflib import Literal, URIRef, XSD
+
+from morelianoctua.model.objects.literal import LazyLiteral, lazy_literal
+
+lexical_forms = {
+    XSD.int: ['0', '-0', '01', '+5', '5', '-12', ' 5', '1_0', 'abc', ''],
+    XSD.integer: ['7', '-7', '007', '123456789012345678901234567890'],
+    XSD.double: [
+        '1.0', '1.0E0', '1.5', '0.1', '1e-05', '0.00001', '1e+16', 'NaN',
+        'INF', '-0.0', '1.50', 'abc'],
+    XSD.float: ['2.5', '2.50'],
+    XSD.decimal: ['1.50', '1', '.5', '0.0000001', '1E-7', '-0', 'abc'],
+    XSD.boolean: ['true', 'false', '1', '0', 'True'],
+    XSD.date: ['2020-01-01', '2020-13-01', '0999-01-01', '2020-1-01'],
+    XSD.dateTime: [
+        '2020-01-01T10:00:00', '2020-01-01T24:00:00',
+        '2020-01-01T10:00:00Z', '2020-01-01T10:00:00.5'],
+    XSD.gYear: ['2020'],
+    XSD.string: ['a string', ' 01 '],
+    URIRef('http://example.com/ont#datatype'): ['01'],
+    None: ['plain'],
+}
+
+
+class TestLazyLiteral(unittest.TestCase):
+    def test_same_as_eager_literal(self):
+        for datatype, forms in lexical_forms.items():
+            for lexical_form in forms:
+                eager = Literal(lexical_form, None, datatype)
+                lazy = lazy_literal(lexical_form, None, datatype)
+
+                self.assertEqual(str(eager), str(lazy))
+                self.assertEqual(eager.datatype, lazy.datatype)
+                self.assertTrue(eager == lazy)
+                self.assertTrue(lazy == eager)
+                self.assertEqual(hash(eager), hash(lazy))
+                self.assertEqual(type(eager.value), type(lazy.value))
+
+                if eager.value == eager.value:  # not NaN
+                    self.assertEqual(eager.value, lazy.value)
+
+    def test_language(self):
+        for language in ['en', 'EN-us']:
+            eager = Literal('a string', language)
+            lazy = lazy_literal('a string', language)
+
+            self.assertIsInstance(lazy, LazyLiteral)
+            self.assertEqual(eager, lazy)
+            self.assertEqual(hash(eager), hash(lazy))
+            self.assertEqual(language, lazy.language)
+
+        with self.assertRaises(Exception):
+            lazy_literal('a string', 'not a language tag')
+
+    def test_lazy_conversion(self):
+        literal = lazy_literal('2020-01-01', None, XSD.date)
+        self.assertIsInstance(literal, LazyLiteral)
+
+        with mock.patch(
+                'morelianoctua.model.objects.literal._castLexicalToPython',
+                wraps=lambda lexical_form, datatype: 23) as convert:
+            literal == lazy_literal('2020-01-01', None, XSD.date)
+            hash(literal)
+            self.assertEqual(0, convert.call_count)
+
+            self.assertEqual(23, literal.value)
+            self.assertEqual(23, literal.toPython())
+            self.assertEqual(1, convert.call_count)
+
+    def test_normalized_lexical_forms_are_eager(self):
+        self.assertNotIsInstance(
+            lazy_literal('01', None, XSD.int), LazyLiteral)
+        self.assertIsInstance(lazy_literal('1', None, XSD.int), LazyLiteral)
+
+    def test_pickle(self):
+        literal = lazy_literal('23', None, XSD.int)
+        unpickled = pickle.loads(pickle.dumps(literal))
+
+        self.assertIsInstance(unpickled, LazyLiteral)
+        self.assertEqual(literal, unpickled)
+        self.assertEqual(23, unpickled.value)
@@ -0,0 +1,277 @@
+import pickle
+import unittest
+from unittest import mock
+
+from rdflib import Literal, XSD
+
+from morelianoctua.model import OWLOntology
+from morelianoctua.model.axioms.assertionaxiom import \
+    OWLClassAssertionAxiom, OWLObjectPropertyAssertionAxiom, \
+    OWLDataPropertyAssertionAxiom
+from morelianoctua.model.axioms.classaxiom import OWLSubClassOfAxiom, \
+    OWLClassAxiom, OWLDisjointClassesAxiom
+from morelianoctua.model.axioms.declarationaxiom import \
+    OWLClassDeclarationAxiom
+from morelianoctua.model.datafactory import DEFAULT_DATA_FACTORY
+from morelianoctua.model.objects.annotation import OWLAnnotation
+from morelianoctua.model.objects.classexpression import OWLClass, \
+    OWLObjectSomeValuesFrom, OWLDataHasValue
+from morelianoctua.model.objects.datarange import OWLDatatype, \
+    OWLDataOneOf, OWLDatatypeRestriction
+from morelianoctua.model.objects.facet import OWLFacetRestriction
+from morelianoctua.model.objects.individual import OWLNamedIndividual
+from morelianoctua.model.objects.property import OWLObjectProperty, \
+    OWLDataProperty, OWLAnnotationProperty
+
+
+def _iri(name):
+    return f'http://ex.com/ont#{name}'
+
+
+cls1 = OWLClass(_iri('Cls1'))
+cls2 = OWLClass(_iri('Cls2'))
+cls3 = OWLClass(_iri('Cls3'))
+obj_prop = OWLObjectProperty(_iri('objProp1'))
+data_prop = OWLDataProperty(_iri('dataProp1'))
+ann_prop = OWLAnnotationProperty(_iri('annProp1'))
+indiv1 = OWLNamedIndividual(_iri('indiv1'))
+indiv2 = OWLNamedIndividual(_iri('indiv2'))
+xsd_int = OWLDatatype(XSD.int)
+
+some = OWLObjectSomeValuesFrom(obj_prop, cls3)
+
+declaration = OWLClassDeclarationAxiom(cls1)
+sub_class_of1 = OWLSubClassOfAxiom(cls1, cls2)
+sub_class_of2 = OWLSubClassOfAxiom(
+    cls2, some, {OWLAnnotation(ann_prop, Literal('comment'))})
+disjoint_classes = OWLDisjointClassesAxiom({cls1, cls3})
+class_assertion = OWLClassAssertionAxiom(indiv1, cls1)
+obj_prop_assertion = OWLObjectPropertyAssertionAxiom(indiv1, obj_prop, indiv2)
+data_prop_assertion = OWLDataPropertyAssertionAxiom(
+    indiv2, data_prop, Literal('23', datatype=XSD.int))
+
+
+def _ontology():
+    return OWLOntology({}, {
+        declaration, sub_class_of1, sub_class_of2, disjoint_classes,
+        class_assertion, obj_prop_assertion, data_prop_assertion})
+
+
+class TestOWLOntologyIndex(unittest.TestCase):
+    def test_get_axioms(self):
+        ontology = _ontology()
+
+        self.assertEqual(
+            {sub_class_of1, sub_class_of2},
+            ontology.get_axioms(OWLSubClassOfAxiom))
+        self.assertEqual(
+            {sub_class_of1, sub_class_of2, disjoint_classes},
+            ontology.get_axioms(OWLClassAxiom))
+        self.assertEqual(set(), ontology.get_axioms(OWLDataProperty))
+
+    def test_get_referencing_axioms(self):
+        ontology = _ontology()
+
+        self.assertEqual(
+            {declaration, sub_class_of1, disjoint_classes, class_assertion},
+            ontology.get_referencing_axioms(cls1))
+        # nested in a class expression
+        self.assertEqual(
+            {sub_class_of2, obj_prop_assertion},
+            ontology.get_referencing_axioms(obj_prop))
+        # in an annotation
+        self.assertEqual(
+            {sub_class_of2}, ontology.get_referencing_axioms(ann_prop))
+        self.assertEqual(
+            set(),
+            ontology.get_referencing_axioms(OWLClass(_iri('Cls4'))))
+
+    def test_get_sub_class_axioms(self):
+        ontology = _ontology()
+
+        self.assertEqual(
+            {sub_class_of1},
+            ontology.get_sub_class_axioms_for_sub_class(cls1))
+        self.assertEqual(
+            {sub_class_of1},
+            ontology.get_sub_class_axioms_for_super_class(cls2))
+        self.assertEqual(
+            {sub_class_of2},
+            ontology.get_sub_class_axioms_for_super_class(
+                OWLObjectSomeValuesFrom(obj_prop, cls3)))
+        self.assertEqual(
+            set(), ontology.get_sub_class_axioms_for_sub_class(cls3))
+
+    def test_get_assertion_axioms(self):
+        ontology = _ontology()
+
+        self.assertEqual(
+            {class_assertion}, ontology.get_class_assertion_axioms(indiv1))
+        self.assertEqual(
+            {class_assertion},
+            ontology.get_class_assertion_axioms_for_class(cls1))
+        self.assertEqual(
+            {obj_prop_assertion},
+            ontology.get_object_property_assertion_axioms(indiv1))
+        self.assertEqual(
+            set(), ontology.get_object_property_assertion_axioms(indiv2))
+        self.assertEqual(
+            {data_prop_assertion},
+            ontology.get_data_property_assertion_axioms(indiv2))
+
+    def test_add_and_remove_axioms(self):
+        ontology = _ontology()
+        self.assertEqual(
+            {sub_class_of1, sub_class_of2},
+            ontology.get_axioms(OWLSubClassOfAxiom))
+        self.assertEqual(3, len(ontology.get_axioms(OWLClassAxiom)))
+        index = ontology._index
+
+        new_axiom = OWLSubClassOfAxiom(cls3, cls1)
+        ontology.add_axiom(new_axiom)
+        ontology.remove_axiom(sub_class_of1)
+        ontology.remove_axiom(sub_class_of1)
+
+        self.assertIs(index, ontology._index)
+        self.assertEqual(
+            {new_axiom, sub_class_of2},
+            ontology.get_axioms(OWLSubClassOfAxiom))
+        self.assertEqual(
+            {new_axiom, sub_class_of2, disjoint_classes},
+            ontology.get_axioms(OWLClassAxiom))
+        self.assertEqual(
+            {new_axiom}, ontology.get_sub_class_axioms_for_super_class(cls1))
+        self.assertEqual(
+            set(), ontology.get_sub_class_axioms_for_sub_class(cls1))
+        self.assertEqual(
+            {new_axiom, sub_class_of2, disjoint_classes},
+            ontology.get_referencing_axioms(cls3))
+
+        ontology.remove_axiom(class_assertion)
+
+        self.assertEqual(
+            set(), ontology.get_class_assertion_axioms(indiv1))
+        self.assertEqual(
+            {obj_prop_assertion}, ontology.get_referencing_axioms(indiv1))
+        # entries without axioms are removed
+        self.assertNotIn(
+            (OWLClassAssertionAxiom, 'individual', indiv1),
+            ontology._index._by_field)
+
+    def test_axioms_are_read_only(self):
+        ontology = _ontology()
+        self.assertEqual(2, len(ontology.get_axioms(OWLSubClassOfAxiom)))
+
+        with self.assertRaises(AttributeError):
+            ontology.axioms.add(OWLSubClassOfAxiom(cls3, cls1))
+
+        with self.assertRaises(AttributeError):
+            ontology.axioms = {sub_class_of1}
+
+        self.assertEqual(7, len(ontology.axioms))
+        self.assertEqual(2, len(ontology.get_axioms(OWLSubClassOfAxiom)))
+
+    def test_axioms_in_list(self):
+        ontology = OWLOntology({}, [sub_class_of1, class_assertion])
+        self.assertEqual(
+            {sub_class_of1}, ontology.get_axioms(OWLSubClassOfAxiom))
+
+        ontology.remove_axiom(sub_class_of1)
+        ontology.add_axiom(sub_class_of2)
+        ontology.add_axiom(sub_class_of2)
+
+        self.assertEqual(
+            [class_assertion, sub_class_of2], list(ontology.axioms))
+        self.assertEqual(
+            {sub_class_of2}, ontology.get_axioms(OWLSubClassOfAxiom))
+
+    def test_index_isnt_pickled(self):
+        ontology = _ontology()
+        ontology.get_axioms(OWLSubClassOfAxiom)
+
+        self.assertNotIn('_index', ontology.__getstate__())
+
+        copy = pickle.loads(pickle.dumps(ontology))
+        self.assertEqual(
+            {sub_class_of1}, copy.get_sub_class_axioms_for_sub_class(cls1))
+
+
+class TestSignature(unittest.TestCase):
+    def test_axiom_signature(self):
+        self.assertEqual({cls1}, declaration.signature())
+        self.assertEqual(
+            {cls2, obj_prop, cls3, ann_prop}, sub_class_of2.signature())
+        self.assertEqual({obj_prop, cls3}, some.signature())
+        self.assertEqual({cls1}, cls1.signature())
+        self.assertEqual(
+            {indiv2, data_prop, xsd_int}, data_prop_assertion.signature())
+
+    def test_literal_datatypes(self):
+        self.assertEqual(
+            {data_prop, OWLDatatype(XSD.integer)},
+            OWLDataHasValue(
+                data_prop, Literal('1', datatype=XSD.integer)).signature())
+        self.assertEqual(
+            {OWLDatatype(XSD.integer), OWLDatatype(XSD.string)},
+            OWLDataOneOf(
+                Literal('1', datatype=XSD.integer),
+                Literal('a', datatype=XSD.string)).signature())
+        self.assertEqual(
+            {xsd_int, OWLDatatype(XSD.integer)},
+            OWLDatatypeRestriction(
+                xsd_int,
+                [OWLFacetRestriction(
+                    XSD.minInclusive,
+                    Literal('5', datatype=XSD.integer))]).signature())
+        # literals without datatype don't add one
+        self.assertEqual(
+            {data_prop},
+            OWLDataHasValue(data_prop, Literal('a', lang='en')).signature())
+
+    def test_literal_datatypes_arent_interned(self):
+        # the default data factory may not be the one the other entities
+        # come from
+        with mock.patch.object(DEFAULT_DATA_FACTORY, 'entity') as entity:
+            self.assertIn(xsd_int, data_prop_assertion.signature())
+
+        entity.assert_not_called()
+
+    def test_ontology_signature(self):
+        ontology = _ontology()
+
+        self.assertEqual(
+            {cls1, cls2, cls3, obj_prop, data_prop, ann_prop, indiv1, indiv2,
+             xsd_int},
+            ontology.signature())
+        self.assertEqual({cls1, cls2, cls3}, ontology.classes_in_signature())
+        self.assertEqual(
+            {obj_prop}, ontology.object_properties_in_signature())
+        self.assertEqual(
+            {data_prop}, ontology.data_properties_in_signature())
+        self.assertEqual(
+            {ann_prop}, ontology.annotation_properties_in_signature())
+        self.assertEqual(
+            {indiv1, indiv2}, ontology.individuals_in_signature())
+        # the datatype of the literal of the data property assertion
+        self.assertEqual({xsd_int}, ontology.datatypes_in_signature())
+
+    def test_signature_is_kept_up_to_date(self):
+        ontology = _ontology()
+        self.assertEqual({cls1, cls2, cls3}, ontology.classes_in_signature())
+
+        cls4 = OWLClass(_iri('Cls4'))
+        ontology.add_axiom(OWLSubClassOfAxiom(cls4, cls1))
+        ontology.remove_axiom(sub_class_of2)
+
+        self.assertEqual(
+            {cls1, cls2, cls3, cls4}, ontology.classes_in_signature())
+        # objProp1 is still used by the object property assertion
+        self.assertEqual(
+            {obj_prop}, ontology.object_properties_in_signature())
+        self.assertEqual(
+            set(), ontology.annotation_properties_in_signature())
+
+        ontology.remove_axiom(disjoint_classes)
+
+        self.assertEqual({cls1, cls2, cls4}, ontology.classes_in_signature())
+        self.assertNotIn(cls3, ontology.signature())
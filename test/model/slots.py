@@ -0,0 +1,66 @@
+import pickle
+import unittest
+
+from rdflib import Literal, XSD
+
+from morelianoctua.model.axioms import OWLAxiom
+from morelianoctua.model.axioms.assertionaxiom import \
+    OWLDataPropertyAssertionAxiom
+from morelianoctua.model.axioms.classaxiom import OWLDisjointUnionAxiom
+from morelianoctua.model.axioms.declarationaxiom import \
+    OWLClassDeclarationAxiom
+from morelianoctua.model.objects import OWLObject
+from morelianoctua.model.objects.annotation import OWLAnnotation
+from morelianoctua.model.objects.classexpression import OWLClass, \
+    OWLObjectSomeValuesFrom
+from morelianoctua.model.objects.individual import OWLNamedIndividual
+from morelianoctua.model.objects.property import OWLObjectProperty, \
+    OWLDataProperty
+
+# importing the modules of all axiom types registers them as subclasses
+import morelianoctua.model.axioms.owldatapropertyaxiom  # noqa: F401
+import morelianoctua.model.axioms.owlobjectpropertyaxiom  # noqa: F401
+
+
+def _subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+class TestSlots(unittest.TestCase):
+    def test_no_instance_dict(self):
+        for cls in [OWLAnnotation, *_subclasses(OWLObject),
+                    *_subclasses(OWLAxiom)]:
+            if not cls.__module__.startswith('morelianoctua.model'):
+                continue
+
+            with self.subTest(cls=cls.__name__):
+                self.assertEqual(0, cls.__dictoffset__)
+
+    def test_pickle(self):
+        axioms = [
+            OWLClassDeclarationAxiom(OWLClass('http://ex.com/ont#Cls1')),
+            OWLDisjointUnionAxiom(
+                OWLClass('http://ex.com/ont#Cls1'),
+                {OWLClass('http://ex.com/ont#Cls2'),
+                 OWLObjectSomeValuesFrom(
+                     OWLObjectProperty('http://ex.com/ont#objProp1'),
+                     OWLClass('http://ex.com/ont#Cls3'))}),
+            OWLDataPropertyAssertionAxiom(
+                OWLNamedIndividual('http://ex.com/ont#indiv1'),
+                OWLDataProperty('http://ex.com/ont#dataProp1'),
+                Literal('23', datatype=XSD.int)),
+        ]
+
+        for axiom in axioms:
+            copy = pickle.loads(pickle.dumps(axiom))
+
+            self.assertIs(type(axiom), type(copy))
+            self.assertEqual(hash(axiom), hash(copy))
+
+        self.assertEqual(axioms[1:], pickle.loads(pickle.dumps(axioms[1:])))
+
+
+if __name__ == '__main__':
+    unittest.main()
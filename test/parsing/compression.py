@@ -0,0 +1,54 @@
+import bz2
+import gzip
+import lzma
+import os
+import tempfile
+import unittest
+
+from morelianoctua.parsing.compression import detect_compression, \
+    open_document
+
+document = b'Ontology(<http://example.com/ont>)\n' * 1000
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        fd, self.file_path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.file_path)
+
+    def _write(self, content):
+        with open(self.file_path, 'wb') as document_file:
+            document_file.write(content)
+
+    def test_compressed(self):
+        for compression, compress in [
+                ('gzip', gzip.compress),
+                ('bz2', bz2.compress),
+                ('xz', lzma.compress)]:
+            self._write(compress(document))
+
+            self.assertEqual(
+                compression, detect_compression(self.file_path))
+
+            with open_document(self.file_path) as document_file:
+                self.assertEqual(document[:100], document_file.read(100))
+                self.assertEqual(document[100:], document_file.read())
+
+    def test_uncompressed(self):
+        self._write(document)
+
+        self.assertIsNone(detect_compression(self.file_path))
+
+        with open_document(self.file_path) as document_file:
+            self.assertEqual(document, document_file.read())
+
+    def test_empty(self):
+        self._write(b'')
+
+        self.assertIsNone(detect_compression(self.file_path))
+
+        with open_document(self.file_path) as document_file:
+            self.assertEqual(b'', document_file.read())
@@ -0,0 +1,260 @@
+import os
+import tempfile
+import unittest
+
+from rdflib import URIRef, Literal, XSD
+
+from morelianoctua.model import OWLOntology
+from morelianoctua.model.objects.annotation import OWLAnnotation
+from morelianoctua.model.objects.classexpression import OWLClass
+from morelianoctua.model.objects.property import OWLAnnotationProperty
+from morelianoctua.parsing.fastfunctional import FastFunctionalSyntaxParser
+from morelianoctua.parsing.functional import FunctionalSyntaxParser
+from test.parsing import functional
+
+ontology_document = """Prefix(:=<http://example.com/ont#>)
+Prefix(ex:=<http://example.com/ont#>)
+Prefix(rdfs:=<http://www.w3.org/2000/01/rdf-schema#>)
+Prefix(xsd:=<http://www.w3.org/2001/XMLSchema#>)
+
+Ontology(<http://example.com/ont> <http://example.com/ont/1.0>
+Annotation(rdfs:comment "An example ontology")
+
+# a comment
+Declaration(Class(ex:Cls1))
+Declaration(ObjectProperty(ex:objProp1))
+Declaration(Annotation(rdfs:label "data prop") DataProperty(ex:dataProp1))
+SubClassOf(ex:Cls1 ObjectSomeValuesFrom(ex:objProp1 :Cls2))
+SubClassOf(Annotation(rdfs:comment "nested") ex:Cls2 ObjectIntersectionOf(
+    ex:Cls3 ObjectUnionOf(ex:Cls4 ObjectComplementOf(ex:Cls5))
+    ObjectMinCardinality(2 ObjectInverseOf(ex:objProp1) ex:Cls1)))
+EquivalentClasses(ex:Cls6 DataMinCardinality(3 ex:dataProp1)
+    DataSomeValuesFrom(ex:dataProp1 DatatypeRestriction(
+        xsd:int xsd:minInclusive "5"^^xsd:int)))
+DisjointClasses(ex:Cls1 ex:Cls2 ex:Cls3)
+DisjointUnion(ex:Cls1 ex:Cls2 ex:Cls3)
+SubObjectPropertyOf(ex:objProp1 ex:objProp2)
+InverseObjectProperties(ex:objProp1 ex:objProp3)
+ObjectPropertyDomain(ex:objProp1 ex:Cls1)
+ObjectPropertyRange(ex:objProp1 ObjectOneOf(ex:indiv1 ex:indiv2))
+DataPropertyDomain(ex:dataProp1 DataHasValue(ex:dataProp2 "23"^^xsd:int))
+DataPropertyRange(ex:dataProp1 DataUnionOf(xsd:int xsd:string))
+ClassAssertion(ex:Cls1 ex:indiv1)
+ClassAssertion(ObjectHasValue(ex:objProp1 ex:indiv2) _:anon1)
+ObjectPropertyAssertion(ex:objProp1 ex:indiv1 ex:indiv2)
+DataPropertyAssertion(ex:dataProp1 ex:indiv1 "some value"@en)
+DataPropertyAssertion(ex:dataProp1 ex:indiv2 "42"^^xsd:integer)
+)
+"""
+
+
+class _Production(object):
+    def __init__(self, parse_fn):
+        self._parse_fn = parse_fn
+
+    def parseString(self, text, parseAll=False):
+        # the fast parser always has to consume the whole input
+        return [self._parse_fn(text)]
+
+
+class _FastParserProductions(object):
+    """Exposes the entry points of the fast parser under the names of the
+    pyparsing grammar elements, so that all the tests written for
+    FunctionalSyntaxParser can be run against FastFunctionalSyntaxParser
+    """
+    _entry_points = {
+        'iri': 'parse_iri',
+        'literal': 'parse_literal',
+        'annotation': 'parse_annotation',
+        'anonymous_individual': 'parse_individual',
+        'inverse_obj_prop': 'parse_object_property_expression',
+        'class_': 'parse_class_expression',
+    }
+
+    def __init__(self, parser: FastFunctionalSyntaxParser):
+        self._parser = parser
+
+    def __getattr__(self, name):
+        if name in self._entry_points:
+            entry_point = self._entry_points[name]
+        elif name.startswith('object_') and not name.startswith(
+                'object_property_'):
+            entry_point = 'parse_class_expression'
+        elif name in ('data_some_values_from', 'data_all_values_from',
+                      'data_has_value', 'data_min_cardinality',
+                      'data_max_cardinality', 'data_exact_cardinality'):
+            entry_point = 'parse_class_expression'
+        elif name.startswith('data') and not name.startswith('data_property_'):
+            entry_point = 'parse_data_range'
+        else:
+            entry_point = 'parse_axiom'
+
+        return _Production(getattr(self._parser, entry_point))
+
+
+class TestFastFunctionalSyntaxParserProductions(
+        functional.TestFunctionalSyntaxParser):
+
+    @staticmethod
+    def make_parser(prefixes=None):
+        return _FastParserProductions(
+            FastFunctionalSyntaxParser(prefixes=prefixes))
+
+
+class TestFastIterAxioms(functional.TestIterAxioms):
+    parser_cls = FastFunctionalSyntaxParser
+
+
+class TestFastParallelParsing(functional.TestParallelParsing):
+    parser_cls = FastFunctionalSyntaxParser
+
+
+class TestFastConcurrentParses(functional.TestConcurrentParses):
+    parser_cls = FastFunctionalSyntaxParser
+
+
+class TestFastEntityInterning(functional.TestEntityInterning):
+    parser_cls = FastFunctionalSyntaxParser
+
+
+class TestFastSnapshotCache(functional.TestSnapshotCache):
+    parser_cls = FastFunctionalSyntaxParser
+
+
+class TestFastScans(functional.TestScans):
+    parser_cls = FastFunctionalSyntaxParser
+
+
+class TestFastAxiomFiltering(functional.TestAxiomFiltering):
+    parser_cls = FastFunctionalSyntaxParser
+
+
+class TestFastCompressedDocuments(functional.TestCompressedDocuments):
+    parser_cls = FastFunctionalSyntaxParser
+
+
+class TestFastParseStream(functional.TestParseStream):
+    parser_cls = FastFunctionalSyntaxParser
+
+
+class TestFastLazyLiterals(functional.TestLazyLiterals):
+    parser_cls = FastFunctionalSyntaxParser
+
+
+class TestFastParseMany(functional.TestParseMany):
+    parser_cls = FastFunctionalSyntaxParser
+
+
+class TestFastIndexFile(functional.TestIndexFile):
+    parser_cls = FastFunctionalSyntaxParser
+
+
+class TestFastReparseDocument(functional.TestReparseDocument):
+    parser_cls = FastFunctionalSyntaxParser
+
+
+class TestFastDataFactory(functional.TestDataFactory):
+    parser_cls = FastFunctionalSyntaxParser
+
+
+class TestFastFunctionalSyntaxParser(unittest.TestCase):
+    def test_parse_file_conformance(self):
+        fd, file_path = tempfile.mkstemp(suffix='.ofn')
+
+        try:
+            with os.fdopen(fd, 'w') as ontology_file:
+                ontology_file.write(ontology_document)
+
+            expected = FunctionalSyntaxParser().parse_file(file_path)
+            ontology = FastFunctionalSyntaxParser().parse_file(file_path)
+        finally:
+            os.remove(file_path)
+
+        self.assertEqual(expected.prefixes, ontology.prefixes)
+        self.assertEqual(expected.iri, ontology.iri)
+        self.assertEqual(expected.version_iri, ontology.version_iri)
+        self.assertEqual(expected.annotations, ontology.annotations)
+        self.assertEqual(expected.axioms, ontology.axioms)
+        self.assertEqual(19, len(ontology.axioms))
+
+    def test_index_file_conformance(self):
+        fd, file_path = tempfile.mkstemp(suffix='.ofn')
+        index_path = f'{file_path}.index'
+
+        try:
+            with os.fdopen(fd, 'w') as ontology_file:
+                ontology_file.write(ontology_document)
+
+            expected = FunctionalSyntaxParser().index_file(file_path)
+            index = FastFunctionalSyntaxParser().index_file(file_path)
+        finally:
+            os.remove(file_path)
+            os.remove(index_path)
+
+        self.assertEqual(expected.offsets, index.offsets)
+        self.assertEqual(expected._ordinals, index._ordinals)
+        # the datatypes of literals count as mentioned entities
+        self.assertEqual(
+            [18],
+            index.ordinals_of('http://www.w3.org/2001/XMLSchema#integer'))
+
+    def test_parse_string(self):
+        ontology = FastFunctionalSyntaxParser().parse_string(ontology_document)
+
+        self.assertEqual(URIRef('http://example.com/ont'), ontology.iri)
+        self.assertEqual(
+            URIRef('http://example.com/ont/1.0'), ontology.version_iri)
+        self.assertEqual(
+            [OWLAnnotation(
+                OWLAnnotationProperty(
+                    'http://www.w3.org/2000/01/rdf-schema#comment'),
+                Literal('An example ontology'))],
+            ontology.annotations)
+        self.assertEqual(
+            URIRef('http://example.com/ont#'),
+            ontology.prefixes[OWLOntology.default_prefix_dummy])
+
+    def test_quoted_string_escapes(self):
+        parser = FastFunctionalSyntaxParser(
+            prefixes={'xsd': 'http://www.w3.org/2001/XMLSchema#'})
+
+        self.assertEqual(
+            Literal('say "hello"\\world', None, XSD.string),
+            parser.parse_literal(r'"say \"hello\"\\world"^^xsd:string'))
+        self.assertEqual(
+            Literal('two  spaces\nand a # hash'),
+            parser.parse_literal('"two  spaces\nand a # hash"'))
+
+    def test_syntax_errors(self):
+        parser = FastFunctionalSyntaxParser(
+            prefixes={'ex': 'http://example.com#'})
+
+        self.assertEqual(
+            OWLClass('http://example.com#Cls'),
+            parser.parse_class_expression('ex:Cls # a comment'))
+
+        with self.assertRaises(RuntimeError):
+            parser.parse_axiom('SubClassOf(ex:Cls1 ex:Cls2')
+
+        with self.assertRaises(RuntimeError):
+            parser.parse_axiom('SubClassOf(ex:Cls1 ex:Cls2 ex:Cls3)')
+
+        with self.assertRaises(RuntimeError):
+            parser.parse_axiom('UnknownAxiom(ex:Cls1)')
+
+        with self.assertRaises(RuntimeError):
+            parser.parse_class_expression('ObjectUnionOf(ex:Cls1)')
+
+        with self.assertRaises(RuntimeError):
+            parser.parse_class_expression('unknown:Cls')
+
+    def test_parse_empty_file(self):
+        # empty files can't be memory mapped and are read as a stream
+        fd, file_path = tempfile.mkstemp(suffix='.ofn')
+        os.close(fd)
+
+        try:
+            with self.assertRaises(RuntimeError):
+                FastFunctionalSyntaxParser().parse_file(file_path)
+        finally:
+            os.remove(file_path)
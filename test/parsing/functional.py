@@ -1,36 +1,60 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import shutil
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
+from pyparsing import ParserElement
 from rdflib import URIRef, Literal, XSD, BNode
 
 from morelianoctua.model import OWLOntology
-from morelianoctua.model import OWLClassAssertionAxiom, \
+from morelianoctua.model.axioms.assertionaxiom import OWLClassAssertionAxiom, \
     OWLObjectPropertyAssertionAxiom, OWLDataPropertyAssertionAxiom
 from morelianoctua.model.axioms.classaxiom import OWLSubClassOfAxiom, \
-    OWLEquivalentClassesAxiom, OWLDisjointClassesAxiom, OWLDisjointUnionAxiom
-from morelianoctua.model import OWLDataPropertyDomainAxiom, \
-    OWLDataPropertyRangeAxiom
-from morelianoctua.model import \
+    OWLEquivalentClassesAxiom, OWLDisjointClassesAxiom, \
+    OWLDisjointUnionAxiom, OWLClassAxiom
+from morelianoctua.model.axioms.declarationaxiom import \
+    OWLDeclarationAxiom, OWLClassDeclarationAxiom, \
+    OWLNamedIndividualDeclarationAxiom, OWLObjectPropertyDeclarationAxiom
+from morelianoctua.model.axioms.owldatapropertyaxiom import \
+    OWLDataPropertyDomainAxiom, OWLDataPropertyRangeAxiom
+from morelianoctua.model.axioms.owlobjectpropertyaxiom import \
     OWLSubObjectPropertyOfAxiom, OWLEquivalentObjectPropertiesAxiom, \
     OWLDisjointObjectPropertiesAxiom, OWLInverseObjectPropertiesAxiom, \
     OWLObjectPropertyDomainAxiom, OWLObjectPropertyRangeAxiom
-from morelianoctua.model.objects import OWLAnnotation
-from morelianoctua.model.objects import OWLClass, OWLObjectIntersectionOf, \
-    OWLObjectUnionOf, OWLObjectComplementOf, OWLObjectOneOf, \
-    OWLObjectSomeValuesFrom, OWLObjectAllValuesFrom, OWLObjectHasValue, \
-    OWLObjectHasSelf, OWLObjectMinCardinality, OWLObjectMaxCardinality, \
-    OWLObjectExactCardinality, OWLDataSomeValuesFrom, OWLDataAllValuesFrom, \
-    OWLDataHasValue, OWLDataMinCardinality, OWLDataMaxCardinality, \
-    OWLDataExactCardinality
+from morelianoctua.model.datafactory import OWLDataFactory
+from morelianoctua.model.objects.annotation import OWLAnnotation
+from morelianoctua.model.objects.classexpression import OWLClass, \
+    OWLObjectIntersectionOf, OWLObjectUnionOf, OWLObjectComplementOf, \
+    OWLObjectOneOf, OWLObjectSomeValuesFrom, OWLObjectAllValuesFrom, \
+    OWLObjectHasValue, OWLObjectHasSelf, OWLObjectMinCardinality, \
+    OWLObjectMaxCardinality, OWLObjectExactCardinality, \
+    OWLDataSomeValuesFrom, OWLDataAllValuesFrom, OWLDataHasValue, \
+    OWLDataMinCardinality, OWLDataMaxCardinality, OWLDataExactCardinality
 from morelianoctua.model.objects.datarange import OWLDataIntersectionOf, OWLDataComplementOf, \
     OWLDatatype, OWLDataOneOf, OWLDatatypeRestriction
-from morelianoctua.model.objects import OWLFacetRestriction
-from morelianoctua.model.objects import OWLAnonymousIndividual, OWLNamedIndividual
-from morelianoctua.model.objects import OWLAnnotationProperty, OWLObjectInverseOf, \
-    OWLObjectProperty, OWLDataProperty
-from morelianoctua.parsing.functional import FunctionalSyntaxParser
+import morelianoctua.model.objects.facet
+from morelianoctua.model.objects.facet import OWLFacetRestriction
+from morelianoctua.model.objects.individual import OWLAnonymousIndividual, \
+    OWLNamedIndividual
+from morelianoctua.model.objects.literal import LazyLiteral
+from morelianoctua.model.objects.property import OWLAnnotationProperty, \
+    OWLObjectInverseOf, OWLObjectProperty, OWLDataProperty
+from morelianoctua.parsing.functional import FunctionalSyntaxParser, \
+    _PackratCache
+from morelianoctua.parsing.index import load_index
 
 
 class TestFunctionalSyntaxParser(unittest.TestCase):
+    @staticmethod
+    def make_parser(prefixes=None):
+        return FunctionalSyntaxParser(prefixes=prefixes)
+
     def test_iri(self):
         iri_str_1 = '<http://example.com#foo?bar>'
         iri_1 = URIRef('http://example.com#foo?bar')
@@ -44,13 +68,32 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://ex.org#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(iri_1, parser.iri.parseString(iri_str_1)[0])
         self.assertEqual(iri_2, parser.iri.parseString(iri_str_2)[0])
         self.assertEqual(iri_3, parser.iri.parseString(iri_str_3)[0])
         self.assertEqual(iri_4, parser.iri.parseString(iri_str_4)[0])
 
+    def test_iri_local_name_with_colon(self):
+        prefixes = {
+            'ex': 'http://example.com#',
+            OWLOntology.default_prefix_dummy: 'http://ex.org#'}
+        parser = self.make_parser(prefixes=prefixes)
+
+        self.assertEqual(
+            URIRef('http://example.com#foo:bar'),
+            parser.iri.parseString('ex:foo:bar', True)[0])
+        self.assertEqual(
+            URIRef('http://ex.org#foo:bar'),
+            parser.iri.parseString(':foo:bar', True)[0])
+        self.assertEqual(
+            OWLSubClassOfAxiom(
+                OWLClass('http://example.com#a:b'),
+                OWLClass('http://ex.org#c:d:e')),
+            parser.sub_class_of.parseString(
+                'SubClassOf(ex:a:b :c:d:e)', True)[0])
+
     def test_literal(self):
         lit_str_1 = '"this is a plain literal"'
         lit_1 = Literal('this is a plain literal')
@@ -69,7 +112,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         lit_7 = lit_6
 
         prefixes = {'xsd': 'http://www.w3.org/2001/XMLSchema#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(lit_1, parser.literal.parseString(lit_str_1)[0])
         self.assertEqual(lit_2, parser.literal.parseString(lit_str_2)[0])
@@ -79,6 +122,36 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         self.assertEqual(lit_6, parser.literal.parseString(lit_str_6)[0])
         self.assertEqual(lit_7, parser.literal.parseString(lit_str_7)[0])
 
+    def test_full_iri_characters(self):
+        parser = self.make_parser()
+
+        self.assertEqual(
+            URIRef('http://example.com/a~b/c+d;e?f=1&g=%20#h!i$j*k,l@m'),
+            parser.iri.parseString(
+                '<http://example.com/a~b/c+d;e?f=1&g=%20#h!i$j*k,l@m>',
+                True)[0])
+        self.assertEqual(
+            URIRef('urn:isbn:978-3-16-148410-0'),
+            parser.iri.parseString('<urn:isbn:978-3-16-148410-0>', True)[0])
+
+    def test_quoted_string_escapes(self):
+        parser = self.make_parser(
+            prefixes={'xsd': 'http://www.w3.org/2001/XMLSchema#'})
+
+        self.assertEqual(
+            Literal('say "hello"\\world', None, XSD.string),
+            parser.literal.parseString(
+                r'"say \"hello\"\\world"^^xsd:string', True)[0])
+        self.assertEqual(
+            Literal('two  spaces,\ta tab\nand a # hash'),
+            parser.literal.parseString(
+                '"two  spaces,\ta tab\nand a # hash"', True)[0])
+        self.assertEqual(
+            Literal('Grüße (aus) "Köln"', 'de'),
+            parser.literal.parseString(
+                r'"Grüße (aus) \"Köln\""@de', True)[0])
+        self.assertEqual(Literal(''), parser.literal.parseString('""')[0])
+
     def test_annotation(self):
         ann_str_1 = 'Annotation(rdfs:comment "Lalalala")'
         ann_1 = OWLAnnotation(
@@ -106,7 +179,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'rdfs': 'http://www.w3.org/2000/01/rdf-schema#',
             'ex': 'http://example.com#'}
 
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(ann_1, parser.annotation.parseString(ann_str_1)[0])
         self.assertEqual(ann_2, parser.annotation.parseString(ann_str_2)[0])
@@ -120,7 +193,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         individual_str_2 = '_:abc'
         individual_2 = OWLAnonymousIndividual(BNode('abc'))
 
-        parser = FunctionalSyntaxParser()
+        parser = self.make_parser()
 
         self.assertEqual(
             individual_1,
@@ -140,7 +213,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(expected_cls, parser.class_.parseString(cls_str_1)[0])
         self.assertEqual(expected_cls, parser.class_.parseString(cls_str_2)[0])
@@ -167,7 +240,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             intersection,
@@ -197,7 +270,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             union,
@@ -227,7 +300,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             complement_1,
@@ -284,7 +357,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             obj_one_of_1, parser.object_one_of.parseString(obj_one_of_str_1)[0])
@@ -307,7 +380,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             inv_obj_prop_1,
@@ -348,7 +421,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             obj_some_vals_from_1,
@@ -398,7 +471,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             obj_all_vals_from_1,
@@ -444,7 +517,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             obj_has_value_1,
@@ -483,7 +556,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             obj_has_self_1,
@@ -535,7 +608,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             obj_min_cardinality_1,
@@ -593,7 +666,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             obj_max_cardinality_1,
@@ -652,7 +725,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             obj_exact_cardinality_1,
@@ -707,7 +780,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             data_intersection_1,
@@ -744,7 +817,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
         prefixes = {
             'ex': 'http://example.com#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             data_complement_1,
@@ -775,7 +848,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             data_one_of_1,
@@ -806,7 +879,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             datatype_restriction_1,
@@ -835,7 +908,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             data_some_values_from_1,
@@ -869,7 +942,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             data_all_values_from_1,
@@ -903,7 +976,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             data_has_value_1,
@@ -944,7 +1017,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             data_min_cardinality_1,
@@ -1003,7 +1076,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             data_max_cardinality_1,
@@ -1064,7 +1137,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             data_exact_cardinality_1,
@@ -1140,7 +1213,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             sub_cls_of_1,
@@ -1247,7 +1320,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             equivalent_classes_1,
@@ -1335,7 +1408,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             disjoint_classes_1,
@@ -1399,7 +1472,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             disjoint_union_1,
@@ -1458,7 +1531,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             sub_obj_prop_axiom_1,
@@ -1545,7 +1618,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             equiv_obj_props_axiom_1,
@@ -1632,7 +1705,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             disjoint_obj_props_axiom_1,
@@ -1720,7 +1793,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             inverse_obj_props_axiom_1,
@@ -1815,7 +1888,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             obj_prop_domain_axiom_1,
@@ -1910,7 +1983,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             obj_prop_range_axiom_1,
@@ -2007,7 +2080,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             cls_assertion_axiom_1,
@@ -2100,7 +2173,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             obj_property_assertion_axiom_1,
@@ -2193,7 +2266,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             data_property_assertion_axiom_1,
@@ -2288,7 +2361,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             data_prop_domain_axiom_1,
@@ -2385,7 +2458,7 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             'ex': 'http://example.com#',
             'xsd': 'http://www.w3.org/2001/XMLSchema#',
             OWLOntology.default_prefix_dummy: 'http://example.com#'}
-        parser = FunctionalSyntaxParser(prefixes=prefixes)
+        parser = self.make_parser(prefixes=prefixes)
 
         self.assertEqual(
             data_prop_range_axiom_1,
@@ -2416,3 +2489,774 @@ class TestFunctionalSyntaxParser(unittest.TestCase):
             data_prop_range_axiom_2,
             parser.data_property_range.parseString(
                 data_prop_range_axiom_str_6)[0])
+
+
+streamed_document = """Prefix(:=<http://example.com/ont#>)
+Prefix(ex:=<http://example.com/ont#>)
+Prefix(rdfs:=<http://www.w3.org/2000/01/rdf-schema#>)
+Prefix(xsd:=<http://www.w3.org/2001/XMLSchema#>)
+
+Ontology(<http://example.com/ont> <http://example.com/ont/1.0>
+Import(<http://example.com/other>)
+Annotation(rdfs:comment "An example ontology")
+
+Declaration(Class(ex:Cls1))
+SubClassOf(ex:Cls1 ObjectSomeValuesFrom(ex:objProp1 :Cls2))
+ClassAssertion(ex:Cls1 ex:indiv1)
+DataPropertyAssertion(ex:dataProp1 ex:indiv1 "23"^^xsd:int)
+)
+"""
+
+
+class _DocumentTestCase(unittest.TestCase):
+    """Base of the tests parsing streamed_document, which is written to the
+    temporary file file_path
+    """
+    parser_cls = FunctionalSyntaxParser
+
+    def setUp(self):
+        self.file_path = self._temp_document(streamed_document)
+
+    def _temp_document(self, document) -> str:
+        """Writes document to a temporary file removed after the test"""
+        fd, file_path = tempfile.mkstemp(suffix='.ofn')
+        self.addCleanup(os.remove, file_path)
+
+        with os.fdopen(fd, 'w') as ontology_file:
+            ontology_file.write(document)
+
+        return file_path
+
+    def _edit_document(self, document):
+        """Replaces the content of file_path by document"""
+        with open(self.file_path, 'w') as ontology_file:
+            ontology_file.write(document)
+
+
+class TestIterAxioms(_DocumentTestCase):
+    def test_header(self):
+        with self.parser_cls().iter_axioms(self.file_path) as stream:
+            self.assertEqual(
+                URIRef('http://example.com/ont#'),
+                stream.prefixes[OWLOntology.default_prefix_dummy])
+            self.assertEqual(
+                URIRef('http://www.w3.org/2001/XMLSchema#'),
+                stream.prefixes['xsd'])
+            self.assertEqual(URIRef('http://example.com/ont'), stream.iri)
+            self.assertEqual(
+                URIRef('http://example.com/ont/1.0'), stream.version_iri)
+            self.assertEqual(
+                [OWLAnnotation(
+                    OWLAnnotationProperty(
+                        'http://www.w3.org/2000/01/rdf-schema#comment'),
+                    Literal('An example ontology'))],
+                stream.annotations)
+
+    def test_axioms(self):
+        stream = self.parser_cls().iter_axioms(self.file_path)
+        axioms = list(stream)
+
+        self.assertEqual(4, len(axioms))
+        self.assertIsInstance(axioms[0], OWLClassDeclarationAxiom)
+        self.assertEqual(
+            [
+                OWLSubClassOfAxiom(
+                    OWLClass('http://example.com/ont#Cls1'),
+                    OWLObjectSomeValuesFrom(
+                        OWLObjectProperty('http://example.com/ont#objProp1'),
+                        OWLClass('http://example.com/ont#Cls2'))),
+                OWLClassAssertionAxiom(
+                    OWLNamedIndividual('http://example.com/ont#indiv1'),
+                    OWLClass('http://example.com/ont#Cls1')),
+                OWLDataPropertyAssertionAxiom(
+                    OWLNamedIndividual('http://example.com/ont#indiv1'),
+                    OWLDataProperty('http://example.com/ont#dataProp1'),
+                    Literal('23', None, XSD.int))
+            ],
+            axioms[1:])
+
+    def test_empty_ontology(self):
+        self._edit_document('Ontology()\n')
+
+        with self.parser_cls().iter_axioms(self.file_path) as stream:
+            self.assertIsNone(stream.iri)
+            self.assertEqual([], list(stream))
+
+    def test_imports(self):
+        self._edit_document(streamed_document.replace(
+            'Import(<http://example.com/other>)',
+            'Import(<http://example.com/other>)\n'
+            '# imported as well\n'
+            'Import(ex:another)'))
+
+        imports = [
+            URIRef('http://example.com/other'),
+            URIRef('http://example.com/ont#another')]
+
+        ontology = self.parser_cls().parse_file(self.file_path)
+        self.assertEqual(imports, ontology.imports)
+        self.assertEqual(4, len(ontology.axioms))
+
+        with self.parser_cls().iter_axioms(self.file_path) as stream:
+            self.assertEqual(imports, stream.imports)
+
+
+class TestParallelParsing(_DocumentTestCase):
+    def test_parse_file_with_workers(self):
+        # each axiom is parsed as a separate byte range
+        with mock.patch(
+                'morelianoctua.parsing.functional._min_batch_size', 1):
+            ontology = self.parser_cls().parse_file(self.file_path, workers=2)
+
+        with self.parser_cls().iter_axioms(self.file_path) as stream:
+            expected = list(stream)
+
+        self.assertEqual(URIRef('http://example.com/ont'), ontology.iri)
+        self.assertEqual(
+            URIRef('http://example.com/ont/1.0'), ontology.version_iri)
+        self.assertEqual(
+            URIRef('http://www.w3.org/2001/XMLSchema#'),
+            ontology.prefixes['xsd'])
+        self.assertEqual(len(expected), len(ontology.axioms))
+        self.assertEqual(set(expected), ontology.axioms)
+
+
+class TestConcurrentParses(_DocumentTestCase):
+    def test_concurrent_parses(self):
+        # the same parser parses documents declaring different prefixes from
+        # several threads at the same time
+        file_paths = [
+            self._temp_document(streamed_document.replace(
+                'Prefix(ex:=<http://example.com/ont#>)',
+                f'Prefix(ex:=<http://example.com/ont{i}#>)'))
+            for i in range(4)]
+
+        parser = self.parser_cls()
+
+        def parse(i):
+            return parser.parse_file(file_paths[i % 4])
+
+        with ThreadPoolExecutor(4) as executor:
+            ontologies = list(executor.map(parse, range(16)))
+
+        for i, ontology in enumerate(ontologies):
+            namespace = f'http://example.com/ont{i % 4}#'
+            self.assertIn(
+                OWLClassAssertionAxiom(
+                    OWLNamedIndividual(namespace + 'indiv1'),
+                    OWLClass(namespace + 'Cls1')),
+                ontology.axioms)
+
+        # the prefixes of the documents don't leak into the parser
+        self.assertEqual({}, parser._prefixes)
+
+
+class TestEntityInterning(_DocumentTestCase):
+    def test_interned_entities(self):
+        ontology = self.parser_cls().parse_file(self.file_path)
+        axioms = {type(axiom): axiom for axiom in ontology.axioms}
+
+        class_assertion = axioms[OWLClassAssertionAxiom]
+        data_prop_assertion = axioms[OWLDataPropertyAssertionAxiom]
+        sub_class_of = axioms[OWLSubClassOfAxiom]
+
+        self.assertIs(
+            class_assertion.individual,
+            data_prop_assertion.subject_individual)
+        self.assertIs(
+            class_assertion.class_expression, sub_class_of.sub_class)
+        self.assertIs(
+            sub_class_of.sub_class,
+            axioms[OWLClassDeclarationAxiom].cls)
+
+    def test_entity_factory(self):
+        created = []
+
+        def entity_factory(entity_cls, iri):
+            created.append((entity_cls, iri))
+            return entity_cls(iri)
+
+        ontology = self.parser_cls(entity_factory=entity_factory).parse_file(
+            self.file_path)
+        classes = [
+            iri for entity_cls, iri in created if entity_cls == OWLClass]
+
+        self.assertEqual(4, len(ontology.axioms))
+        self.assertEqual(
+            [URIRef('http://example.com/ont#Cls1'),
+             URIRef('http://example.com/ont#Cls1'),
+             URIRef('http://example.com/ont#Cls2'),
+             URIRef('http://example.com/ont#Cls1')],
+            classes)
+
+
+class TestSnapshotCache(_DocumentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+
+    def test_parse_file_with_cache(self):
+        parser = self.parser_cls()
+
+        parsed = parser.parse_file(
+            self.file_path, cache_dir=self.cache_dir)
+        snapshots = os.listdir(self.cache_dir)
+
+        with mock.patch.object(
+                self.parser_cls, '_parse_file',
+                side_effect=AssertionError('not loaded from the cache')):
+            loaded = parser.parse_file(
+                self.file_path, cache_dir=self.cache_dir)
+
+        self.assertEqual(1, len(snapshots))
+        self.assertEqual(parsed.iri, loaded.iri)
+        self.assertEqual(parsed.version_iri, loaded.version_iri)
+        self.assertEqual(parsed.prefixes, loaded.prefixes)
+        self.assertEqual(parsed.annotations, loaded.annotations)
+        self.assertEqual(parsed.axioms, loaded.axioms)
+
+        axioms = {type(axiom): axiom for axiom in loaded.axioms}
+        literal = axioms[OWLDataPropertyAssertionAxiom].value
+        self.assertEqual(Literal('23', None, XSD.int), literal)
+        self.assertEqual(23, literal.value)
+        self.assertIs(
+            axioms[OWLClassAssertionAxiom].class_expression,
+            axioms[OWLSubClassOfAxiom].sub_class)
+
+    def test_parse_file_with_cache_after_change(self):
+        parser = self.parser_cls()
+        parser.parse_file(self.file_path, cache_dir=self.cache_dir)
+
+        self._edit_document(streamed_document.replace('Cls2', 'Cls3'))
+
+        ontology = parser.parse_file(
+            self.file_path, cache_dir=self.cache_dir)
+
+        self.assertEqual(2, len(os.listdir(self.cache_dir)))
+        self.assertIn(
+            OWLClass('http://example.com/ont#Cls3'),
+            [axiom.super_class.filler for axiom in ontology.axioms
+             if isinstance(axiom, OWLSubClassOfAxiom)])
+
+    def test_parse_file_with_cache_and_lazy_literals(self):
+        eager = self.parser_cls().parse_file(
+            self.file_path, cache_dir=self.cache_dir)
+        lazy = self.parser_cls(lazy_literals=True).parse_file(
+            self.file_path, cache_dir=self.cache_dir)
+
+        self.assertEqual(2, len(os.listdir(self.cache_dir)))
+        for ontology, literal_type in [(eager, Literal), (lazy, LazyLiteral)]:
+            literal, = [
+                axiom.value for axiom in ontology.axioms
+                if isinstance(axiom, OWLDataPropertyAssertionAxiom)]
+            self.assertIs(literal_type, type(literal))
+
+    def test_parse_file_with_broken_cache(self):
+        parser = self.parser_cls()
+        parser.parse_file(self.file_path, cache_dir=self.cache_dir)
+        snapshot_path, = os.listdir(self.cache_dir)
+
+        snapshot_path = os.path.join(self.cache_dir, snapshot_path)
+        with open(snapshot_path, 'r+b') as snapshot:
+            snapshot.truncate(10)
+
+        ontology = parser.parse_file(
+            self.file_path, cache_dir=self.cache_dir)
+
+        self.assertEqual(4, len(ontology.axioms))
+        # the broken snapshot got replaced
+        self.assertEqual(
+            4, len(parser.parse_file(
+                self.file_path, cache_dir=self.cache_dir).axioms))
+        self.assertGreater(os.path.getsize(snapshot_path), 10)
+
+
+class TestScans(_DocumentTestCase):
+    def test_scan_header(self):
+        ontology = self.parser_cls().scan_header(self.file_path)
+
+        self.assertEqual(URIRef('http://example.com/ont'), ontology.iri)
+        self.assertEqual(
+            URIRef('http://example.com/ont/1.0'), ontology.version_iri)
+        self.assertEqual(
+            URIRef('http://www.w3.org/2001/XMLSchema#'),
+            ontology.prefixes['xsd'])
+        self.assertEqual(
+            [URIRef('http://example.com/other')], ontology.imports)
+        self.assertEqual(1, len(ontology.annotations))
+        self.assertEqual(set(), ontology.axioms)
+
+    def test_scan_declarations(self):
+        self._edit_document(streamed_document.replace(
+            'Declaration(Class(ex:Cls1))',
+            'Declaration(Class(ex:Cls1))\n'
+            'SubClassOf(ex:Cls2 ex:Cls3)\n'
+            'Declaration(NamedIndividual(ex:indiv1))\n'
+            'Declaration(Annotation(rdfs:comment "A property") '
+            'ObjectProperty(ex:objProp1))'))
+
+        ontology = self.parser_cls().scan_declarations(self.file_path)
+        declarations = {
+            type(axiom): axiom for axiom in ontology.axioms}
+
+        self.assertEqual(URIRef('http://example.com/ont'), ontology.iri)
+        self.assertEqual(
+            [URIRef('http://example.com/other')], ontology.imports)
+        self.assertEqual(
+            {OWLClassDeclarationAxiom, OWLNamedIndividualDeclarationAxiom,
+             OWLObjectPropertyDeclarationAxiom},
+            set(declarations))
+        self.assertEqual(
+            OWLClass('http://example.com/ont#Cls1'),
+            declarations[OWLClassDeclarationAxiom].cls)
+        self.assertEqual(
+            OWLObjectProperty('http://example.com/ont#objProp1'),
+            declarations[OWLObjectPropertyDeclarationAxiom].object_property)
+
+    def test_scan_declarations_empty_ontology(self):
+        self._edit_document('Ontology(<http://example.com/ont>)\n')
+
+        ontology = self.parser_cls().scan_declarations(self.file_path)
+
+        self.assertEqual(URIRef('http://example.com/ont'), ontology.iri)
+        self.assertEqual(set(), ontology.axioms)
+
+
+class TestAxiomFiltering(_DocumentTestCase):
+    def test_parse_file_include(self):
+        parse_axiom_element = mock.patch.object(
+            self.parser_cls, '_parse_axiom_element', autospec=True,
+            side_effect=self.parser_cls._parse_axiom_element)
+
+        with parse_axiom_element as parsed:
+            ontology = self.parser_cls().parse_file(
+                self.file_path,
+                include=[
+                    OWLClassAssertionAxiom, OWLDataPropertyAssertionAxiom])
+
+        # the other axioms weren't parsed at all
+        self.assertEqual(2, parsed.call_count)
+        self.assertEqual(
+            {OWLClassAssertionAxiom(
+                OWLNamedIndividual('http://example.com/ont#indiv1'),
+                OWLClass('http://example.com/ont#Cls1')),
+             OWLDataPropertyAssertionAxiom(
+                OWLNamedIndividual('http://example.com/ont#indiv1'),
+                OWLDataProperty('http://example.com/ont#dataProp1'),
+                Literal('23', None, XSD.int))},
+            ontology.axioms)
+        self.assertEqual(URIRef('http://example.com/ont'), ontology.iri)
+
+        ontology = self.parser_cls().parse_file(
+            self.file_path, include=[OWLClassAxiom])
+        self.assertEqual(
+            [OWLSubClassOfAxiom], [type(a) for a in ontology.axioms])
+
+    def test_parse_file_exclude(self):
+        ontology = self.parser_cls().parse_file(
+            self.file_path,
+            exclude=[OWLDeclarationAxiom, OWLDataPropertyAssertionAxiom])
+
+        self.assertEqual(
+            {OWLSubClassOfAxiom, OWLClassAssertionAxiom},
+            {type(axiom) for axiom in ontology.axioms})
+
+        # declarations of other entity types are still parsed
+        ontology = self.parser_cls().parse_file(
+            self.file_path, include=[OWLDeclarationAxiom],
+            exclude=[OWLClassDeclarationAxiom])
+        self.assertEqual(set(), ontology.axioms)
+
+    def test_iter_axioms_include(self):
+        with self.parser_cls().iter_axioms(
+                self.file_path, include=[OWLSubClassOfAxiom]) as stream:
+            self.assertEqual(
+                [OWLSubClassOfAxiom], [type(axiom) for axiom in stream])
+
+    def test_parse_file_include_with_workers(self):
+        with mock.patch(
+                'morelianoctua.parsing.functional._min_batch_size', 1):
+            ontology = self.parser_cls().parse_file(
+                self.file_path, workers=2,
+                include=[OWLClassAssertionAxiom, OWLSubClassOfAxiom])
+
+        self.assertEqual(
+            {OWLClassAssertionAxiom, OWLSubClassOfAxiom},
+            {type(axiom) for axiom in ontology.axioms})
+        self.assertEqual(2, len(ontology.axioms))
+
+    def test_parse_file_include_no_axiom_type(self):
+        with self.assertRaises(RuntimeError):
+            self.parser_cls().parse_file(self.file_path, include=[OWLClass])
+
+
+class TestCompressedDocuments(_DocumentTestCase):
+    def test_compressed_documents(self):
+        expected = self.parser_cls().parse_file(self.file_path)
+
+        for compress in [gzip.compress, bz2.compress, lzma.compress]:
+            with open(self.file_path, 'wb') as ontology_file:
+                ontology_file.write(
+                    compress(streamed_document.encode('utf-8')))
+
+            parser = self.parser_cls()
+            ontology = parser.parse_file(self.file_path)
+
+            self.assertEqual(expected.iri, ontology.iri)
+            self.assertEqual(expected.imports, ontology.imports)
+            self.assertEqual(4, len(ontology.axioms))
+            self.assertEqual(expected.axioms, ontology.axioms)
+
+            # compressed documents are parsed in a single process
+            self.assertEqual(
+                4, len(parser.parse_file(self.file_path, workers=2).axioms))
+            self.assertEqual(
+                expected.version_iri,
+                parser.scan_header(self.file_path).version_iri)
+
+            with parser.iter_axioms(self.file_path) as stream:
+                self.assertEqual(expected.prefixes, stream.prefixes)
+                self.assertEqual(4, len(list(stream)))
+
+
+class TestParseStream(_DocumentTestCase):
+    def test_parse_stream(self):
+        expected = self.parser_cls().parse_file(self.file_path)
+        document = streamed_document.encode('utf-8')
+
+        # tokens and elements are split across the chunk boundaries
+        for stream, chunk_size in [
+                (io.BytesIO(document), 7),
+                (io.BytesIO(document), 1 << 20),
+                (io.StringIO(streamed_document), 5)]:
+            ontology = self.parser_cls().parse_stream(stream, chunk_size)
+
+            self.assertEqual(expected.iri, ontology.iri)
+            self.assertEqual(expected.prefixes, ontology.prefixes)
+            self.assertEqual(expected.annotations, ontology.annotations)
+            self.assertEqual(4, len(ontology.axioms))
+            self.assertEqual(expected.axioms, ontology.axioms)
+
+    def test_parse_stream_from_pipe(self):
+        read_fd, write_fd = os.pipe()
+        document = streamed_document.encode('utf-8')
+
+        def write():
+            with os.fdopen(write_fd, 'wb', buffering=0) as pipe:
+                for i in range(0, len(document), 16):
+                    pipe.write(document[i:i + 16])
+
+        with ThreadPoolExecutor(1) as executor:
+            executor.submit(write)
+
+            with os.fdopen(read_fd, 'rb', buffering=0) as pipe:
+                ontology = self.parser_cls().parse_stream(
+                    pipe, 64, include=[OWLClassAssertionAxiom])
+
+        self.assertEqual(
+            {OWLClassAssertionAxiom(
+                OWLNamedIndividual('http://example.com/ont#indiv1'),
+                OWLClass('http://example.com/ont#Cls1'))},
+            ontology.axioms)
+
+
+class TestLazyLiterals(_DocumentTestCase):
+    def test_lazy_literals(self):
+        eager = self.parser_cls().parse_file(self.file_path)
+
+        for workers in [None, 2]:
+            with mock.patch(
+                    'morelianoctua.parsing.functional._min_batch_size', 1):
+                lazy = self.parser_cls(lazy_literals=True).parse_file(
+                    self.file_path, workers)
+
+            axioms = {type(axiom): axiom for axiom in lazy.axioms}
+            literal = axioms[OWLDataPropertyAssertionAxiom].value
+
+            self.assertIsInstance(literal, LazyLiteral)
+            self.assertEqual(23, literal.value)
+            self.assertEqual(eager.axioms, lazy.axioms)
+
+
+class TestParseMany(_DocumentTestCase):
+    def test_parse_many(self):
+        paths = [
+            self._temp_document(streamed_document) for _ in range(5)]
+        expected = self.parser_cls().parse_file(self.file_path)
+
+        for workers in [None, 2]:
+            ontologies = dict(
+                self.parser_cls().parse_many(iter(paths), workers))
+
+            self.assertEqual(set(paths), set(ontologies))
+
+            for ontology in ontologies.values():
+                self.assertEqual(expected.iri, ontology.iri)
+                self.assertEqual(expected.imports, ontology.imports)
+                self.assertEqual(expected.axioms, ontology.axioms)
+
+        # the entities are shared across the documents
+        first, second = [
+            {type(axiom): axiom for axiom in ontology.axioms}
+            for _, ontology in self.parser_cls().parse_many(paths[:2])]
+
+        self.assertIs(
+            first[OWLClassAssertionAxiom].class_expression,
+            second[OWLClassAssertionAxiom].class_expression)
+
+
+class TestIndexFile(_DocumentTestCase):
+    def test_index_file(self):
+        parser = self.parser_cls()
+        index = parser.index_file(self.file_path)
+        index_path = f'{self.file_path}.index'
+        self.addCleanup(os.remove, index_path)
+
+        self.assertEqual(4, len(index))
+        self.assertEqual(
+            len(index), len(load_index(index_path, self.file_path)))
+
+        axioms = parser.load_axioms_at(self.file_path, index.offsets)
+        self.assertEqual(
+            [OWLClassDeclarationAxiom, OWLSubClassOfAxiom,
+             OWLClassAssertionAxiom, OWLDataPropertyAssertionAxiom],
+            [type(axiom) for axiom in axioms])
+
+        self.assertEqual(
+            [2, 3], index.ordinals_of('http://example.com/ont#indiv1'))
+        self.assertEqual(
+            [0, 1, 2], index.ordinals_of('http://example.com/ont#Cls1'))
+        self.assertEqual(
+            [1], index.ordinals_of('http://example.com/ont#Cls2'))
+        self.assertEqual(
+            [], index.ordinals_of('http://example.com/ont#Cls3'))
+
+        self.assertEqual(
+            {OWLClassAssertionAxiom(
+                OWLNamedIndividual('http://example.com/ont#indiv1'),
+                OWLClass('http://example.com/ont#Cls1')),
+             OWLDataPropertyAssertionAxiom(
+                 OWLNamedIndividual('http://example.com/ont#indiv1'),
+                 OWLDataProperty('http://example.com/ont#dataProp1'),
+                 Literal('23', None, XSD.int))},
+            set(parser.load_axioms_at(
+                self.file_path,
+                index.offsets_of('http://example.com/ont#indiv1'))))
+
+        with self.assertRaises(RuntimeError):
+            parser.load_axioms_at(self.file_path, [index.offsets[1] - 1])
+
+
+class TestReparseDocument(_DocumentTestCase):
+    def test_reparse_document(self):
+        parser = self.parser_cls()
+        document = parser.parse_document(self.file_path)
+
+        self.assertEqual(4, len(document.ontology.axioms))
+        self.assertEqual(
+            [OWLClassDeclarationAxiom, OWLSubClassOfAxiom,
+             OWLClassAssertionAxiom, OWLDataPropertyAssertionAxiom],
+            [type(span.axiom) for span in document.spans])
+
+        self._edit_document(streamed_document.replace(
+            'ClassAssertion(ex:Cls1 ex:indiv1)',
+            'ClassAssertion(ex:Cls2 ex:indiv1)'))
+
+        with mock.patch.object(
+                self.parser_cls, '_parse_axiom_element',
+                autospec=True,
+                side_effect=self.parser_cls._parse_axiom_element) as parse:
+            new_document, diff = parser.reparse_document(
+                document, self.file_path)
+
+        # only the edited axiom is parsed again
+        self.assertEqual(1, parse.call_count)
+        self.assertEqual(
+            {OWLClassAssertionAxiom(
+                OWLNamedIndividual('http://example.com/ont#indiv1'),
+                OWLClass('http://example.com/ont#Cls2'))},
+            diff.added)
+        self.assertEqual(
+            {OWLClassAssertionAxiom(
+                OWLNamedIndividual('http://example.com/ont#indiv1'),
+                OWLClass('http://example.com/ont#Cls1'))},
+            diff.removed)
+        self.assertEqual(4, len(new_document.ontology.axioms))
+        self.assertIs(document.spans[0].axiom, new_document.spans[0].axiom)
+
+        # reformatting an axiom doesn't change the ontology
+        self._edit_document(streamed_document.replace(
+            'ClassAssertion(ex:Cls1 ex:indiv1)',
+            'ClassAssertion( ex:Cls1  ex:indiv1 )'))
+
+        _, diff = parser.reparse_document(new_document, self.file_path)
+        self.assertEqual(
+            {OWLClassAssertionAxiom(
+                OWLNamedIndividual('http://example.com/ont#indiv1'),
+                OWLClass('http://example.com/ont#Cls1'))},
+            diff.added)
+        self.assertEqual(
+            {OWLClassAssertionAxiom(
+                OWLNamedIndividual('http://example.com/ont#indiv1'),
+                OWLClass('http://example.com/ont#Cls2'))},
+            diff.removed)
+
+    def test_reparse_document_twice(self):
+        parser = self.parser_cls()
+        document = parser.parse_document(self.file_path)
+        entities = dict(document.entities)
+
+        self._edit_document(streamed_document.replace(
+            'ClassAssertion(ex:Cls1 ex:indiv1)',
+            'ClassAssertion(ex:Cls3 ex:indiv1)'))
+
+        _, diff = parser.reparse_document(document, self.file_path)
+        _, repeated_diff = parser.reparse_document(document, self.file_path)
+
+        # the previous document isn't changed by reparsing it
+        self.assertEqual(entities, document.entities)
+        self.assertEqual(diff.added, repeated_diff.added)
+        self.assertEqual(diff.removed, repeated_diff.removed)
+
+    def test_reparse_document_with_changed_prefixes(self):
+        parser = self.parser_cls()
+        document = parser.parse_document(self.file_path)
+
+        self._edit_document(streamed_document.replace(
+            'Prefix(ex:=<http://example.com/ont#>)',
+            'Prefix(ex:=<http://example.com/other#>)'))
+
+        new_document, diff = parser.reparse_document(
+            document, self.file_path)
+
+        self.assertEqual(new_document.ontology.axioms, diff.added)
+        self.assertEqual(document.ontology.axioms, diff.removed)
+
+        _, diff = parser.reparse_document(new_document, self.file_path)
+        self.assertTrue(diff.is_empty())
+
+
+class TestDataFactory(_DocumentTestCase):
+    def test_parse_file_with_data_factory(self):
+        data_factory = OWLDataFactory()
+        parser = self.parser_cls(data_factory=data_factory)
+        super_class = data_factory.get(
+            OWLObjectSomeValuesFrom,
+            data_factory.entity(
+                OWLObjectProperty, 'http://example.com/ont#objProp1'),
+            data_factory.entity(OWLClass, 'http://example.com/ont#Cls2'))
+
+        sub_class_of_axioms = [
+            axiom
+            for _ in range(2)
+            for axiom in parser.parse_file(self.file_path).axioms
+            if isinstance(axiom, OWLSubClassOfAxiom)]
+
+        self.assertEqual(2, len(sub_class_of_axioms))
+
+        for axiom in sub_class_of_axioms:
+            self.assertIs(super_class, axiom.super_class)
+            self.assertIs(
+                data_factory.entity(OWLClass, 'http://example.com/ont#Cls1'),
+                axiom.sub_class)
+
+    def test_parse_many_with_data_factory(self):
+        data_factory = OWLDataFactory()
+        parser = self.parser_cls(data_factory=data_factory)
+        cls1 = data_factory.entity(OWLClass, 'http://example.com/ont#Cls1')
+
+        for _, ontology in parser.parse_many([self.file_path] * 2):
+            axioms = {type(axiom): axiom for axiom in ontology.axioms}
+
+            self.assertIs(
+                cls1, axioms[OWLClassAssertionAxiom].class_expression)
+            self.assertIs(cls1, axioms[OWLSubClassOfAxiom].sub_class)
+
+
+class TestFunctionalSyntaxGrammar(unittest.TestCase):
+    def test_contexts_are_per_thread(self):
+        parser = FunctionalSyntaxParser(prefixes={'ex': 'http://example.com#'})
+        other_parser = FunctionalSyntaxParser(
+            prefixes={'ex': 'http://example.org#'})
+        context = parser._begin_document({})
+
+        with parser._parsing(context) as grammar:
+            # a parse in another thread isn't blocked by the one running
+            with ThreadPoolExecutor(1) as executor:
+                future = executor.submit(
+                    other_parser.class_.parseString, 'ex:Cls')
+                cls = future.result(timeout=10)[0]
+
+            self.assertIs(context, grammar.context)
+
+        self.assertEqual(OWLClass('http://example.org#Cls'), cls)
+        self.assertIsNone(grammar.context)
+
+    def test_parse_actions_take_fixed_arguments(self):
+        grammar = FunctionalSyntaxParser()._grammar()
+
+        # pyparsing detects the arguments on the first call of an action,
+        # which isn't thread-safe
+        for element in vars(grammar).values():
+            if isinstance(element, ParserElement):
+                self.assertTrue(element.streamlined)
+                for action in element.parseAction:
+                    self.assertNotEqual('wrapper', action.__code__.co_name)
+
+
+class TestPackratParsing(_DocumentTestCase):
+    def test_packrat_parsing(self):
+        parser = FunctionalSyntaxParser(
+            prefixes={
+                OWLOntology.default_prefix_dummy: 'http://example.com/ont#',
+                'ex': 'http://example.com/ont#'},
+            packrat_cache_size=64)
+
+        with mock.patch.object(
+                _PackratCache, 'set', autospec=True,
+                side_effect=_PackratCache.set) as cache_set:
+            axiom = parser.axiom.parseString(
+                'SubClassOf(ex:Cls1 ObjectIntersectionOf(ex:Cls2 '
+                'ObjectSomeValuesFrom(ex:prop ex:Cls3)))')[0]
+
+        self.assertEqual(
+            OWLSubClassOfAxiom(
+                OWLClass('http://example.com/ont#Cls1'),
+                OWLObjectIntersectionOf(
+                    OWLClass('http://example.com/ont#Cls2'),
+                    OWLObjectSomeValuesFrom(
+                        OWLObjectProperty('http://example.com/ont#prop'),
+                        OWLClass('http://example.com/ont#Cls3')))),
+            axiom)
+        self.assertGreater(cache_set.call_count, 0)
+        # pyparsing's process-wide packrat parsing isn't used
+        self.assertFalse(ParserElement._packratEnabled)
+
+        ontology = parser.parse_file(self.file_path)
+        self.assertEqual(URIRef('http://example.com/ont'), ontology.iri)
+        self.assertEqual(4, len(ontology.axioms))
+
+    def test_other_parsers_arent_memoized(self):
+        FunctionalSyntaxParser(packrat_cache_size=64).parse_file(
+            self.file_path)
+
+        with mock.patch.object(_PackratCache, 'set') as cache_set:
+            ontology = FunctionalSyntaxParser().parse_file(self.file_path)
+
+        cache_set.assert_not_called()
+        self.assertEqual(4, len(ontology.axioms))
+
+    def test_packrat_cache_size(self):
+        cache = _PackratCache(2)
+        for key in range(3):
+            cache.set(key, (key, None))
+
+        self.assertIsNone(cache.get(0))
+        self.assertEqual((2, None), cache.get(2))
+
+        # each parser keeps the size it asked for
+        for size in [2, 8]:
+            context = FunctionalSyntaxParser(
+                packrat_cache_size=size)._begin_document({})
+            self.assertEqual(size, context.packrat_cache._size)
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+from rdflib import URIRef
+
+from morelianoctua.parsing.index import AxiomIndex, load_index
+
+
+class TestAxiomIndex(unittest.TestCase):
+    def setUp(self):
+        fd, self.file_path = tempfile.mkstemp(suffix='.ofn')
+
+        with os.fdopen(fd, 'w') as document_file:
+            document_file.write('Ontology()\n')
+
+        self.index_path = f'{self.file_path}.index'
+
+        stat = os.stat(self.file_path)
+        self.index = AxiomIndex(stat.st_size, stat.st_mtime_ns)
+        self.index.add(10, {URIRef('http://example.com#a')})
+        self.index.add(20, set())
+        self.index.add(30, {URIRef('http://example.com#a'),
+                            URIRef('http://example.com#b')})
+
+    def tearDown(self):
+        for path in [self.file_path, self.index_path]:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_lookup(self):
+        self.assertEqual(3, len(self.index))
+        self.assertEqual(
+            [0, 2], self.index.ordinals_of('http://example.com#a'))
+        self.assertEqual(
+            [30], self.index.offsets_of(URIRef('http://example.com#b')))
+        self.assertEqual([], self.index.offsets_of('http://example.com#c'))
+
+    def test_save_and_load(self):
+        self.index.save(self.index_path)
+        index = load_index(self.index_path, self.file_path)
+
+        self.assertEqual(list(self.index.offsets), list(index.offsets))
+        self.assertEqual(
+            [10, 30], index.offsets_of('http://example.com#a'))
+
+    def test_unusable_index(self):
+        self.assertIsNone(load_index(self.index_path))
+
+        with open(self.index_path, 'wb') as index_file:
+            index_file.write(b'broken')
+
+        self.assertIsNone(load_index(self.index_path))
+
+        self.index.save(self.index_path)
+
+        with open(self.file_path, 'a') as document_file:
+            document_file.write('# changed\n')
+
+        self.assertIsNotNone(load_index(self.index_path))
+        self.assertIsNone(load_index(self.index_path, self.file_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from rdflib import URIRef
+
+from morelianoctua.model.axioms.classaxiom import OWLSubClassOfAxiom
+from morelianoctua.model.objects.classexpression import OWLClass
+from morelianoctua.parsing.fastfunctional import FastFunctionalSyntaxParser
+from morelianoctua.parsing.functional import FunctionalSyntaxParser
+from morelianoctua.parsing.manager import OWLOntologyManager
+
+documents = {
+    'root': ['http://example.com/a', 'http://example.com/b'],
+    'a': ['http://example.com/c'],
+    'b': ['http://example.com/c/1.0'],
+    'c': ['http://example.com/root'],
+}
+
+
+def _document(name, imports):
+    import_declarations = ''.join(f'Import(<{iri}>)\n' for iri in imports)
+    version_iri = ' <http://example.com/c/1.0>' if name == 'c' else ''
+
+    return f'Prefix(:=<http://example.com/{name}#>)\n' \
+        f'Ontology(<http://example.com/{name}>{version_iri}\n' \
+        f'{import_declarations}' \
+        f'SubClassOf(:Sub :Super)\n' \
+        f')\n'
+
+
+class _CountingParser(FunctionalSyntaxParser):
+    parsed_files = []
+
+    def parse_file(self, file_path, *args, **kwargs):
+        _CountingParser.parsed_files.append(os.path.basename(file_path))
+
+        return super().parse_file(file_path, *args, **kwargs)
+
+
+class TestOWLOntologyManager(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.catalog = {}
+
+        for name, imports in documents.items():
+            file_path = os.path.join(self.dir, f'{name}.ofn')
+
+            with open(file_path, 'w') as document_file:
+                document_file.write(_document(name, imports))
+
+            self.catalog[f'http://example.com/{name}'] = file_path
+
+        _CountingParser.parsed_files = []
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _path(self, name):
+        return os.path.join(self.dir, f'{name}.ofn')
+
+    def _check_closure(self, manager):
+        root = manager.load_ontology(self._path('root'))
+        closure = manager.imports_closure(root)
+
+        self.assertEqual(
+            [URIRef(f'http://example.com/{name}')
+             for name in ['root', 'a', 'b', 'c']],
+            [ontology.iri for ontology in closure])
+
+        for ontology in closure:
+            self.assertEqual(
+                {OWLSubClassOfAxiom(
+                    OWLClass(f'{ontology.iri}#Sub'),
+                    OWLClass(f'{ontology.iri}#Super'))},
+                ontology.axioms)
+
+    def test_load_import_closure(self):
+        manager = OWLOntologyManager(self.catalog)
+
+        self._check_closure(manager)
+        self.assertIs(
+            manager.get_ontology('http://example.com/c'),
+            manager.get_ontology('http://example.com/c/1.0'))
+
+    def test_load_import_closure_with_workers(self):
+        for parser_cls in [FunctionalSyntaxParser, FastFunctionalSyntaxParser]:
+            manager = OWLOntologyManager(
+                self.catalog, parser_cls=parser_cls, workers=2)
+
+            self._check_closure(manager)
+
+    def test_shared_imports_are_parsed_once(self):
+        manager = OWLOntologyManager(self.catalog, parser_cls=_CountingParser)
+
+        root = manager.load_ontology(self._path('root'))
+
+        self.assertEqual(
+            ['a.ofn', 'b.ofn', 'c.ofn', 'root.ofn'],
+            sorted(_CountingParser.parsed_files))
+
+        # later loads reuse the ontologies already loaded
+        self.assertIs(
+            manager.get_ontology('http://example.com/a'),
+            manager.load_ontology(self._path('a')))
+        self.assertIs(
+            root, manager.load_ontology_from_iri('http://example.com/root'))
+        self.assertEqual(4, len(_CountingParser.parsed_files))
+
+    def test_imports_of_loaded_documents(self):
+        # c imports root, which isn't in the catalog, but was loaded before
+        manager = OWLOntologyManager(
+            {'http://example.com/a': self._path('a'),
+             'http://example.com/b': self._path('b'),
+             'http://example.com/c': self._path('c')})
+
+        root = manager.load_ontology(self._path('root'))
+
+        self.assertEqual(4, len(manager.imports_closure(root)))
+
+    def test_unresolved_import(self):
+        manager = OWLOntologyManager(
+            {'http://example.com/c': self._path('c')})
+
+        with self.assertRaises(RuntimeError):
+            manager.load_ontology(self._path('a'))
+
+        self.assertIsNone(manager.get_ontology('http://example.com/a'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+
+from morelianoctua.model.axioms.classaxiom import OWLSubClassOfAxiom
+from morelianoctua.parsing.functional import FunctionalSyntaxParser, \
+    _shared_grammar
+from morelianoctua.parsing.profiler import ParseProfiler
+
+document = """Prefix(:=<http://example.com/ont#>)
+Prefix(xsd:=<http://www.w3.org/2001/XMLSchema#>)
+
+Ontology(<http://example.com/ont>
+SubClassOf(:Cls1 ObjectSomeValuesFrom(:objProp1 :Cls2))
+SubClassOf(:Cls2 ObjectIntersectionOf(:Cls3 :Cls4))
+DataPropertyAssertion(:dataProp1 :indiv1 "23"^^xsd:int)
+)
+"""
+
+
+class TestParseProfiler(unittest.TestCase):
+    def setUp(self):
+        fd, self.file_path = tempfile.mkstemp(suffix='.ofn')
+
+        with os.fdopen(fd, 'w') as ontology_file:
+            ontology_file.write(document)
+
+    def tearDown(self):
+        os.remove(self.file_path)
+
+    def test_rules(self):
+        profiler = ParseProfiler()
+        ontology = FunctionalSyntaxParser(profiler=profiler).parse_file(
+            self.file_path)
+
+        self.assertEqual(3, len(ontology.axioms))
+
+        sub_class_of = profiler.rules['sub_class_of']
+        self.assertEqual(2, sub_class_of.successes)
+        self.assertEqual(
+            sub_class_of.calls,
+            sub_class_of.successes + sub_class_of.failures)
+
+        # the alternatives of class expressions are tried one after another
+        class_ = profiler.rules['class_']
+        self.assertGreater(class_.failures, 0)
+        self.assertGreater(class_.successes, 0)
+
+        ontology_document = profiler.rules['ontology_document']
+        self.assertEqual(1, ontology_document.calls)
+        self.assertGreaterEqual(
+            ontology_document.cumulative_time,
+            sub_class_of.cumulative_time)
+
+        for stats in profiler.rules.values():
+            self.assertGreaterEqual(stats.own_time, 0)
+            self.assertGreaterEqual(
+                stats.cumulative_time + 1e-9, stats.own_time)
+
+    def test_actions(self):
+        profiler = ParseProfiler()
+        FunctionalSyntaxParser(profiler=profiler).parse_file(self.file_path)
+
+        self.assertEqual(
+            1, profiler.actions['literal: _create_literal'].calls)
+        self.assertEqual(
+            2, profiler.actions[
+                'sub_class_of: _create_sub_cls_of_axiom'].calls)
+
+    def test_report(self):
+        profiler = ParseProfiler()
+        FunctionalSyntaxParser(profiler=profiler).parse_file(self.file_path)
+        report = profiler.report()
+
+        self.assertIn('sub_class_of: _create_sub_cls_of_axiom', report)
+        self.assertIn('ontology_document', report)
+
+        # 2 tables of 5 lines with headers and a separating line
+        self.assertEqual(13, len(profiler.report(limit=5).splitlines()))
+
+    def test_bound_elements(self):
+        profiler = ParseProfiler()
+        parser = FunctionalSyntaxParser(
+            prefixes={'DEFAULT': 'http://example.com/ont#'},
+            profiler=profiler)
+
+        axiom = parser.axiom.parseString('SubClassOf(:Cls1 :Cls2)')[0]
+
+        self.assertIsInstance(axiom, OWLSubClassOfAxiom)
+        self.assertEqual(1, profiler.rules['sub_class_of'].successes)
+
+    def test_shared_grammar_not_profiled(self):
+        FunctionalSyntaxParser(profiler=ParseProfiler()).parse_file(
+            self.file_path)
+        grammar = _shared_grammar()
+
+        self.assertFalse(grammar.class_expression.debug)
+        self.assertFalse(grammar.sub_class_of.debug)
@@ -0,0 +1,96 @@
+import io
+import mmap
+import unittest
+
+from morelianoctua.parsing.scanner import iter_elements, iter_buffer_elements
+
+document = '''# leading comment
+Prefix(:=<http://example.com/ont#>)
+Prefix(ex:=<http://example.com/ont#>)
+
+Ontology(<http://example.com/ont>
+    <http://example.com/ont/1.0>
+Import(<http://example.com/other>)
+Annotation(rdfs:comment "not ) a ( paren # nor a comment")
+# SubClassOf(ex:Commented ex:Out)
+SubClassOf(ex:Cls1 ObjectSomeValuesFrom(ex:p <http://ex.com/(x)>))
+ClassAssertion ( ex:Cls1 ex:indiv1 ) # trailing comment
+DataPropertyAssertion(ex:p ex:indiv1 "esc \\\\\\" ) aped"@en)
+DataPropertyAssertion(ex:p ex:indiv1 "Grüße")
+)
+'''
+
+
+class TestScanner(unittest.TestCase):
+    def _elements(self, chunk_size):
+        return list(iter_elements(
+            io.BytesIO(document.encode('utf-8')), chunk_size))
+
+    def test_elements(self):
+        elements = self._elements(1 << 20)
+
+        self.assertEqual(
+            [('Prefix', 0), ('Prefix', 0), ('Ontology', 0), (None, 1),
+             (None, 1), ('Import', 1), ('Annotation', 1), ('SubClassOf', 1),
+             ('ClassAssertion', 1), ('DataPropertyAssertion', 1),
+             ('DataPropertyAssertion', 1)],
+            [(e.keyword, e.depth) for e in elements])
+
+        self.assertEqual(b'<http://example.com/ont/1.0>', elements[4].text)
+        self.assertEqual(
+            b'SubClassOf(ex:Cls1 ObjectSomeValuesFrom(ex:p '
+            b'<http://ex.com/(x)>))',
+            elements[7].text)
+        self.assertEqual(
+            b'ClassAssertion ( ex:Cls1 ex:indiv1 )', elements[8].text)
+
+        # offsets are byte offsets into the document
+        encoded = document.encode('utf-8')
+        for element in elements:
+            if element.keyword != 'Ontology':
+                self.assertEqual(
+                    element.text, encoded[element.start:element.end])
+
+    def test_small_chunks(self):
+        expected = self._elements(1 << 20)
+
+        for chunk_size in [1, 2, 3, 7, 64]:
+            self.assertEqual(expected, self._elements(chunk_size))
+
+    def test_buffer(self):
+        encoded = document.encode('utf-8')
+
+        self.assertEqual(
+            self._elements(1 << 20), list(iter_buffer_elements(encoded)))
+
+        with mmap.mmap(-1, len(encoded)) as buffer:
+            buffer.write(encoded)
+            self.assertEqual(
+                self._elements(1 << 20), list(iter_buffer_elements(buffer)))
+
+        with self.assertRaises(RuntimeError):
+            list(iter_buffer_elements(b'Ontology(SubClassOf(ex:A ex:B)'))
+
+    def test_unbalanced(self):
+        with self.assertRaises(RuntimeError):
+            list(iter_elements(io.BytesIO(b'Ontology(SubClassOf(ex:A ex:B)')))
+
+        with self.assertRaises(RuntimeError):
+            list(iter_elements(io.BytesIO(b'Ontology() ex:A)')))
+
+    def test_in_ontology(self):
+        document = b'Ontology(<http://ex.com/ont>\nex:A SubClassOf(ex:A ex:B))'
+        offset = document.index(b'SubClassOf') - 5
+        elements = list(iter_elements(
+            io.BytesIO(document[offset:-1]), in_ontology=True, offset=offset))
+
+        self.assertEqual(
+            [(None, b'ex:A'), ('SubClassOf', b'SubClassOf(ex:A ex:B)')],
+            [(element.keyword, element.text) for element in elements])
+        self.assertEqual(
+            document.index(b'SubClassOf'), elements[1].start)
+        self.assertEqual(len(document) - 1, elements[1].end)
+
+        with self.assertRaises(RuntimeError):
+            list(iter_elements(
+                io.BytesIO(b'SubClassOf(ex:A ex:B))'), in_ontology=True))